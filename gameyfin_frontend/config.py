@@ -18,8 +18,28 @@ FIXED_TAB_COUNT = 4
 # Download chunk size for streaming (128 KB)
 DOWNLOAD_CHUNK_SIZE = 131072
 
-# Progress signal interval (seconds)
-PROGRESS_SIGNAL_INTERVAL = 0.1
+# Downloaded chunks read ahead of extraction, so the network is not idle while files are written
+DOWNLOAD_READ_AHEAD_CHUNKS = 8
+
+# Progress signal interval (seconds); also the rate at which download rows repaint,
+# since ticks arriving faster than that would only be coalesced by the row
+PROGRESS_SIGNAL_INTERVAL = 0.25
+
+# Span (seconds) of the sliding window the displayed download speed is averaged over
+SPEED_WINDOW = 5.0
+
+# History rows created at startup and each time the download list is scrolled to its end
+HISTORY_PAGE_SIZE = 50
+
+# Delay (ms) before download history is written, so bursts of changes cost one write
+HISTORY_SAVE_DELAY_MS = 500
+
+# Threads in the shared download pool; downloads beyond this wait for a free thread
+MAX_CONCURRENT_DOWNLOADS = 16
+
+# Size bounds (bytes) for a product_*.json worth parsing; anything outside is a broken extract
+PRODUCT_JSON_MIN_SIZE = 2
+PRODUCT_JSON_MAX_SIZE = 50_000_000
 
 # UI colors (named for maintainability)
 COLOR_STATUS_DOWNLOADING = "#3498DB"
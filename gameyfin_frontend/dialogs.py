@@ -1,37 +1,69 @@
 import logging
 import math
 import os
+import re
 import subprocess
 import sys
 from os import getenv
 from os.path import relpath
-from typing import Any
+from typing import Any, Callable
 
-from PyQt6.QtCore import pyqtSlot, QTimer, Qt
-from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtCore import (
+    pyqtSlot, QTimer, Qt, QThread, QThreadPool, QProcess, QProcessEnvironment,
+    QAbstractListModel, QModelIndex, QEvent, QObject, QStringListModel
+)
+from PyQt6.QtGui import QAction, QIcon, QPainter, QColor
 from PyQt6.QtWidgets import (
     QVBoxLayout, QFormLayout, QCheckBox, QLineEdit, QPushButton, QStyle,
     QHBoxLayout, QWidget, QComboBox, QPlainTextEdit, QDialogButtonBox,
-    QLabel, QInputDialog, QDialog, QMessageBox, QListWidget, QScrollArea
+    QLabel, QInputDialog, QDialog, QMessageBox, QListView, QScrollArea, QCompleter
 )
 
 from gameyfin_frontend.umu_database import UmuDatabase
 from gameyfin_frontend.settings import SettingsManager
-from gameyfin_frontend.utils import parse_desktop_file
 from gameyfin_frontend.config import DEFAULT_PROTON, UMU_RUN_CMD
+from gameyfin_frontend.workers import DesktopNameSignals, DesktopNameWorker, UmuSearchSignals, UmuSearchWorker
 
 logger = logging.getLogger(__name__)
 
+# Snapshot of the system environment, taken on first use by _base_process_env()
+_BASE_PROCESS_ENV: QProcessEnvironment | None = None
+
+# Store list used when no settings are available or the setting is unset
+_DEFAULT_STORES = ["none", "gog", "amazon", "battlenet", "ea", "egs",
+                   "humble", "itchio", "steam", "ubisoft", "zoomplatform"]
+
+# Keys edited through dedicated widgets rather than the extra variables box
+_INSTALL_CONFIG_KEYS = frozenset(
+    ("PROTON_ENABLE_WAYLAND", "MANGOHUD", "GAMEID", "STORE", "PROTON_USE_WOW64", "PROTONPATH")
+)
+
+# One KEY=VALUE line of the extra variables box, with surrounding blanks trimmed.
+# Lines starting with "#" and blank keys never match.
+_EXTRA_VAR_RE = re.compile(r'^[ \t]*([^=\s#][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$', re.MULTILINE)
+
+
+def _base_process_env() -> QProcessEnvironment:
+    """Return a copy of the system environment snapshot for launching wine tools."""
+    global _BASE_PROCESS_ENV
+    if _BASE_PROCESS_ENV is None:
+        _BASE_PROCESS_ENV = QProcessEnvironment.systemEnvironment()
+    return QProcessEnvironment(_BASE_PROCESS_ENV)
+
 
 class InstallConfigDialog(QDialog):
     """
     A dialog to configure environment variables before installation.
     """
 
-    def __init__(self, umu_database: UmuDatabase, parent: QWidget | None = None,
+    # Icon of the GAMEID search action, shared by all instances
+    _search_icon: QIcon | None = None
+
+    def __init__(self, umu_database: UmuDatabase | None = None, parent: QWidget | None = None,
                  default_game_id: str = "umu-default", default_store: str = "none",
                  wine_prefix_path: str | None = None, initial_config: dict[str, Any] | None = None,
-                 settings: SettingsManager | None = None):
+                 settings: SettingsManager | None = None,
+                 db_provider: Callable[[], UmuDatabase] | None = None):
         """Configure UMU installation environment variables (protonfix, Proton path, store, extra env vars).
 
         Args:
@@ -42,11 +74,25 @@ class InstallConfigDialog(QDialog):
             wine_prefix_path: Optional WINE prefix path for wine tools.
             initial_config: Optional dict to pre-populate fields from a prior install.
             settings: SettingsManager instance providing app configuration.
+            db_provider: Optional callable returning the UmuDatabase; it is only called
+                on the first search or the first focus of the GAMEID field. Takes
+                precedence over umu_database.
         """
         super().__init__(parent)
-        self.umu_database = umu_database
+        self._db_provider = db_provider if db_provider is not None else (lambda: umu_database)
+        self._umu_database: UmuDatabase | None = None
         self.wine_prefix_path = wine_prefix_path
         self.settings = settings
+        self._prefix_ensured = False
+        self._proton_path: str | None = None
+        self._search_title = ""
+        self._search_signals: UmuSearchSignals | None = None
+        # Title completer model, built on first focus of the GAMEID field
+        self._title_model: QStringListModel | None = None
+        self._gameid_before_completion = ""
+        # Extra variables as loaded, and their text form, so an unedited box needn't be re-parsed
+        self._extra_vars: dict[str, str] = {}
+        self._extra_vars_text = ""
         self.setWindowTitle("Installation Configuration")
         self.setMinimumWidth(400)
 
@@ -60,20 +106,13 @@ class InstallConfigDialog(QDialog):
         self.gameid_input = QLineEdit()
         self.gameid_input.setText(default_game_id)
 
-        self.search_button = QPushButton()
-        icon = self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogContentsView)
-        self.search_button.setIcon(icon)
-        self.search_button.setToolTip("Search for game by name")
-
-        button_size = self.gameid_input.sizeHint().height()
-        self.search_button.setFixedSize(button_size, button_size)
-
-        self.gameid_layout = QHBoxLayout()
-        self.gameid_layout.setContentsMargins(0, 0, 0, 0)
-        self.gameid_layout.addWidget(self.gameid_input)
-        self.gameid_layout.addWidget(self.search_button)
-        self.gameid_widget = QWidget()
-        self.gameid_widget.setLayout(self.gameid_layout)
+        cls = type(self)
+        if cls._search_icon is None:
+            cls._search_icon = self.style().standardIcon(QStyle.StandardPixmap.SP_FileDialogContentsView)
+        self.search_action = QAction(cls._search_icon, "Search", self)
+        self.search_action.setToolTip("Search for game by name")
+        self.gameid_input.addAction(self.search_action, QLineEdit.ActionPosition.TrailingPosition)
+        self.gameid_input.installEventFilter(self)
 
         self.protonpath_input = QLineEdit()
         if self.settings:
@@ -83,10 +122,9 @@ class InstallConfigDialog(QDialog):
 
         self.store_combo = QComboBox()
         if self.settings:
-            stores = self.settings.get("GF_UMU_DB_STORES", ["none", "gog", "amazon", "battlenet", "ea", "egs",
-                                                           "humble", "itchio", "steam", "ubisoft", "zoomplatform"])
+            stores = self.settings.get("GF_UMU_DB_STORES", _DEFAULT_STORES)
         else:
-            stores = ["none", "gog", "amazon", "battlenet", "ea", "egs", "humble", "itchio", "steam", "ubisoft", "zoomplatform"]
+            stores = _DEFAULT_STORES
         self.store_combo.addItems(stores)
         self.store_combo.setCurrentText(default_store)
 
@@ -113,12 +151,12 @@ class InstallConfigDialog(QDialog):
             if "PROTONPATH" in initial_config:
                 self.protonpath_input.setText(initial_config["PROTONPATH"])
 
-            # Populate extra vars
-            extra_lines = []
-            for k, v in initial_config.items():
-                if k not in ["PROTON_ENABLE_WAYLAND", "MANGOHUD", "GAMEID", "STORE", "PROTON_USE_WOW64", "PROTONPATH"]:
-                    extra_lines.append(f"{k}={v}")
-            self.extra_vars_input.setPlainText("\n".join(extra_lines))
+            # Populate extra vars; parse the shown text so an unedited field yields
+            # exactly what get_config would read back from it
+            self._extra_vars_text = "\n".join(
+                f"{k}={v}" for k, v in initial_config.items() if k not in _INSTALL_CONFIG_KEYS)
+            self._extra_vars = dict(match.groups() for match in _EXTRA_VAR_RE.finditer(self._extra_vars_text))
+            self.extra_vars_input.setPlainText(self._extra_vars_text)
 
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok |
                                       QDialogButtonBox.StandardButton.Cancel)
@@ -129,7 +167,7 @@ class InstallConfigDialog(QDialog):
         main_layout.addWidget(self.mangohud_checkbox)
         main_layout.addWidget(self.wow64_checkbox)
 
-        form_layout.addRow("Umu protonfix:", self.gameid_widget)
+        form_layout.addRow("Umu protonfix:", self.gameid_input)
         form_layout.addRow("Proton Path:", self.protonpath_input)
         form_layout.addRow("Store:", self.store_combo)
         main_layout.addLayout(form_layout)
@@ -161,109 +199,162 @@ class InstallConfigDialog(QDialog):
         self.winecfg_button.clicked.connect(self.run_winecfg)
         self.winetricks_button.clicked.connect(self.run_winetricks)
         self.regedit_button.clicked.connect(self.run_regedit)
-        self.search_button.clicked.connect(self.search_for_game_id)
+        self.search_action.triggered.connect(self.search_for_game_id)
+
+    @property
+    def umu_database(self) -> UmuDatabase:
+        """The UMU database, obtained from the provider the first time it is needed."""
+        if self._umu_database is None:
+            self._umu_database = self._db_provider()
+        return self._umu_database
+
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
+        """Attach the title completer the first time the GAMEID field gains focus."""
+        if obj is self.gameid_input and event.type() == QEvent.Type.FocusIn:
+            self._gameid_before_completion = self.gameid_input.text()
+            self._ensure_title_completer()
+        return super().eventFilter(obj, event)
+
+    def _ensure_title_completer(self) -> None:
+        """Build the title model from the cached UMU titles and attach a completer to gameid_input."""
+        if self._title_model is not None or self.umu_database is None:
+            return
+
+        self._title_model = QStringListModel(self.umu_database.cached_titles(), self)
+        completer = QCompleter(self._title_model, self)
+        completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        # Queued so it runs after the line edit has inserted the chosen title
+        completer.activated[str].connect(self._on_title_completed, Qt.ConnectionType.QueuedConnection)
+        self.gameid_input.setCompleter(completer)
+
+    @pyqtSlot(str)
+    def _on_title_completed(self, title: str) -> None:
+        """Replace the completed title with its umu_id and store, asking when several stores match."""
+        entries = [e for e in self.umu_database.get_cached_games_by_title(title) if e.get("umu_id")]
+
+        selected_entry = None
+        if len(entries) == 1:
+            selected_entry = entries[0]
+        elif entries:
+            dialog = SelectUmuIdDialog(entries, self)
+            if dialog.exec() == QDialog.DialogCode.Accepted:
+                selected_entry = dialog.get_selected_entry()
+
+        if selected_entry is None:
+            self.gameid_input.setText(self._gameid_before_completion)
+            return
+
+        self.gameid_input.setText(selected_entry["umu_id"])
+        self._gameid_before_completion = selected_entry["umu_id"]
+        if selected_entry.get("store"):
+            self.store_combo.setCurrentText(selected_entry["store"])
 
     @pyqtSlot()
     def search_for_game_id(self) -> None:
         """
-        Opens a dialog to search for a game by title, checks ALL stores,
-        and populates the umu_id and store fields from the results.
+        Opens a dialog to search for a game by title and starts the search
+        on the global thread pool. Results are handled by _on_search_results.
         """
         text, ok = QInputDialog.getText(self, "Search UMU", "Enter game title to search:")
         if not ok or not text.strip():
             return
 
-        search_title = text.strip()
-
-        all_results = []
-        try:
-            logger.info("Searching all stores for title: %s...", search_title)
+        self._search_title = text.strip()
+        logger.info("Searching all stores for title: %s...", self._search_title)
 
-            results = self.umu_database.search_by_partial_title(search_title)
+        worker = UmuSearchWorker(self.umu_database, self._search_title)
+        worker.signals.finished.connect(self._on_search_results, Qt.ConnectionType.QueuedConnection)
+        worker.signals.error.connect(self._on_search_error, Qt.ConnectionType.QueuedConnection)
+        # Keep the signals object alive until the queued results are delivered
+        self._search_signals = worker.signals
 
-            processed_list = []
-            if isinstance(results, list):
-                processed_list = results
-            elif isinstance(results, dict) and results.get("umu_id"):
-                processed_list = [results]
+        self.search_action.setEnabled(False)
+        QThreadPool.globalInstance().start(worker)
 
-            for entry in processed_list:
-                if entry.get("umu_id"):
-                    all_results.append(entry)
+    @pyqtSlot(list)
+    def _on_search_results(self, all_results: list) -> None:
+        """Let the user pick one of the search results and populate the umu_id and store fields."""
+        self.search_action.setEnabled(True)
+        self._search_signals = None
 
-            if not all_results:
-                QMessageBox.information(self, "No Results",
-                                        f"No games found matching '{search_title}' in any store.")
-                return
+        if not all_results:
+            QMessageBox.information(self, "No Results",
+                                    f"No games found matching '{self._search_title}' in any store.")
+            return
 
-            selected_entry = None
-            dialog = SelectUmuIdDialog(all_results, self)
-            if dialog.exec() == QDialog.DialogCode.Accepted:
-                selected_entry = dialog.get_selected_entry()
+        selected_entry = None
+        dialog = SelectUmuIdDialog(all_results, self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            selected_entry = dialog.get_selected_entry()
 
-            if selected_entry:
-                umu_id = selected_entry.get("umu_id")
-                store = selected_entry.get("store")
+        if selected_entry:
+            umu_id = selected_entry.get("umu_id")
+            store = selected_entry.get("store")
 
-                if umu_id:
-                    self.gameid_input.setText(umu_id)
-                if store:
-                    self.store_combo.setCurrentText(store)
+            if umu_id:
+                self.gameid_input.setText(umu_id)
+            if store:
+                self.store_combo.setCurrentText(store)
 
-        except (ValueError, KeyError, TypeError, RuntimeError) as e:
-            logger.error("Search error for title '%s': %s", search_title, e)
-            QMessageBox.warning(self, "Search Error", f"An error occurred during search:\n{e}")
+    @pyqtSlot(str)
+    def _on_search_error(self, message: str) -> None:
+        """Re-enable the search button and report a failed search."""
+        self.search_action.setEnabled(True)
+        self._search_signals = None
+        QMessageBox.warning(self, "Search Error", f"An error occurred during search:\n{message}")
 
     @pyqtSlot()
     def run_winecfg(self):
         """Runs winecfg in the correct prefix using umu-run."""
-        if not self.wine_prefix_path:
-            return
-
-        os.makedirs(self.wine_prefix_path, exist_ok=True)
-
-        proton_path = self.settings.get("PROTONPATH", DEFAULT_PROTON) if self.settings else DEFAULT_PROTON
-
-        proc_env = os.environ.copy()
-        proc_env["PROTONPATH"] = proton_path
-        proc_env["WINEPREFIX"] = self.wine_prefix_path
-
-        logger.info("Starting winecfg with PROTONPATH=%s WINEPREFIX=%s", proton_path, self.wine_prefix_path)
-        subprocess.Popen([UMU_RUN_CMD, "winecfg"], env=proc_env, start_new_session=True)
+        self._launch_wine_tool(["winecfg"])
 
     @pyqtSlot()
     def run_winetricks(self):
         """Runs winetricks in the correct prefix using the bundled binary."""
-        if not self.wine_prefix_path:
-            return
+        self._launch_wine_tool(["winetricks", "--gui"])
 
-        os.makedirs(self.wine_prefix_path, exist_ok=True)
+    @pyqtSlot()
+    def run_regedit(self):
+        """Runs regedit in the correct prefix using umu-run."""
+        self._launch_wine_tool(["regedit"])
 
-        proton_path = self.settings.get("PROTONPATH", DEFAULT_PROTON) if self.settings else DEFAULT_PROTON
+    def _ensure_prefix(self) -> None:
+        """Create the WINE prefix directory the first time a wine tool is started."""
+        if not self._prefix_ensured and self.wine_prefix_path:
+            os.makedirs(self.wine_prefix_path, exist_ok=True)
+            self._prefix_ensured = True
 
-        proc_env = os.environ.copy()
-        proc_env["PROTONPATH"] = proton_path
-        proc_env["WINEPREFIX"] = self.wine_prefix_path
+    def _settings_proton_path(self) -> str:
+        """Return the PROTONPATH setting, read once per dialog."""
+        if self._proton_path is None:
+            self._proton_path = self.settings.get("PROTONPATH", DEFAULT_PROTON) if self.settings else DEFAULT_PROTON
+        return self._proton_path
 
-        logger.info("Starting winetricks with PROTONPATH=%s WINEPREFIX=%s", proton_path, self.wine_prefix_path)
-        subprocess.Popen([UMU_RUN_CMD, "winetricks", "--gui"], env=proc_env, start_new_session=True)
+    def _launch_wine_tool(self, arguments: list[str]) -> None:
+        """Start umu-run detached with PROTONPATH and WINEPREFIX set, without a shell.
 
-    @pyqtSlot()
-    def run_regedit(self):
-        """Runs regedit in the correct prefix using umu-run."""
+        Args:
+            arguments: Arguments passed to umu-run (e.g. ["winecfg"]).
+        """
         if not self.wine_prefix_path:
             return
 
-        os.makedirs(self.wine_prefix_path, exist_ok=True)
-
-        proton_path = self.settings.get("PROTONPATH", DEFAULT_PROTON) if self.settings else DEFAULT_PROTON
+        self._ensure_prefix()
+        proton_path = self._settings_proton_path()
 
-        proc_env = os.environ.copy()
-        proc_env["PROTONPATH"] = proton_path
-        proc_env["WINEPREFIX"] = self.wine_prefix_path
+        env = _base_process_env()
+        env.insert("PROTONPATH", proton_path)
+        env.insert("WINEPREFIX", self.wine_prefix_path)
 
-        logger.info("Starting regedit with PROTONPATH=%s WINEPREFIX=%s", proton_path, self.wine_prefix_path)
-        subprocess.Popen([UMU_RUN_CMD, "regedit"], env=proc_env, start_new_session=True)
+        logger.info("Starting %s with PROTONPATH=%s WINEPREFIX=%s", arguments[0], proton_path, self.wine_prefix_path)
+        process = QProcess()
+        process.setProgram(UMU_RUN_CMD)
+        process.setArguments(arguments)
+        process.setProcessEnvironment(env)
+        started, _pid = process.startDetached()
+        if not started:
+            logger.error("Failed to start %s %s", UMU_RUN_CMD, " ".join(arguments))
 
     def get_config(self) -> dict[str, str]:
         """
@@ -285,19 +376,46 @@ class InstallConfigDialog(QDialog):
 
         config["PROTONPATH"] = self.protonpath_input.text().strip()
 
-        extra_vars_text = self.extra_vars_input.toPlainText().strip()
-        if extra_vars_text:
-            for line in extra_vars_text.splitlines():
-                if "=" in line:
-                    parts = line.split("=", 1)
-                    key = parts[0].strip()
-                    value = parts[1].strip()
-                    if key:
-                        config[key] = value
+        extra_vars_text = self.extra_vars_input.toPlainText()
+        if extra_vars_text == self._extra_vars_text:
+            config.update(self._extra_vars)
+        else:
+            config.update(match.groups() for match in _EXTRA_VAR_RE.finditer(extra_vars_text))
 
         return config
 
 
+class _DisplayListModel(QAbstractListModel):
+    """Read-only list model over a Python list, formatting display text on demand.
+
+    Rows that are never painted are never formatted; formatted rows are memoized.
+    """
+
+    def __init__(self, items: list[Any], to_text: Callable[[Any], str], parent: QWidget | None = None):
+        super().__init__(parent)
+        self._items = items
+        self._to_text = to_text
+        self._texts: dict[int, str] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._items)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:  # noqa: ANN401
+        if role != Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        row = index.row()
+        text = self._texts.get(row)
+        if text is None:
+            text = self._texts[row] = self._to_text(self._items[row])
+        return text
+
+    def item_at(self, index: QModelIndex) -> Any:  # noqa: ANN401
+        """Return the underlying item for *index*, or None if it is invalid."""
+        if not index.isValid() or index.row() >= len(self._items):
+            return None
+        return self._items[index.row()]
+
+
 class SelectLauncherDialog(QDialog):
     """
     A dialog to select an executable when multiple are found.
@@ -314,18 +432,15 @@ class SelectLauncherDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Select Launcher")
         self.setMinimumWidth(450)
-        self.exe_map = {}
 
         main_layout = QVBoxLayout(self)
         main_layout.addWidget(QLabel("Multiple executables found. Please select one to launch:"))
 
-        self.list_widget = QListWidget()
-        for full_path in exe_paths:
-            relative_path = relpath(full_path, target_dir)
-            self.exe_map[relative_path] = full_path
-            self.list_widget.addItem(relative_path)
+        self.model = _DisplayListModel(list(exe_paths), self._relative_to(target_dir), self)
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
 
-        main_layout.addWidget(self.list_widget)
+        main_layout.addWidget(self.list_view)
 
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok |
                                       QDialogButtonBox.StandardButton.Cancel)
@@ -333,24 +448,35 @@ class SelectLauncherDialog(QDialog):
         self.ok_button = button_box.button(QDialogButtonBox.StandardButton.Ok)
         self.ok_button.setEnabled(False)
 
-        self.list_widget.currentItemChanged.connect(self.on_selection_changed)
+        self.list_view.selectionModel().currentChanged.connect(self.on_selection_changed)
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
 
         main_layout.addWidget(button_box)
 
-    def on_selection_changed(self, current_item, previous_item):
+    @staticmethod
+    def _relative_to(target_dir: str) -> Callable[[str], str]:
+        """Return a formatter giving paths relative to *target_dir*.
+
+        Paths found by walking *target_dir* already start with it, so the prefix is
+        simply sliced off; anything else falls back to os.path.relpath.
+        """
+        prefix = os.path.join(target_dir, "")
+
+        def to_relative(full_path: str) -> str:
+            if full_path.startswith(prefix):
+                return full_path[len(prefix):]
+            return relpath(full_path, target_dir)
+
+        return to_relative
+
+    def on_selection_changed(self, current: QModelIndex, previous: QModelIndex):
         """Enable the OK button when a launcher item is selected."""
-        self.ok_button.setEnabled(current_item is not None)
+        self.ok_button.setEnabled(current.isValid())
 
     def get_selected_launcher(self) -> str | None:
         """Return the full filesystem path of the selected executable, or None."""
-        item = self.list_widget.currentItem()
-        if not item:
-            return None
-
-        relative_path = item.text()
-        return self.exe_map.get(relative_path)
+        return self.model.item_at(self.list_view.currentIndex())
 
 
 class SelectUmuIdDialog(QDialog):
@@ -373,15 +499,11 @@ class SelectUmuIdDialog(QDialog):
         main_layout = QVBoxLayout(self)
         main_layout.addWidget(QLabel("Multiple game entries found. Please select one:"))
 
-        self.list_widget = QListWidget()
-        for entry in self.results:
-            title = entry.get('title', 'No Title')
-            store = entry.get('store', 'unknown')
-            umu_id = entry.get('umu_id', 'no-id')
-            display_text = f"{title} ({store}) - {umu_id}"
-            self.list_widget.addItem(display_text)
+        self.model = _DisplayListModel(self.results, self._format_entry, self)
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
 
-        main_layout.addWidget(self.list_widget)
+        main_layout.addWidget(self.list_view)
 
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok |
                                       QDialogButtonBox.StandardButton.Cancel)
@@ -389,22 +511,24 @@ class SelectUmuIdDialog(QDialog):
         self.ok_button = button_box.button(QDialogButtonBox.StandardButton.Ok)
         self.ok_button.setEnabled(False)
 
-        self.list_widget.currentItemChanged.connect(self.on_selection_changed)
+        self.list_view.selectionModel().currentChanged.connect(self.on_selection_changed)
         button_box.accepted.connect(self.accept)
         button_box.rejected.connect(self.reject)
 
         main_layout.addWidget(button_box)
 
-    def on_selection_changed(self, current_item, previous_item):
+    @staticmethod
+    def _format_entry(entry: dict[str, Any]) -> str:
+        """Return the list text for a UMU entry: "Title (store) - umu_id"."""
+        return f"{entry.get('title', 'No Title')} ({entry.get('store', 'unknown')}) - {entry.get('umu_id', 'no-id')}"
+
+    def on_selection_changed(self, current: QModelIndex, previous: QModelIndex):
         """Enable the OK button when a UMU entry is selected."""
-        self.ok_button.setEnabled(current_item is not None)
+        self.ok_button.setEnabled(current.isValid())
 
     def get_selected_entry(self) -> dict | None:
         """Return the full dictionary of the selected UMU game entry, or None."""
-        current_row = self.list_widget.currentRow()
-        if current_row < 0 or current_row >= len(self.results):
-            return None
-        return self.results[current_row]
+        return self.model.item_at(self.list_view.currentIndex())
 
 
 class SelectShortcutsDialog(QDialog):
@@ -413,6 +537,9 @@ class SelectShortcutsDialog(QDialog):
     select which ones to create shortcuts for (Desktop vs Application Menu).
     """
 
+    # Below this many files the names are read synchronously; pool overhead isn't worth it
+    _PARALLEL_PARSE_MIN_FILES = 8
+
     def __init__(self, desktop_files: list[str], parent: QWidget | None = None, existing_desktop: list[str] | None = None, existing_apps: list[str] | None = None):
         """Let the user select which .desktop files get shortcuts on the Desktop and in the Application Menu.
 
@@ -443,30 +570,109 @@ class SelectShortcutsDialog(QDialog):
 
         self.desktop_checkboxes = []
         self.apps_checkboxes = []
+        # Sets, since every listed file is looked up in both
+        self._existing_desktop = frozenset(existing_desktop) if existing_desktop is not None else None
+        self._existing_apps = frozenset(existing_apps) if existing_apps is not None else None
+        self._desktop_files = desktop_files
+        self._parsed_names: dict[str, str] = {}
+        self._pending_name_chunks = 0
+        self._name_signals: list[DesktopNameSignals] = []
+        self.loading_label: QLabel | None = None
+
+        # Global Select/Deselect
+        self.select_button_layout = QHBoxLayout()
+        self.select_all_button = QPushButton("Select All")
+        self.select_all_button.clicked.connect(self.select_all)
+        self.deselect_all_button = QPushButton("Deselect All")
+        self.deselect_all_button.clicked.connect(self.deselect_all)
+
+        self.select_button_layout.addStretch(1)
+        self.select_button_layout.addWidget(self.select_all_button)
+        self.select_button_layout.addWidget(self.deselect_all_button)
+        self.main_layout.addLayout(self.select_button_layout)
+
+        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        self.button_box.accepted.connect(self.accept)
+        self.button_box.rejected.connect(self.reject)
+        self.main_layout.addWidget(self.button_box)
+
+        if len(desktop_files) < self._PARALLEL_PARSE_MIN_FILES:
+            self._populate_checkboxes([(fp, self.parse_desktop_name(fp)) for fp in desktop_files])
+        else:
+            self._parse_names_in_pool(desktop_files)
+
+    def _parse_names_in_pool(self, desktop_files: list[str]) -> None:
+        """Read shortcut names on the global thread pool, one contiguous chunk per thread.
+
+        The OK button stays disabled until every chunk has reported back, so an
+        early accept can't be mistaken for "no shortcuts selected".
+        """
+        self.loading_label = QLabel("Reading shortcuts...")
+        self.content_layout.addWidget(self.loading_label)
+        self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(False)
+
+        chunk_count = max(1, min(len(desktop_files), QThread.idealThreadCount()))
+        chunk_size = math.ceil(len(desktop_files) / chunk_count)
+        chunks = [desktop_files[i:i + chunk_size] for i in range(0, len(desktop_files), chunk_size)]
+
+        self._pending_name_chunks = len(chunks)
+        for chunk in chunks:
+            worker = DesktopNameWorker(chunk, self.parse_desktop_name)
+            worker.signals.finished.connect(self._on_names_parsed, Qt.ConnectionType.QueuedConnection)
+            # Keep the signals objects alive until the queued results are delivered
+            self._name_signals.append(worker.signals)
+            QThreadPool.globalInstance().start(worker)
+
+    @pyqtSlot(list)
+    def _on_names_parsed(self, names: list) -> None:
+        """Collect one chunk of (path, name) pairs and build the checkboxes once all are in."""
+        self._parsed_names.update(names)
+        self._pending_name_chunks -= 1
+        if self._pending_name_chunks > 0:
+            return
+
+        self._name_signals.clear()
+        if self.loading_label is not None:
+            self.content_layout.removeWidget(self.loading_label)
+            self.loading_label.deleteLater()
+            self.loading_label = None
+
+        self._populate_checkboxes([(fp, self._parsed_names[fp]) for fp in self._desktop_files])
+        self.button_box.button(QDialogButtonBox.StandardButton.Ok).setEnabled(True)
+
+    def _populate_checkboxes(self, names: list[tuple[str, str]]) -> None:
+        """Build the Desktop and Application Menu checkbox sections.
+
+        Args:
+            names: (file_path, display_name) pairs in display order.
+        """
+        # Suspend painting while the rows are added; lay the content out once at the end
+        self.scroll_content.setUpdatesEnabled(False)
+
+        # Both sections are pre-checked by the shortcut's file name; take it once per file
+        basenames = [os.path.basename(file_path) for file_path, _ in names]
 
         # Desktop Section
         desktop_label = QLabel("<b>Desktop Shortcuts</b>")
         self.content_layout.addWidget(desktop_label)
-        for file_path in desktop_files:
-            name = self.parse_desktop_name(file_path)
+        for (file_path, name), basename in zip(names, basenames):
             checkbox = QCheckBox(name)
-            if existing_desktop is not None:
-                checkbox.setChecked(os.path.basename(file_path) in existing_desktop)
+            if self._existing_desktop is not None:
+                checkbox.setChecked(basename in self._existing_desktop)
             else:
                 checkbox.setChecked(True)
             self.content_layout.addWidget(checkbox)
             self.desktop_checkboxes.append((checkbox, file_path))
-            
+
         self.content_layout.addSpacing(15)
 
         # Application Menu Section
         apps_label = QLabel("<b>Application Menu Shortcuts</b>")
         self.content_layout.addWidget(apps_label)
-        for file_path in desktop_files:
-            name = self.parse_desktop_name(file_path)
+        for (file_path, name), basename in zip(names, basenames):
             checkbox = QCheckBox(name)
-            if existing_apps is not None:
-                checkbox.setChecked(os.path.basename(file_path) in existing_apps)
+            if self._existing_apps is not None:
+                checkbox.setChecked(basename in self._existing_apps)
             else:
                 checkbox.setChecked(True)
             self.content_layout.addWidget(checkbox)
@@ -475,45 +681,52 @@ class SelectShortcutsDialog(QDialog):
         # Add stretch at the end to push everything to the top
         self.content_layout.addStretch(1)
 
-        # Global Select/Deselect
-        self.select_button_layout = QHBoxLayout()
-        self.select_all_button = QPushButton("Select All")
-        self.select_all_button.clicked.connect(self.select_all)
-        self.deselect_all_button = QPushButton("Deselect All")
-        self.deselect_all_button.clicked.connect(self.deselect_all)
-
-        self.select_button_layout.addStretch(1)
-        self.select_button_layout.addWidget(self.select_all_button)
-        self.select_button_layout.addWidget(self.deselect_all_button)
-        self.main_layout.addLayout(self.select_button_layout)
-
-        self.button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
-        self.button_box.accepted.connect(self.accept)
-        self.button_box.rejected.connect(self.reject)
-        self.main_layout.addWidget(self.button_box)
+        self.scroll_content.setUpdatesEnabled(True)
+        self.scroll_content.adjustSize()
 
     @staticmethod
     def parse_desktop_name(file_path: str) -> str:
-        """Read a .desktop file and extract its 'Name' entry, falling back to filename."""
-        try:
-            config_parser = parse_desktop_file(file_path)
-            if config_parser is not None:
-                return config_parser['Desktop Entry'].get('Name', os.path.basename(file_path))
+        """Scan a .desktop file for its 'Name' entry, falling back to filename.
 
-        except (OSError, config_parser.Error) as e:
+        Only the [Desktop Entry] group (or the header-less top of the file) is
+        considered, and reading stops at the first matching line.
+        """
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                in_desktop_entry = True
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith('#'):
+                        continue
+                    if line.startswith('['):
+                        in_desktop_entry = line == '[Desktop Entry]'
+                        continue
+                    if in_desktop_entry and line.startswith('Name'):
+                        key, sep, value = line.partition('=')
+                        if sep and key.strip() == 'Name':
+                            return value.strip() or os.path.basename(file_path)
+
+        except (OSError, UnicodeDecodeError) as e:
             logger.error("Error parsing %s for name: %s", file_path, e)
 
         return os.path.basename(file_path)
 
     def select_all(self):
         """Check all desktop and application menu checkboxes."""
-        for checkbox, _ in self.desktop_checkboxes + self.apps_checkboxes:
-            checkbox.setChecked(True)
+        self._set_all_checked(True)
 
     def deselect_all(self):
         """Uncheck all desktop and application menu checkboxes."""
-        for checkbox, _ in self.desktop_checkboxes + self.apps_checkboxes:
-            checkbox.setChecked(False)
+        self._set_all_checked(False)
+
+    def _set_all_checked(self, checked: bool) -> None:
+        """Set every checkbox to *checked*, repainting the list once at the end."""
+        self.scroll_content.setUpdatesEnabled(False)
+        for checkbox, _ in self.desktop_checkboxes:
+            checkbox.setChecked(checked)
+        for checkbox, _ in self.apps_checkboxes:
+            checkbox.setChecked(checked)
+        self.scroll_content.setUpdatesEnabled(True)
 
     def get_selected_files(self) -> tuple[list[str], list[str]]:
         """Return tuples of (desktop_selected, apps_selected) lists of file paths."""
@@ -528,7 +741,8 @@ class LaunchLoadingDialog(QDialog):
     Displays an animated spinner with the game name and a short description.
     Closes automatically when ``wineserver`` appears (indicating UMU has
     finished initializing). Falls back to a safety timeout of 120 seconds.
-    Can be dismissed early by clicking outside or pressing Escape.
+    Can be dismissed early by clicking outside or pressing Escape. Owners that
+    launch repeatedly keep one instance and reopen it with ``restart``.
     """
 
     _SAFETY_TIMEOUT_MS = 120_000
@@ -567,9 +781,9 @@ class LaunchLoadingDialog(QDialog):
         layout.addWidget(self.spinner, alignment=Qt.AlignmentFlag.AlignCenter)
 
         # Game name label
-        name_label = QLabel(f"Launching {game_name}…")
-        name_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #ecf0f1;")
-        layout.addWidget(name_label, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.name_label = QLabel(f"Launching {game_name}…")
+        self.name_label.setStyleSheet("font-size: 14px; font-weight: bold; color: #ecf0f1;")
+        layout.addWidget(self.name_label, alignment=Qt.AlignmentFlag.AlignCenter)
 
         # Subtitle — updated dynamically as we wait
         self.subtitle = QLabel("Starting umu-run …")
@@ -580,23 +794,39 @@ class LaunchLoadingDialog(QDialog):
         self._poll_timer = QTimer(self)
         self._poll_timer.setInterval(self._POLL_INTERVAL_MS)
         self._poll_timer.timeout.connect(self._on_poll)
-        self._poll_timer.start()
 
         # Safety timeout (120 s) in case something goes wrong
         self._safety_timer = QTimer(self)
         self._safety_timer.setSingleShot(True)
         self._safety_timer.timeout.connect(self._on_safety_timeout)
-        self._safety_timer.start(self._SAFETY_TIMEOUT_MS)
 
         # Grace period timer — starts after wineserver is detected
         self._grace_timer = QTimer(self)
         self._grace_timer.setSingleShot(True)
         self._grace_timer.timeout.connect(self._close_now)
-        self._grace_timer.stop()
 
-        # Start spinner animation
+        self._start_waiting()
+
+    def _start_waiting(self) -> None:
+        """Reset the launch state and start polling, the safety timeout and the spinner."""
+        self._wineserver_detected = False
+        self.subtitle.setText("Starting umu-run …")
+        self._grace_timer.stop()
+        self._poll_timer.start()
+        self._safety_timer.start(self._SAFETY_TIMEOUT_MS)
         self.spinner.start()
 
+    def restart(self, game_name: str) -> None:
+        """Reuse this dialog for another launch and show it.
+
+        Args:
+            game_name: Name of the game being launched.
+        """
+        self._game_name = game_name
+        self.name_label.setText(f"Launching {game_name}…")
+        self._start_waiting()
+        self.show()
+
     def _on_poll(self) -> None:
         """Check whether wineserver has appeared. Start grace period when it does."""
         if not self._wineserver_detected and self._wineserver_running():
@@ -32,8 +32,8 @@ class DownloadHistoryService:
         """
         try:
             if os.path.exists(self.json_path):
-                with open(self.json_path, 'r') as f:
-                    records = json.load(f)
+                with open(self.json_path, 'rb') as f:
+                    records = json.loads(f.read())
 
                 # Mark incomplete downloads as failed
                 for record in records:
@@ -41,7 +41,7 @@ class DownloadHistoryService:
                         record["status"] = "Failed"
 
                 return records
-        except (json.JSONDecodeError, OSError) as e:
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
             logger.error("Error loading download history: %s", e)
 
         return []
@@ -52,9 +52,15 @@ class DownloadHistoryService:
         Args:
             records: List of download record dicts to serialize.
         """
+        # Write beside the history and swap it in, so an interrupted save
+        # never leaves a truncated file behind
+        tmp_path = f"{self.json_path}.tmp"
         try:
-            with open(self.json_path, 'w') as f:
-                json.dump(records, f, indent=4)
+            # Compact output lets json use its C encoder (indent= falls back to pure Python)
+            data = json.dumps(records).encode("utf-8")
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.json_path)
         except OSError as e:
             logger.error("Error saving download history: %s", e)
 
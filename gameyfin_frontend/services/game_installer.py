@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import glob
 import json
 import logging
 import os
@@ -11,13 +10,67 @@ from typing import Any
 
 from PyQt6.QtWidgets import QDialog
 
+from gameyfin_frontend.config import PRODUCT_JSON_MAX_SIZE, PRODUCT_JSON_MIN_SIZE
 from gameyfin_frontend.dialogs import InstallConfigDialog, SelectUmuIdDialog
 from gameyfin_frontend.umu_database import UmuDatabase
 from gameyfin_frontend.settings import SettingsManager
+from gameyfin_frontend.utils import list_files
 
 logger = logging.getLogger(__name__)
 
 
+def _read_product_id(path: str) -> Any:
+    """Return the top-level ``id`` of a product JSON file without decoding the rest.
+
+    Top-level keys are scanned in order and only the values before ``id`` are
+    decoded (to skip over them); the remainder of the file is never parsed.
+
+    Args:
+        path: Path to the product_*.json file.
+
+    Returns:
+        The ``id`` value, or ``None`` if the object has no top-level ``id``.
+
+    Raises:
+        json.JSONDecodeError: If the file is not a JSON object.
+    """
+    # Decode the whole file at once (like json.loads on bytes) instead of via a text-mode reader
+    with open(path, 'rb') as f:
+        data = f.read()
+    text = data.decode(json.detect_encoding(data), 'surrogatepass')
+
+    decoder = json.JSONDecoder()
+    skip_ws = json.decoder.WHITESPACE.match
+
+    idx = skip_ws(text, 0).end()
+    if text[idx:idx + 1] != "{":
+        raise json.JSONDecodeError("Expecting '{'", text, idx)
+    idx += 1
+
+    while True:
+        idx = skip_ws(text, idx).end()
+        if text[idx:idx + 1] == "}":
+            return None
+        if text[idx:idx + 1] != '"':
+            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", text, idx)
+        key, idx = json.decoder.scanstring(text, idx + 1)
+
+        idx = skip_ws(text, idx).end()
+        if text[idx:idx + 1] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", text, idx)
+        idx = skip_ws(text, idx + 1).end()
+
+        value, idx = decoder.raw_decode(text, idx)
+        if key == "id":
+            return value
+
+        idx = skip_ws(text, idx).end()
+        if text[idx:idx + 1] == ",":
+            idx += 1
+        elif text[idx:idx + 1] != "}":
+            raise json.JSONDecodeError("Expecting ',' delimiter", text, idx)
+
+
 class GameInstaller:
     """Detect UMU game IDs, prompt for install config, and return the config dict."""
 
@@ -50,20 +103,29 @@ class GameInstaller:
         Returns:
             Tuple of (umu_id, store).
         """
-        default_game_id = "umu-default"
-        default_store = "none"
+        return self.select_umu_game_id(self.find_umu_candidates(target_dir))
+
+    def find_umu_candidates(self, target_dir: str) -> list[dict[str, Any]]:
+        """Look up the UMU entries matching a downloaded game, without any UI.
+
+        Tries product_*.json codename first, then falls back to filename-based
+        title search. Safe to call from a worker thread.
+
+        Args:
+            target_dir: Download target directory containing the game.
+
+        Returns:
+            The matching UMU entries (possibly empty).
+        """
         results: list[dict[str, Any]] = []
 
         try:
-            json_files = glob.glob(os.path.join(target_dir, "product_*.json"))
+            json_files = list_files(target_dir, "product_", ".json")
             if json_files:
                 product_json_path = json_files[0]
                 logger.info("Found product info: %s", product_json_path)
 
-                with open(product_json_path, 'r') as f:
-                    product_data = json.load(f)
-
-                codename = product_data.get("id")
+                codename = self._read_codename(product_json_path)
                 if codename:
                     logger.info("Found codename: %s", codename)
                     results = self.umu_database.get_game_by_codename(str(codename))
@@ -87,27 +149,58 @@ class GameInstaller:
                 else:
                     logger.info("No codename found and filename was empty. Skipping UMU search.")
 
-            selected_entry = None
-            if isinstance(results, list) and len(results) > 0:
-                if len(results) == 1:
-                    selected_entry = results[0]
-                    logger.info("One matching entry found.")
-                else:
-                    logger.info("Multiple matching entries found, showing dialog.")
-                    umu_dialog = SelectUmuIdDialog(results, self.parent)
-                    if umu_dialog.exec() == QDialog.DialogCode.Accepted:
-                        selected_entry = umu_dialog.get_selected_entry()
-                    else:
-                        logger.info("User cancelled UMU ID selection.")
-
-                if selected_entry:
-                    default_game_id = selected_entry.get("umu_id", default_game_id)
-                    default_store = selected_entry.get("store", default_store)
-                    logger.info("Using: umu_id=%s, store=%s", default_game_id, default_store)
-
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError, KeyError, TypeError) as e:
             logger.error("Error during UMU auto-detection: %s", e)
 
+        return results if isinstance(results, list) else []
+
+    @staticmethod
+    def _read_codename(product_json_path: str) -> Any:
+        """Read the codename from a product JSON file, or None if it is unusable.
+
+        Files that are empty or implausibly large (e.g. from a broken extract) are
+        skipped without being opened; unreadable or malformed files are logged.
+        Either way the caller falls back to the title search.
+        """
+        try:
+            size = os.path.getsize(product_json_path)
+            if not PRODUCT_JSON_MIN_SIZE <= size <= PRODUCT_JSON_MAX_SIZE:
+                logger.warning("Ignoring product info %s: unexpected size %d bytes", product_json_path, size)
+                return None
+            return _read_product_id(product_json_path)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
+            logger.warning("Could not read product info %s: %s", product_json_path, e)
+            return None
+
+    def select_umu_game_id(self, results: list[dict[str, Any]]) -> tuple[str, str]:
+        """Pick the UMU entry to install with, asking the user if several match.
+
+        Args:
+            results: UMU entries from ``find_umu_candidates``.
+
+        Returns:
+            Tuple of (umu_id, store); defaults when nothing was selected.
+        """
+        default_game_id = "umu-default"
+        default_store = "none"
+
+        selected_entry = None
+        if len(results) == 1:
+            selected_entry = results[0]
+            logger.info("One matching entry found.")
+        elif results:
+            logger.info("Multiple matching entries found, showing dialog.")
+            umu_dialog = SelectUmuIdDialog(results, self.parent)
+            if umu_dialog.exec() == QDialog.DialogCode.Accepted:
+                selected_entry = umu_dialog.get_selected_entry()
+            else:
+                logger.info("User cancelled UMU ID selection.")
+
+        if selected_entry:
+            default_game_id = selected_entry.get("umu_id", default_game_id)
+            default_store = selected_entry.get("store", default_store)
+            logger.info("Using: umu_id=%s, store=%s", default_game_id, default_store)
+
         return default_game_id, default_store
 
     def prompt_install_config(
@@ -127,7 +220,7 @@ class GameInstaller:
             Config dict if accepted, ``None`` if cancelled.
         """
         dialog = InstallConfigDialog(
-            umu_database=self.umu_database,
+            db_provider=lambda: self.umu_database,
             parent=self.parent,
             default_game_id=umu_id,
             default_store=store,
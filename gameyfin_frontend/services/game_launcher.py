@@ -8,8 +8,8 @@ from typing import Any
 
 from PyQt6.QtCore import QProcess
 
-from gameyfin_frontend.utils import build_umu_env_prefix
-from gameyfin_frontend.config import DEFAULT_PROTON
+from gameyfin_frontend.utils import build_umu_process_env
+from gameyfin_frontend.config import DEFAULT_PROTON, UMU_RUN_CMD
 
 logger = logging.getLogger(__name__)
 
@@ -49,10 +49,10 @@ class GameLauncher:
         wine_prefix_path: str,
         proton_path: str = DEFAULT_PROTON,
     ) -> QProcess | None:
-        """Launch a game via UMU environment prefix and umu-run on Linux.
+        """Launch a game via umu-run on Linux.
 
-        Builds the command string with ``build_umu_env_prefix`` and executes it
-        via ``/bin/sh -c`` with ``exec`` for proper signal forwarding.
+        Runs umu-run directly (no shell), with the UMU variables set in the
+        process environment by ``build_umu_process_env``.
 
         Args:
             launcher_to_run: Path to the game executable.
@@ -72,16 +72,15 @@ class GameLauncher:
 
             launcher_dir = os.path.dirname(launcher_to_run)
 
-            logger.info("[Install] Applying user environment configuration:")
-            for key, value in config.items():
-                logger.info("  %s=%s", key, value)
+            logger.debug("[Install] Applying user environment configuration: %r", config)
 
-            env_prefix = build_umu_env_prefix(proton_path, wine_prefix_path, config)
+            env = build_umu_process_env(proton_path or DEFAULT_PROTON, wine_prefix_path, config)
 
-            logger.info("Executing: /bin/sh -c \"%s\"", f"{env_prefix} exec umu-run \"{launcher_to_run}\"")
+            logger.info("Executing: %s \"%s\"", UMU_RUN_CMD, launcher_to_run)
             process = QProcess()
             process.setWorkingDirectory(launcher_dir)
-            process.start("/bin/sh", ["-c", f"{env_prefix} exec umu-run \"{launcher_to_run}\""])
+            process.setProcessEnvironment(env)
+            process.start(UMU_RUN_CMD, [launcher_to_run])
 
             if not process.waitForStarted():
                 logger.info("Launch failed (QProcess failed to start).")
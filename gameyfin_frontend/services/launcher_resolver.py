@@ -19,6 +19,9 @@ class LauncherResolver:
     def find_launcher_paths(self, target_dir: str) -> list[str]:
         """Walk ``target_dir`` and collect all .exe files.
 
+        Uses ``os.scandir`` directly so file types come from the directory
+        listing; results are in the same order ``os.walk`` would give.
+
         Args:
             target_dir: Root directory to search.
 
@@ -26,13 +29,23 @@ class LauncherResolver:
             List of absolute paths to .exe files.
         """
         launcher_paths: list[str] = []
-        try:
-            for root, _dirs, files in os.walk(target_dir):
-                for file in files:
-                    if file.lower().endswith(".exe"):
-                        launcher_paths.append(os.path.join(root, file))
-        except OSError as e:
-            logger.error("Error searching for launcher: %s", e)
+        pending_dirs = [target_dir]
+        while pending_dirs:
+            current_dir = pending_dirs.pop()
+            subdirs: list[str] = []
+            try:
+                with os.scandir(current_dir) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            # Like os.walk, symlinked directories are not followed
+                            if not entry.is_symlink():
+                                subdirs.append(entry.path)
+                        elif entry.name[-4:].lower() == ".exe":
+                            launcher_paths.append(entry.path)
+            except OSError as e:
+                logger.error("Error searching for launcher in %s: %s", current_dir, e)
+            # Reversed so subdirectories are visited in listing order
+            pending_dirs.extend(reversed(subdirs))
         return launcher_paths
 
     def handle_launcher_selection(
@@ -42,6 +55,7 @@ class LauncherResolver:
         on_no_exe: object | None = None,
         on_no_launcher: object | None = None,
         on_cancelled: object | None = None,
+        launcher_paths: list[str] | None = None,
     ) -> str | None:
         """Search for .exe files and let the user select one if multiple found.
 
@@ -51,11 +65,14 @@ class LauncherResolver:
             on_no_exe: Callable invoked when no .exe is found.
             on_no_launcher: Callable invoked when user selects nothing.
             on_cancelled: Callable invoked when user cancels the dialog.
+            launcher_paths: Result of an earlier ``find_launcher_paths`` call
+                (e.g. from a worker thread); searched now if omitted.
 
         Returns:
             Selected launcher path, or ``None`` on error/cancel.
         """
-        launcher_paths = self.find_launcher_paths(target_dir)
+        if launcher_paths is None:
+            launcher_paths = self.find_launcher_paths(target_dir)
 
         if not launcher_paths:
             logger.info("No .exe files found in %s", target_dir)
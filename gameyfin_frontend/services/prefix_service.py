@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import glob
 import json
 import logging
 import os
@@ -11,7 +10,7 @@ import shutil
 from typing import Any
 
 from gameyfin_frontend.config import DEFAULT_PROTON, SCRIPT_PERMISSION
-from gameyfin_frontend.utils import build_umu_env_prefix
+from gameyfin_frontend.utils import build_umu_env_prefix, list_files, write_file
 
 logger = logging.getLogger(__name__)
 
@@ -72,7 +71,7 @@ class PrefixService:
         # Fallback: try to parse from a .sh file
         for sd in scripts_dirs:
             if os.path.exists(sd):
-                sh_files = glob.glob(os.path.join(sd, "*.sh"))
+                sh_files = list_files(sd, suffix=".sh")
                 if sh_files:
                     logger.info("Config not found, extracting from %s", sh_files[0])
                     config = self.extract_config_from_sh(sh_files[0])
@@ -180,7 +179,7 @@ class PrefixService:
         sh_files: list[str] = []
         for sd in self.settings.get_shortcuts_dirs(game_name):
             if os.path.exists(sd):
-                sh_files.extend(glob.glob(os.path.join(sd, "*.sh")))
+                sh_files.extend(list_files(sd, suffix=".sh"))
 
         if not sh_files:
             logger.info("No .sh scripts found to update.")
@@ -228,10 +227,7 @@ class PrefixService:
                         else:
                             new_content = f"#!/bin/sh\n\n# Auto-generated by Gameyfin\n{new_command}\n"
 
-                        with open(script_path, 'w') as f:
-                            f.write(new_content)
-
-                        os.chmod(script_path, SCRIPT_PERMISSION)
+                        write_file(script_path, new_content, SCRIPT_PERMISSION)
                         count += 1
                         logger.info("Updated script: %s", script_path)
                     else:
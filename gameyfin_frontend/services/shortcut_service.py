@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import glob
 import json
 import logging
 import os
@@ -11,7 +10,9 @@ from typing import Any
 from PyQt6.QtWidgets import QDialog, QMessageBox
 
 from gameyfin_frontend.dialogs import SelectShortcutsDialog
-from gameyfin_frontend.utils import create_shortcuts, resolve_shortcut_game_info, get_xdg_user_dir
+from gameyfin_frontend.utils import (
+    create_shortcuts, resolve_shortcut_game_info, get_applications_dir, get_xdg_user_dir, list_files,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -38,19 +39,27 @@ class ShortcutService:
         """
         existing_desktop: list[str] = []
         existing_apps: list[str] = []
-        home_dir = os.path.expanduser("~")
-        desktop_dir = os.path.join(home_dir, get_xdg_user_dir("DESKTOP"))
-        apps_dir = os.path.join(home_dir, ".local", "share", "applications")
+        # List both directories once instead of stat'ing every candidate shortcut in them
+        desktop_names = self._entry_names(str(get_xdg_user_dir("DESKTOP")))
+        apps_names = self._entry_names(get_applications_dir())
 
         for df in desktop_files:
             bn = os.path.basename(df)
-            if os.path.exists(os.path.join(desktop_dir, bn)):
+            if bn in desktop_names:
                 existing_desktop.append(bn)
-            if os.path.exists(os.path.join(apps_dir, bn)):
+            if bn in apps_names:
                 existing_apps.append(bn)
 
         return existing_desktop, existing_apps
 
+    @staticmethod
+    def _entry_names(directory: str) -> frozenset[str]:
+        """Return the names in *directory*, or an empty set if it cannot be read."""
+        try:
+            return frozenset(os.listdir(directory))
+        except OSError:
+            return frozenset()
+
     def show_shortcut_dialog(
         self,
         desktop_files: list[str],
@@ -135,7 +144,7 @@ class ShortcutService:
                                 "Shortcuts are usually captured during the installation process.")
             return False
 
-        all_desktop_files = glob.glob(os.path.join(shortcuts_dir, "*.desktop"))
+        all_desktop_files = list_files(shortcuts_dir, suffix=".desktop")
         if not all_desktop_files:
             QMessageBox.warning(parent, "No Shortcuts Found",
                                 "No .desktop files found in the proton_shortcuts directory.")
@@ -3,8 +3,9 @@ import logging
 import os
 import re
 import sys
-from collections import defaultdict
-from typing import Dict, List
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Callable, Dict, Iterable, List
 
 import requests
 
@@ -12,13 +13,58 @@ from .settings import SettingsManager
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of normalized search terms whose results are kept in memory
+SEARCH_CACHE_SIZE = 128
+
+# Below this many titles a plain scan of the normalized titles is fast enough
+TRIGRAM_INDEX_MIN_TITLES = 1000
+
+
+class _TitleIndex:
+    """Normalized form of every title, plus a trigram index for large databases.
+
+    A title can only contain a search term if it contains every 3-character
+    substring of that term, so intersecting the trigram posting sets yields a
+    small candidate set that is then verified with a substring check.
+    """
+
+    def __init__(self, titles: Iterable[str], normalize: Callable[[str], str], use_trigrams: bool):
+        self.normalized: Dict[str, str] = {title: normalize(title) for title in titles}
+        self._position = {title: i for i, title in enumerate(self.normalized)}
+        self._trigrams: Dict[str, set] | None = None
+
+        if use_trigrams:
+            self._trigrams = defaultdict(set)
+            for title, normalized_title in self.normalized.items():
+                for i in range(len(normalized_title) - 2):
+                    self._trigrams[normalized_title[i:i + 3]].add(title)
+
+    def candidates(self, normalized_term: str) -> Iterable[str]:
+        """Return the titles that may contain *normalized_term*, in database order."""
+        if self._trigrams is None or len(normalized_term) < 3:
+            return self.normalized.keys()
+
+        postings = sorted(
+            (self._trigrams.get(normalized_term[i:i + 3], set()) for i in range(len(normalized_term) - 2)),
+            key=len,
+        )
+        return sorted(set.intersection(*postings), key=self._position.__getitem__)
+
+
 class UmuDatabase:
+    # LRU of normalized search term -> matching full titles; created on first search
+    _search_cache: OrderedDict[str, List[str]] | None = None
+    # Normalized/trigram view of _games_by_title; built on first search
+    _title_index: _TitleIndex | None = None
+
     def __init__(self, settings: SettingsManager | None = None):
         """Initialize the UMU database for game fix lookups.
 
         Args:
             settings: SettingsManager instance providing app configuration.
         """
+        # Searches run on pool threads, so the shared search cache and index are locked
+        self._search_lock = threading.Lock()
         if sys.platform == "win32":
             logger.info("Running on Windows. UmuDatabase disabled.")
             self.umu_api_url = ""
@@ -57,6 +103,7 @@ class UmuDatabase:
         self._games_by_title.clear()
         self._games_by_codename.clear()
         self._games_by_umu_id.clear()
+        self._invalidate_search_cache()
 
         if not isinstance(all_entries_raw, list):
             logger.error(
@@ -85,6 +132,7 @@ class UmuDatabase:
                 with open(self.cache_file_path, 'r') as f:
                     data = json.load(f)
                 self._games_by_title = defaultdict(list, data.get("title", {}))
+                self._invalidate_search_cache()
                 self._games_by_codename = defaultdict(list, data.get("codename", {}))
                 self._games_by_umu_id = defaultdict(list, data.get("umu_id", {}))
                 logger.info("UmuDatabase: Loaded cache from %s", self.cache_file_path)
@@ -173,15 +221,78 @@ class UmuDatabase:
         if not normalized_search_term:
             return []
 
+        matching_titles = self._cached_title_search(normalized_search_term)
+
         matching_entries = []
+        for full_title in matching_titles:
+            matching_entries.extend(self._games_by_title[full_title])
 
-        for full_title in self._games_by_title:
-            normalized_full_title = self._normalize_string(full_title)
+        return matching_entries
 
-            if normalized_search_term in normalized_full_title:
-                matching_entries.extend(self._games_by_title[full_title])
+    def _cached_title_search(self, normalized_search_term: str) -> List[str]:
+        """
+        Returns the full titles whose normalized form contains the search term.
 
-        return matching_entries
+        Results are kept in a small LRU keyed by the normalized term. When a
+        cached term is contained in the new one (e.g. the user typed more
+        characters), only that term's titles are re-checked instead of the
+        whole title index.
+        """
+        with self._search_lock:
+            if self._search_cache is None:
+                self._search_cache = OrderedDict()
+
+            cached = self._search_cache.get(normalized_search_term)
+            if cached is not None:
+                self._search_cache.move_to_end(normalized_search_term)
+                return cached
+
+            title_index = self._get_title_index()
+            best_term = max((term for term in self._search_cache if term in normalized_search_term),
+                            key=len, default=None)
+            if best_term is not None:
+                candidates = self._search_cache[best_term]
+            else:
+                candidates = title_index.candidates(normalized_search_term)
+
+            normalized_titles = title_index.normalized
+            matching_titles = [
+                full_title for full_title in candidates
+                if normalized_search_term in normalized_titles[full_title]
+            ]
+
+            self._search_cache[normalized_search_term] = matching_titles
+            if len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+
+            return matching_titles
+
+    def cached_titles(self) -> List[str]:
+        """Return every title in the local cache."""
+        return list(self._games_by_title)
+
+    def get_cached_games_by_title(self, title: str) -> List[dict]:
+        """Return the cached entries for an exact *title*, without querying the API."""
+        return self._games_by_title.get(title, [])
+
+    def _invalidate_search_cache(self):
+        """Drop the search cache and title index after the titles changed."""
+        with self._search_lock:
+            self._search_cache = None
+            self._title_index = None
+
+    def _get_title_index(self) -> _TitleIndex:
+        """Return the title index, building it from the current titles if needed.
+
+        Must be called with _search_lock held.
+        """
+        if self._title_index is None:
+            self._title_index = _TitleIndex(
+                self._games_by_title.keys(),
+                self._normalize_string,
+                use_trigrams=len(self._games_by_title) >= TRIGRAM_INDEX_MIN_TITLES,
+            )
+        return self._title_index
 
     def list_all(self):
         """
@@ -1,33 +1,37 @@
 import configparser
+import functools
 import logging
 import os
+import re
 import shutil
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 from PyQt6.QtGui import QGuiApplication, QIcon
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QProcessEnvironment
 
 from gameyfin_frontend.config import DEFAULT_PROTON, SCRIPT_PERMISSION, FLATPAK_ID
 
 logger = logging.getLogger(__name__)
 
-# Multipliers for human-readable size formatting (binary units)
-_SIZE_UNITS = [
-    (1024 ** 4, "TB"),
-    (1024 ** 3, "GB"),
-    (1024 ** 2, "MB"),
-    (1024, "KB"),
-]
+# Characters that keep a special meaning inside a double-quoted shell word
+_SH_DOUBLE_QUOTE_ESCAPES = str.maketrans({c: f"\\{c}" for c in '\\"$`'})
+
+# Icon size directories, largest (preferred) first
+_ICON_SIZES = ("256x256", "128x128", "64x64", "48x48", "32x32")
+
+# (1 / 1024**n, unit) for human-readable size formatting (binary units), indexed by ``(bit_length - 1) // 10``.
+# Multiplying by the reciprocal of a power of two is exact, so it matches dividing by the threshold.
+_SIZE_UNITS = tuple((1 / (1 << (10 * shift)), unit) for shift, unit in enumerate(("B", "KB", "MB", "GB", "TB")))
 
 
 def format_size(nbytes: int) -> str:
     """Format bytes as a human-readable string (e.g. '1.50 MB')."""
-    for threshold, unit in _SIZE_UNITS:
-        if nbytes >= threshold:
-            return f"{nbytes / threshold:.2f} {unit}"
-    return f"{nbytes} B"
+    if nbytes < 1024:
+        return f"{nbytes} B"
+    scale, unit = _SIZE_UNITS[min((int(nbytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)]
+    return f"{nbytes * scale:.2f} {unit}"
 
 
 def parse_size(text: str) -> int:
@@ -95,6 +99,9 @@ def build_umu_env_prefix(proton_path: str, wine_prefix: str, config: dict) -> st
     """
     Builds just the environment variable prefix string for UMU commands.
 
+    Values are escaped inside their double quotes, so the shell passes them on
+    verbatim like build_umu_process_env does.
+
     Args:
         proton_path: Proton version (e.g. "GE-Proton").
         wine_prefix: WINEPREFIX path.
@@ -103,14 +110,136 @@ def build_umu_env_prefix(proton_path: str, wine_prefix: str, config: dict) -> st
     Returns:
         Environment prefix string.
     """
-    env_prefix = f'PROTONPATH="{proton_path}" WINEPREFIX="{wine_prefix}" '
+    assignments = [("PROTONPATH", proton_path), ("WINEPREFIX", wine_prefix)]
+    assignments.extend((key, value) for key, value in config.items() if key not in ("PROTONPATH", "WINEPREFIX"))
+    return "".join(f'{key}="{str(value).translate(_SH_DOUBLE_QUOTE_ESCAPES)}" ' for key, value in assignments)
+
+
+def build_umu_process_env(proton_path: str, wine_prefix: str, config: dict) -> QProcessEnvironment:
+    """
+    Builds the process environment for running umu-run directly, without a shell.
+
+    Same variables as build_umu_env_prefix, layered over the system environment.
+
+    Args:
+        proton_path: Proton version (e.g. "GE-Proton").
+        wine_prefix: WINEPREFIX path.
+        config: Dict of additional environment variables.
+
+    Returns:
+        A QProcessEnvironment ready for QProcess.setProcessEnvironment().
+    """
+    env = QProcessEnvironment.systemEnvironment()
+    env.insert("PROTONPATH", proton_path)
+    env.insert("WINEPREFIX", wine_prefix)
     for key, value in config.items():
         if key not in ("PROTONPATH", "WINEPREFIX"):
-            env_prefix += f'{key}="{value}" '
-    return env_prefix
+            env.insert(key, str(value))
+    return env
+
+
+def list_files(directory: str, prefix: str = "", suffix: str = "") -> list[str]:
+    """
+    Lists the regular files in a directory whose names start with *prefix* and end with *suffix*.
+
+    A single os.scandir pass, matching what glob.glob(os.path.join(directory, f"{prefix}*{suffix}"))
+    returns: hidden files are skipped and a missing directory yields an empty list.
+
+    Args:
+        directory: Directory to list (not recursive).
+        prefix: Required start of the file name.
+        suffix: Required end of the file name (e.g. ".desktop").
+
+    Returns:
+        Paths of the matching files, in directory order.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [
+                entry.path for entry in entries
+                if entry.name.startswith(prefix) and entry.name.endswith(suffix)
+                and not entry.name.startswith(".") and len(entry.name) >= len(prefix) + len(suffix)
+                and entry.is_file()
+            ]
+    except OSError:
+        return []
+
+
+def find_existing_dirs(paths: Iterable[str]) -> set[str]:
+    """
+    Returns the subset of *paths* that are existing directories.
+
+    Paths are grouped by parent so each parent is listed once with scandir
+    instead of stat'ing every path; paths under unreadable parents are
+    checked individually.
+
+    Args:
+        paths: Directory paths to check.
+
+    Returns:
+        The paths (as given) that exist and are directories.
+    """
+    by_parent: dict[str, list[str]] = {}
+    existing: set[str] = set()
+    for path in paths:
+        if path and os.path.basename(path):
+            by_parent.setdefault(os.path.dirname(path), []).append(path)
+        elif path and os.path.isdir(path):
+            existing.add(path)
+
+    for parent, children in by_parent.items():
+        try:
+            with os.scandir(parent or ".") as entries:
+                subdirs = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            existing.update(path for path in children if os.path.isdir(path))
+            continue
+        existing.update(path for path in children if os.path.basename(path) in subdirs)
+    return existing
+
+
+# One line of a .desktop file: blank/comment, a group header, or an unindented Key=Value pair.
+# Matched line by line over the whole file content, consuming the line break.
+_DESKTOP_LINE_RE = re.compile(
+    r"^(?:[ \t]*(?:[#;].*)?"
+    r"|\[(?P<section>[^\]\n]*)\].*"
+    r"|(?P<key>[^\s=:][^=:\n]*?)[ \t]*[=:][ \t]*(?P<value>.*?)[ \t]*"
+    r")\r?$\n?",
+    re.MULTILINE,
+)
+_DESKTOP_ENTRY_HEADER_RE = re.compile(r"\s*\[Desktop Entry\]")
+
+DesktopFile = dict[str, dict[str, str]]
+
+
+def _parse_desktop_entry(content: str) -> DesktopFile | None:
+    """
+    Parses a .desktop file that only has a [Desktop Entry] group in a single regex pass.
+
+    Returns None for anything else (extra groups, continuation lines, malformed
+    lines) so the caller can hand it to configparser instead.
+    """
+    entry: dict[str, str] = {}
+    seen_header = False
+    end = 0
+    # Scan the content in place; a gap between consecutive matches is a line the regex rejected
+    for match in _DESKTOP_LINE_RE.finditer(content):
+        if match.start() != end:
+            return None
+        end = match.end()
+        section = match.group("section")
+        if section is not None:
+            if section != "Desktop Entry" or seen_header or entry:
+                return None
+            seen_header = True
+        elif match.group("key") is not None:
+            entry[match.group("key")] = match.group("value")
+    if end != len(content):
+        return None
+    return {"Desktop Entry": entry}
 
 
-def parse_desktop_file(path: str) -> configparser.ConfigParser | None:
+def parse_desktop_file(path: str) -> DesktopFile | None:
     """
     Parses a .desktop file, adding [Desktop Entry] header if missing.
 
@@ -118,28 +247,96 @@ def parse_desktop_file(path: str) -> configparser.ConfigParser | None:
         path: Path to the .desktop file.
 
     Returns:
-        A ConfigParser object with the parsed content, or None on failure.
+        A dict mapping each group name to its keys and values, or None on failure.
     """
     try:
-        with open(path, 'r') as f:
+        # Desktop entry files are UTF-8 by specification, whatever the locale
+        with open(path, 'r', encoding='utf-8') as f:
             content = f.read()
-        if not content.strip().startswith('[Desktop Entry]'):
+
+        parsed = _parse_desktop_entry(content)
+        if parsed is not None:
+            return parsed
+
+        # Files with additional groups (e.g. [Desktop Action ...]) take the slow path
+        if not _DESKTOP_ENTRY_HEADER_RE.match(content):
             content = '[Desktop Entry]\n' + content
 
-        config_parser = configparser.ConfigParser(strict=False)
+        config_parser = configparser.ConfigParser(strict=False, interpolation=None)
         config_parser.optionxform = str
         config_parser.read_string(content)
 
         if 'Desktop Entry' not in config_parser:
             return None
 
-        return config_parser
-    except (OSError, configparser.Error) as e:
+        return {section: dict(config_parser[section]) for section in config_parser.sections()}
+    except (OSError, UnicodeDecodeError, configparser.Error) as e:
         logger.error("Error parsing %s: %s", path, e)
         return None
 
 
-def copy_icon_from_source(source_dir: str, icon_name: str) -> str | None:
+def write_file(path: str, content: str, mode: int = 0o644) -> None:
+    """
+    Writes *content* to *path* through one descriptor and gives the file *mode*.
+
+    The permissions are set on that descriptor, so the path is never looked up
+    again after opening, unlike a separate os.chmod.
+
+    Args:
+        path: Destination file path.
+        content: Text to write (UTF-8).
+        mode: Permission bits the file ends up with, whether or not it existed.
+    """
+    data = memoryview(content.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, mode)
+    try:
+        # O_CREAT's mode is masked by the umask and ignored for existing files
+        os.fchmod(fd, mode)
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def write_desktop_file(path: str, desktop_file: DesktopFile, mode: int = 0o644) -> None:
+    """
+    Writes groups parsed by parse_desktop_file back to disk.
+
+    The file is written under a hidden temporary name and renamed into place,
+    so desktop environments watching the directory never read a partial file.
+
+    Args:
+        path: Destination path of the .desktop file.
+        desktop_file: Group names mapped to their keys and values.
+        mode: Permission bits the file ends up with, whether or not it existed.
+    """
+    directory, name = os.path.split(path)
+    tmp_path = os.path.join(directory, f".{name}.tmp")
+    try:
+        write_file(tmp_path, "\n".join(
+            f"[{section}]\n" + "".join(f"{key}={value}\n" for key, value in entries.items())
+            for section, entries in desktop_file.items()
+        ), mode)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _list_dir_names(directory: str) -> frozenset[str] | None:
+    """Return the names of the entries in *directory*, or None if it cannot be read."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except OSError:
+        return None
+
+
+def copy_icon_from_source(source_dir: str, icon_name: str,
+                          icons_dir_cache: dict[str, frozenset[str] | None] | None = None) -> str | None:
     """
     Finds the best available icon file from a source directory.
 
@@ -147,14 +344,25 @@ def copy_icon_from_source(source_dir: str, icon_name: str) -> str | None:
     Looks for both <icon>.png and the icon name as-is.
     Searches multiple possible locations where icons may be stored.
 
+    Each location and each of its apps/ directories is listed once and then
+    answered from memory, so no path is stat'ed per candidate icon.
+
     Args:
         source_dir: Base directory (e.g. proton_shortcuts/ or drive_c/).
         icon_name: The icon name to search for.
+        icons_dir_cache: Optional dict reused across calls that share icon
+            directories, mapping each listed directory to its entry names.
 
     Returns:
         Path to the found icon file, or None if not found.
     """
-    sizes_to_check = ["256x256", "128x128", "64x64", "48x48", "32x32"]
+    if icons_dir_cache is None:
+        icons_dir_cache = {}
+
+    def listing(directory: str) -> frozenset[str] | None:
+        if directory not in icons_dir_cache:
+            icons_dir_cache[directory] = _list_dir_names(directory)
+        return icons_dir_cache[directory]
 
     # Possible locations to search for icons, relative to source_dir
     # source_dir is typically the proton_shortcuts/ directory containing the .desktop file
@@ -165,22 +373,34 @@ def copy_icon_from_source(source_dir: str, icon_name: str) -> str | None:
         "../drive_c/proton_shortcuts/icons",    # proton_shortcuts/../drive_c/proton_shortcuts/icons/
     ]
 
+    existing_dirs = []
     for search_base in search_dirs:
-        for size in sizes_to_check:
-            path_with_png = os.path.join(source_dir, search_base, size, "apps", f"{icon_name}.png")
-            path_as_is = os.path.join(source_dir, search_base, size, "apps", icon_name)
+        icons_dir = os.path.join(source_dir, search_base)
+        subdirs = listing(icons_dir)
+        if subdirs is not None:
+            existing_dirs.append((icons_dir, subdirs))
 
-            if os.path.exists(path_with_png):
-                return path_with_png
-            if os.path.exists(path_as_is):
-                return path_as_is
+    candidates = (f"{icon_name}.png", icon_name)
+
+    for icons_dir, subdirs in existing_dirs:
+        for size in _ICON_SIZES:
+            if size not in subdirs:
+                continue
+            apps_dir = os.path.join(icons_dir, size, "apps")
+            icons = listing(apps_dir) or frozenset()
+            for candidate in candidates:
+                if candidate in icons:
+                    return os.path.join(apps_dir, candidate)
 
     # Fallback: search without size directory
-    for search_base in search_dirs:
-        for ext in [".png", ""]:
-            path_with_png = os.path.join(source_dir, search_base, "apps", f"{icon_name}{ext}")
-            if os.path.exists(path_with_png):
-                return path_with_png
+    for icons_dir, subdirs in existing_dirs:
+        if "apps" not in subdirs:
+            continue
+        apps_dir = os.path.join(icons_dir, "apps")
+        icons = listing(apps_dir) or frozenset()
+        for candidate in candidates:
+            if candidate in icons:
+                return os.path.join(apps_dir, candidate)
 
     return None
 
@@ -205,7 +425,7 @@ def install_icon_for_shortcut(icon_path: str, icon_name: str) -> str | None:
     parts = icon_path.split(os.sep)
     size_dir = None
     for i, part in enumerate(parts):
-        if part in ["256x256", "128x128", "64x64", "48x48", "32x32"]:
+        if part in _ICON_SIZES:
             size_dir = part
             break
 
@@ -302,26 +522,23 @@ def get_app_icon_path(custom_path: str | None = None, theme: str | None = None)
     return resource_path(os.path.join("gameyfin_frontend", icon_name))
 
 
-def get_xdg_user_dir(dir_name: str) -> Path:
-    """
-    Finds a special XDG user directory (like DESKTOP, DOCUMENTS)
-    in a language-independent way on Linux by reading the
-    ~/.config/user-dirs.dirs file.
+@functools.lru_cache(maxsize=None)
+def _load_xdg_user_dirs(config_file_path: Path) -> dict[str, Path]:
+    """Parse a user-dirs.dirs file once into a mapping of XDG_*_DIR keys to paths.
 
-    Args:
-        dir_name: The internal name of the directory (e.g., "DESKTOP",
-                  "DOCUMENTS", "DOWNLOAD").
-    """
-    key_to_find = f"XDG_{dir_name.upper()}_DIR"
+    The result is cached per file path for the lifetime of the process; call
+    ``_load_xdg_user_dirs.cache_clear()`` to re-read it.
 
-    config_home = os.environ.get("XDG_CONFIG_HOME", Path.home() / ".config")
-    config_file_path = Path(config_home) / "user-dirs.dirs"
-
-    # Set a sensible fallback (e.g., $HOME/Desktop)
-    fallback_dir = Path.home() / dir_name.capitalize()
+    Args:
+        config_file_path: Path to the user-dirs.dirs file.
 
+    Returns:
+        Dict like {"XDG_DESKTOP_DIR": Path("/home/user/Desktop")}; empty if the
+        file is missing or unreadable.
+    """
+    user_dirs: dict[str, Path] = {}
     if not config_file_path.is_file():
-        return fallback_dir
+        return user_dirs
 
     try:
         with open(config_file_path, "r") as f:
@@ -331,28 +548,43 @@ def get_xdg_user_dir(dir_name: str) -> Path:
                 if not line or line.startswith("#"):
                     continue
 
-                if line.startswith(key_to_find):
-                    try:
-                        # Line looks like: XDG_DESKTOP_DIR="$HOME/Desktop"
-                        value = line.split("=", 1)[1]
-                        value = value.strip('"')
-
-                        # Expand variables like $HOME
-                        path = os.path.expandvars(value)
-
-                        return Path(path)
+                # Line looks like: XDG_DESKTOP_DIR="$HOME/Desktop"
+                key, sep, value = line.partition("=")
+                if not sep:
+                    logger.warning("Malformed line in %s: %s", config_file_path, line)
+                    continue
 
-                    except (ValueError, IndexError):
-                        # Found the key but the line was malformed
-                        logger.warning("Malformed line in %s: %s", config_file_path, line)
-                        return fallback_dir
+                # Expand variables like $HOME
+                user_dirs.setdefault(key, Path(os.path.expandvars(value.strip('"'))))
 
     except OSError as e:
         logger.error("Error reading %s: %s", config_file_path, e)
-        return fallback_dir
 
-    # Key wasn't found in the file
-    return fallback_dir
+    return user_dirs
+
+
+def get_xdg_user_dir(dir_name: str) -> Path:
+    """
+    Finds a special XDG user directory (like DESKTOP, DOCUMENTS)
+    in a language-independent way on Linux by reading the
+    ~/.config/user-dirs.dirs file.
+
+    Args:
+        dir_name: The internal name of the directory (e.g., "DESKTOP",
+                  "DOCUMENTS", "DOWNLOAD").
+    """
+    # The home directory is only looked up when a fallback actually needs it
+    config_home = os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config"
+    user_dirs = _load_xdg_user_dirs(Path(config_home) / "user-dirs.dirs")
+
+    # Fall back to e.g. $HOME/Desktop when the key is not configured
+    user_dir = user_dirs.get(f"XDG_{dir_name.upper()}_DIR")
+    return user_dir if user_dir is not None else Path.home() / dir_name.capitalize()
+
+
+def get_applications_dir() -> str:
+    """Return the user's application menu directory (~/.local/share/applications)."""
+    return os.path.join(os.path.expanduser("~"), ".local", "share", "applications")
 
 
 def resolve_shortcut_game_info(
@@ -407,14 +639,25 @@ def create_shortcuts(
     """
     os.makedirs(scripts_dir, exist_ok=True)
 
+    # A game's helper scripts and shortcuts all derive from the same parsed files and names
+    parsed_files: dict[str, DesktopFile | None] = {}
+    script_paths: dict[str, str] = {}
+
+    def load(original_path: str) -> tuple[DesktopFile | None, str]:
+        if original_path not in parsed_files:
+            parsed_files[original_path] = parse_desktop_file(original_path)
+            script_name = os.path.splitext(os.path.basename(original_path))[0] + ".sh"
+            script_paths[original_path] = os.path.join(scripts_dir, script_name)
+        return parsed_files[original_path], script_paths[original_path]
+
     # 1. Create/update .sh helper scripts for ALL detected desktop files
     for original_path in all_desktop_files:
         try:
-            config_parser = parse_desktop_file(original_path)
-            if config_parser is None:
+            desktop_file, script_path = load(original_path)
+            if desktop_file is None:
                 continue
 
-            entry = config_parser["Desktop Entry"]
+            entry = desktop_file["Desktop Entry"]
             working_dir = entry.get("Path")
             exe_name = entry.get("StartupWMClass")
             if not exe_name:
@@ -426,77 +669,90 @@ def create_shortcuts(
             exe_path = os.path.join(working_dir, exe_name)
             command_to_run = build_umu_command(proton_path, wine_prefix, install_config, f'umu-run "{exe_path}"')
 
-            script_name = os.path.splitext(os.path.basename(original_path))[0] + ".sh"
-            script_path = os.path.join(scripts_dir, script_name)
             script_content = f"#!/bin/sh\n\ncd '{working_dir}'\n\n# Auto-generated by Gameyfin\n{command_to_run}\n"
 
-            with open(script_path, "w") as f:
-                f.write(script_content)
-            os.chmod(script_path, SCRIPT_PERMISSION)
+            write_file(script_path, script_content, SCRIPT_PERMISSION)
             logger.info("Created/Updated helper script: %s", script_path)
 
-        except (OSError, configparser.Error) as e:
+        except OSError as e:
             logger.error("Failed to create helper script for %s: %s", original_path, e)
 
     # 2. Manage system .desktop files (Desktop + Applications)
-    home_dir = os.path.expanduser("~")
+    # get_xdg_user_dir already returns an absolute path
     locs = [
-        (os.path.join(home_dir, get_xdg_user_dir("DESKTOP")), selected_desktop or []),
-        (os.path.join(home_dir, ".local", "share", "applications"), selected_apps or []),
+        (str(get_xdg_user_dir("DESKTOP")), selected_desktop or []),
+        (get_applications_dir(), selected_apps or []),
     ]
 
+    # Shortcuts of one game share their icon directories; list each only once
+    icons_dir_cache: dict[str, frozenset[str] | None] = {}
+
+    # Shortcuts sharing an icon (e.g. a game and its launcher) resolve and copy it once
+    @functools.lru_cache(maxsize=None)
+    def installed_icon_for(source_dir: str, icon_name: str) -> str | None:
+        found_icon_path = copy_icon_from_source(source_dir, icon_name, icons_dir_cache)
+        return install_icon_for_shortcut(found_icon_path, icon_name) if found_icon_path else None
+
+    # The rewritten shortcut is the same for every location it is placed in
+    shortcut_files: dict[str, DesktopFile | None] = {}
+
+    def build_shortcut(original_path: str) -> DesktopFile | None:
+        if original_path in shortcut_files:
+            return shortcut_files[original_path]
+        parsed, script_path = load(original_path)
+        desktop_file = None
+        if parsed is not None:
+            desktop_file = {section: dict(entries) for section, entries in parsed.items()}
+            entry = desktop_file["Desktop Entry"]
+
+            # Icon handling - find and install icon to system directory
+            icon_name = entry.get("Icon")
+            if icon_name:
+                installed_icon = installed_icon_for(os.path.dirname(original_path), icon_name)
+                if installed_icon:
+                    entry["Icon"] = installed_icon
+
+            use_host_umu = install_config.get("USE_HOST_UMU", "0")
+
+            if use_host_umu == "0":
+                flatpak_exec = build_flatpak_exec_command(script_path)
+                entry["Exec"] = flatpak_exec
+            else:
+                entry["Exec"] = f'"{script_path}"'
+
+            entry["Type"] = "Application"
+            entry["Categories"] = "Application;Game;"
+        shortcut_files[original_path] = desktop_file
+        return desktop_file
+
     for target_dir, selected_list in locs:
-        os.makedirs(target_dir, exist_ok=True)
+        # Only shortcuts being written need the directory; removals check for existing files
+        if selected_list:
+            os.makedirs(target_dir, exist_ok=True)
 
         # Remove those NOT selected for this specific location
         if remove_unselected:
             to_remove = [f for f in all_desktop_files if f not in selected_list]
             for original_path in to_remove:
                 target_path = os.path.join(target_dir, os.path.basename(original_path))
-                if os.path.exists(target_path):
-                    try:
-                        os.remove(target_path)
-                        logger.info("Removed system shortcut: %s", target_path)
-                    except OSError as e:
-                        logger.error("Failed to remove system shortcut %s: %s", target_path, e)
+                try:
+                    os.remove(target_path)
+                    logger.info("Removed system shortcut: %s", target_path)
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logger.error("Failed to remove system shortcut %s: %s", target_path, e)
 
         # Create/Update those selected for this specific location
         for original_path in selected_list:
             try:
-                config_parser = parse_desktop_file(original_path)
-                if config_parser is None:
+                desktop_file = build_shortcut(original_path)
+                if desktop_file is None:
                     continue
 
-
-                # Icon handling - find and install icon to system directory
-                icon_name = entry.get("Icon")
-                if icon_name:
-                    source_dir = os.path.dirname(original_path)
-                    found_icon_path = copy_icon_from_source(source_dir, icon_name)
-                    if found_icon_path:
-                        installed_icon = install_icon_for_shortcut(found_icon_path, icon_name)
-                        if installed_icon:
-                            config_parser.set("Desktop Entry", "Icon", installed_icon)
-
-                script_name = os.path.splitext(os.path.basename(original_path))[0] + ".sh"
-                script_path = os.path.join(scripts_dir, script_name)
-
-                use_host_umu = install_config.get("USE_HOST_UMU", "0")
-
-                if use_host_umu == "0":
-                    flatpak_exec = build_flatpak_exec_command(script_path)
-                    config_parser.set("Desktop Entry", "Exec", flatpak_exec)
-                else:
-                    config_parser.set("Desktop Entry", 'Exec', f'"{script_path}"')
-
-                config_parser.set("Desktop Entry", "Type", "Application")
-                config_parser.set("Desktop Entry", "Categories", "Application;Game;")
-
                 new_file_path = os.path.join(target_dir, os.path.basename(original_path))
-                with open(new_file_path, "w") as f:
-                    config_parser.write(f)
-                os.chmod(new_file_path, SCRIPT_PERMISSION)
+                write_desktop_file(new_file_path, desktop_file, SCRIPT_PERMISSION)
                 logger.info("Successfully created system shortcut at: %s", new_file_path)
 
-            except (OSError, configparser.Error) as e:
+            except OSError as e:
                 logger.error("Failed to process system shortcut %s: %s", original_path, e)
\ No newline at end of file
@@ -1,13 +1,14 @@
-import glob
 import logging
+import math
 import os
 import shutil
 import sys
 import time
+from collections import deque
 from typing import Any
 
-from PyQt6.QtCore import pyqtSlot, QProcess, QUrl, QThread, pyqtSignal
-from PyQt6.QtGui import QDesktopServices
+from PyQt6.QtCore import pyqtSlot, QEvent, QProcess, QSize, QTimer, QUrl, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QDesktopServices, QFont, QPixmap
 from PyQt6.QtWidgets import (
     QDialog,
     QWidget,
@@ -23,10 +24,14 @@ from gameyfin_frontend.dialogs import LaunchLoadingDialog, SelectShortcutsDialog
 from gameyfin_frontend.umu_database import UmuDatabase
 from gameyfin_frontend.utils import (
     create_shortcuts, resolve_shortcut_game_info,
-    format_size, parse_size,
+    format_size, parse_size, list_files,
+)
+from gameyfin_frontend.config import (
+    COLOR_STATUS_DOWNLOADING, COLOR_STATUS_INSTALLING, PROGRESS_SIGNAL_INTERVAL, SPEED_WINDOW,
+)
+from gameyfin_frontend.workers import (
+    InstallScanSignals, InstallScanWorker, StreamDownloadWorker, download_thread_pool,
 )
-from gameyfin_frontend.config import COLOR_STATUS_DOWNLOADING, COLOR_STATUS_INSTALLING
-from gameyfin_frontend.workers import StreamDownloadWorker
 from gameyfin_frontend.services import LauncherResolver, GameInstaller, GameLauncher
 from gameyfin_frontend.settings import SettingsManager
 
@@ -38,8 +43,20 @@ class DownloadItemWidget(QWidget):
     finished = pyqtSignal(dict)
     installation_finished = pyqtSignal(str)
 
+    # Minimum time between progress repaints; bytes_received ticks in between are coalesced
+    UI_UPDATE_INTERVAL_MS = int(PROGRESS_SIGNAL_INTERVAL * 1000)
+
+    # Font the cached metrics were measured with, and (font height, status label width, button column width)
+    _metrics_font: QFont | None = None
+    _metrics: tuple[int, int, int] = (0, 0, 0)
+
+    # "Directory not found" icon, rasterized once per size and dropped when the style changes
+    _warning_pixmap: QPixmap | None = None
+    _warning_pixmap_size: QSize | None = None
+
     def __init__(self, umu_database: UmuDatabase, worker: StreamDownloadWorker | None = None, record: dict[str, Any] | None = None,
-                 parent: QWidget | None = None, settings: SettingsManager | None = None, tray=None):
+                 parent: QWidget | None = None, settings: SettingsManager | None = None, tray=None,
+                 check_dir: bool = True):
         """Create a download item widget showing progress, status, and action buttons.
 
         Args:
@@ -48,17 +65,34 @@ class DownloadItemWidget(QWidget):
             record: Optional persisted download record dict for restoring a previous state.
             parent: Parent widget.
             settings: SettingsManager instance providing app configuration.
+            check_dir: Whether to check that a completed download's directory still exists.
+                Pass False when the caller checks it off the UI thread and calls ``mark_missing``.
         """
         super().__init__(parent)
         self.umu_database = umu_database
         self.settings = settings
         self.tray = tray
         self.record = record or {}
-        self.last_time = time.time()
-        self.last_bytes = 0
+        self._check_dir = check_dir
+        # (time, bytes received) sampled at most every 0.5 s, reaching back just past SPEED_WINDOW
+        self._speed_samples: deque[tuple[float, int]] = deque([(time.monotonic(), 0)])
         self.last_speed_str = ""
+        # Download size and its formatted text; the size rarely changes between ticks
+        self._total_size = 0
+        self._total_size_str = ""
+        # Progress value and status text last shown by _show_bytes_received, so unchanged
+        # ticks skip the calls into Qt (and the str to QString conversion) altogether
+        self._shown_percent = -1
+        self._shown_status = ""
+        self._shown_bytes: tuple[int, int] | None = None
+
+        # Latest (received, total) not yet shown, and the time.monotonic() of the last repaint
+        self._pending_bytes: tuple[int, int] | None = None
+        self._last_repaint: float | None = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._show_bytes_received)
 
-        self.thread = None
         self.worker = None
         self.current_install_config = None
 
@@ -69,6 +103,10 @@ class DownloadItemWidget(QWidget):
         self.monitor_thread = None
         self.monitor_worker = None
 
+        # Post-download scan running on the thread pool, and the directory it scans
+        self._install_scan_signals: InstallScanSignals | None = None
+        self._install_scan_dir = ""
+
         self._launcher_resolver = LauncherResolver()
         self._game_installer = GameInstaller(umu_database, settings, self)
         self._game_launcher = GameLauncher()
@@ -91,11 +129,12 @@ class DownloadItemWidget(QWidget):
         self.button_layout.addWidget(self.open_folder_button)
         self.button_layout.addWidget(self.remove_button)
 
-        font_metrics = self.fontMetrics()
-        self.icon_label.setFixedWidth(font_metrics.height())
-        self.status_label.setMinimumWidth(font_metrics.horizontalAdvance("Completed (999.99 MB)") + 10)
+        font_height, status_width, button_width = self._metrics_for_font()
+        self.icon_label.setFixedWidth(font_height)
+        self.status_label.setMinimumWidth(status_width)
         self.progress_bar.setMinimumWidth(100)
-        self.progress_bar.setMaximumHeight(font_metrics.height() + 4)
+        self.progress_bar.setMaximumHeight(font_height + 4)
+        self.button_container.setFixedWidth(button_width)
 
         self.cancel_button.clicked.connect(self.cancel_download)
         self.open_folder_button.clicked.connect(self.open_folder)
@@ -110,25 +149,51 @@ class DownloadItemWidget(QWidget):
         elif self.record:
             self.update_ui_for_historic_state()
 
+    def _metrics_for_font(self) -> tuple[int, int, int]:
+        """Return (font height, status label width, button column width), measured once per distinct widget font."""
+        cls = type(self)
+        font = self.font()
+        if cls._metrics_font is None or cls._metrics_font != font:
+            font_metrics = self.fontMetrics()
+            # Reserve room for the widest button set (a completed download) so the
+            # button column keeps the same width in every row
+            widest_buttons = (self.install_button, self.open_folder_button, self.remove_button)
+            button_width = (
+                sum(button.sizeHint().width() for button in widest_buttons)
+                + max(0, self.button_layout.spacing()) * (len(widest_buttons) - 1)
+            )
+            cls._metrics = (font_metrics.height(), font_metrics.horizontalAdvance("Completed (999.99 MB)") + 10,
+                            button_width)
+            cls._metrics_font = font
+        return cls._metrics
+
+    def _warning_pixmap_for_size(self, size: QSize) -> QPixmap:
+        """Return the warning icon rasterized at *size*, reusing the pixmap of earlier widgets."""
+        cls = type(self)
+        if cls._warning_pixmap is None or cls._warning_pixmap_size != size:
+            icon = self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxWarning)
+            cls._warning_pixmap = icon.pixmap(size)
+            cls._warning_pixmap_size = size
+        return cls._warning_pixmap
+
+    def changeEvent(self, event: QEvent) -> None:
+        """Drop the cached warning pixmap and button widths when the style (and thus its icons) changes."""
+        if event.type() == QEvent.Type.StyleChange:
+            type(self)._warning_pixmap = None
+            type(self)._metrics_font = None
+        super().changeEvent(event)
+
     def _start_worker(self, worker: StreamDownloadWorker):
-        """Start the download worker thread and connect signals."""
+        """Connect the download worker's signals and run it on the shared download pool."""
         self.worker = worker
-        self.thread = QThread()
-        self.worker.moveToThread(self.thread)
 
-        self.worker.progress.connect(self.progress_bar.setValue)
+        # The worker stays in the GUI thread; signals emitted from the pool thread are queued
+        # The progress bar is driven from bytes_received so both share one throttle
         self.worker.bytes_received.connect(self._on_bytes_received)
         self.worker.finished.connect(self.on_download_finished)
         self.worker.error.connect(self.on_download_error)
 
-        self.thread.started.connect(self.worker.run)
-        self.worker.finished.connect(self.thread.quit)
-        self.worker.error.connect(self.thread.quit)
-        self.worker.finished.connect(self.worker.deleteLater)
-        self.thread.finished.connect(self.thread.deleteLater)
-
         self.worker.destroyed.connect(self._on_worker_deleted)
-        self.thread.destroyed.connect(self._on_thread_deleted)
 
         self.cancel_button.show()
         self.install_button.hide()
@@ -137,8 +202,9 @@ class DownloadItemWidget(QWidget):
         self.progress_bar.show()
         self.progress_bar.setValue(0)
         self.status_label.setText("Starting download...")
+        self._shown_percent, self._shown_status, self._shown_bytes = 0, "", None
 
-        self.thread.start()
+        download_thread_pool().start(self.worker.run)
 
     def get_widgets_for_grid(self) -> list[QWidget]:
         """Return the list of widgets to add to the download manager grid."""
@@ -164,7 +230,7 @@ class DownloadItemWidget(QWidget):
         self.status_label.setText(f"Running... ({format_size(size)})")
         self.status_label.setStyleSheet(f"color: {COLOR_STATUS_DOWNLOADING};")
 
-    def _handle_launcher_selection(self, target_dir: str) -> str | None:
+    def _handle_launcher_selection(self, target_dir: str, launcher_paths: list[str] | None = None) -> str | None:
         """Delegate to LauncherResolver and update UI on special outcomes."""
         def on_no_exe() -> None:
             self.status_label.setText("Install complete, no .exe found.")
@@ -185,6 +251,7 @@ class DownloadItemWidget(QWidget):
             on_no_exe=on_no_exe,
             on_no_launcher=on_no_launcher,
             on_cancelled=on_cancelled,
+            launcher_paths=launcher_paths,
         )
 
     def update_ui_for_historic_state(self) -> None:
@@ -202,14 +269,8 @@ class DownloadItemWidget(QWidget):
 
             self._show_completed_buttons()
 
-            target_dir = self.record.get("path", "")
-            if not os.path.isdir(target_dir):
-                self.status_label.setText("Directory not found")
-                self.status_label.setStyleSheet("color: red; font-weight: bold;")
-                self.open_folder_button.setEnabled(False)
-                self.install_button.setEnabled(False)
-                icon = self.style().standardIcon(QStyle.StandardPixmap.SP_MessageBoxWarning)
-                self.icon_label.setPixmap(icon.pixmap(self.icon_label.sizeHint()))
+            if self._check_dir and not os.path.isdir(self.record.get("path", "")):
+                self.mark_missing()
 
         elif status in ("Cancelled", "Failed"):
             self.progress_bar.hide()
@@ -217,6 +278,16 @@ class DownloadItemWidget(QWidget):
 
             self._show_failed_buttons()
 
+    def mark_missing(self) -> None:
+        """Show that the directory of a completed download no longer exists."""
+        if self.record.get("status") != "Completed":
+            return
+        self.status_label.setText("Directory not found")
+        self.status_label.setStyleSheet("color: red; font-weight: bold;")
+        self.open_folder_button.setEnabled(False)
+        self.install_button.setEnabled(False)
+        self.icon_label.setPixmap(self._warning_pixmap_for_size(self.icon_label.sizeHint()))
+
     def _on_remove_clicked(self) -> None:
         """Show a confirmation dialog to remove from list only or also delete the folder.
 
@@ -265,46 +336,93 @@ class DownloadItemWidget(QWidget):
         """Clear the worker reference when the worker object is deleted."""
         self.worker = None
 
-    @pyqtSlot()
-    def _on_thread_deleted(self) -> None:
-        """Clear the thread reference when the thread object is deleted."""
-        self.thread = None
-
     @pyqtSlot("long long", "long long")
     def _on_bytes_received(self, received: int, total: int) -> None:
-        """Update the status label with received bytes and computed download speed."""
+        """Record the byte counts and repaint at most every UI_UPDATE_INTERVAL_MS.
+
+        Nothing is repainted while the row is hidden, e.g. behind another tab;
+        the download manager calls show_pending_progress when it reappears.
+        """
         if total > 0:
             self.record["total_bytes"] = total
-        else:
+        if self._pending_bytes is None and (received, total) == self._shown_bytes:
+            return  # Repeated counts; the row already shows them
+        self._pending_bytes = (received, total)
+        if not self.progress_bar.isVisible():
+            return
+
+        if self._last_repaint is not None:
+            remaining = self.UI_UPDATE_INTERVAL_MS - (time.monotonic() - self._last_repaint) * 1000
+            if remaining > 0:
+                # Show the latest counts once the interval is over, even if no further tick arrives
+                if not self._flush_timer.isActive():
+                    self._flush_timer.start(math.ceil(remaining))
+                return
+
+        self._show_bytes_received()
+
+    @pyqtSlot()
+    def _show_bytes_received(self) -> None:
+        """Update the progress bar and status label with the pending bytes and download speed."""
+        if self._pending_bytes is None or not self.progress_bar.isVisible():
+            return
+        received, total = self._shown_bytes = self._pending_bytes
+        self._pending_bytes = None
+        now = self._last_repaint = time.monotonic()
+
+        if total <= 0:
             total = self.record.get("total_bytes", 0)
 
         if total > 0 and received > 0:
-            pct = min(int(received / total * 100), 99)
-            self.progress_bar.setValue(pct)
-
-        now = time.time()
-        elapsed = now - self.last_time
-        if elapsed > 0.5:
-            speed = max(0.0, (received - self.last_bytes) / elapsed)
+            pct = min(received * 100 // total, 99)
+            if pct != self._shown_percent:
+                self._shown_percent = pct
+                self.progress_bar.setValue(pct)
+
+        # Average over the window rather than since the last sample, which jumps with chunk bursts.
+        # The oldest kept sample is the last one at or before the window start.
+        samples = self._speed_samples
+        if now - samples[-1][0] > 0.5:
+            samples.append((now, received))
+            while now - samples[1][0] >= SPEED_WINDOW:
+                samples.popleft()
+            start_time, start_bytes = samples[0]
+            speed = max(0.0, (received - start_bytes) / (now - start_time))
             self.last_speed_str = f"({format_size(int(speed))}/s)"
-            self.last_time, self.last_bytes = now, received
 
         if total > 0:
-            self.status_label.setText(f"{format_size(received)} / {format_size(total)} {self.last_speed_str}")
+            if total != self._total_size:
+                self._total_size, self._total_size_str = total, format_size(total)
+            status = f"{format_size(received)} / {self._total_size_str} {self.last_speed_str}"
         elif received > 0:
-            self.status_label.setText(f"{format_size(received)} {self.last_speed_str}")
+            status = f"{format_size(received)} {self.last_speed_str}"
         else:
-            self.status_label.setText(f"Starting... {self.last_speed_str}")
+            status = f"Starting... {self.last_speed_str}"
+        if status != self._shown_status:
+            self._shown_status = status
+            self.status_label.setText(status)
+
+    def show_pending_progress(self) -> None:
+        """Show byte counts that arrived while the row was hidden."""
+        if self._pending_bytes is not None:
+            self._show_bytes_received()
+
+    def _discard_pending_bytes(self) -> None:
+        """Drop any coalesced progress so it cannot overwrite the final status."""
+        self._flush_timer.stop()
+        self._pending_bytes = None
 
     @pyqtSlot()
     def on_download_finished(self) -> None:
         """Handle download completion: update UI, mark record as completed, emit finished signal."""
+        self._discard_pending_bytes()
         total = self.record.get("total_bytes", 0)
         self.progress_bar.setValue(100)
         self.status_label.setText(f"Completed ({format_size(total)})")
         self.status_label.setStyleSheet("")
 
         self._show_completed_buttons()
+        self._release_worker()
 
         self.record["status"] = "Completed"
         self.finished.emit(self.record)
@@ -312,24 +430,72 @@ class DownloadItemWidget(QWidget):
     @pyqtSlot(str)
     def on_download_error(self, message: str) -> None:
         """Handle download error: hide progress bar, show failure status, emit finished signal."""
+        self._discard_pending_bytes()
         self.progress_bar.hide()
         self.status_label.setText(f"Failed: {message}")
         self.status_label.setStyleSheet("color: red;")
 
         self._show_failed_buttons()
+        self._release_worker()
 
         self.record["status"] = "Failed"
         self.finished.emit(self.record)
 
+    def _release_worker(self) -> None:
+        """Disconnect the worker after its final signal and schedule its deletion.
+
+        Nothing more reaches this row once the download has ended, and a failed
+        worker is deleted as well as a finished one.
+        """
+        if self.worker is None:
+            return
+        self.worker.bytes_received.disconnect(self._on_bytes_received)
+        self.worker.finished.disconnect(self.on_download_finished)
+        self.worker.error.disconnect(self.on_download_error)
+        self.worker.deleteLater()
+
     def proceed_to_installation(self, target_dir: str) -> None:
         """Orchestrate the installation: detect UMU game ID, show config dialog, then launch.
 
-        On Linux, searches the UMU database for a matching game, prompts the user for
-        configuration, then starts the installation via ``_start_linux_installation``.
-        On Windows, launches the selected executable directly.
+        The UMU lookup and the .exe search run on the global thread pool so the
+        UI stays responsive; ``_on_install_scan_finished`` then shows the dialogs.
+        """
+        if self._install_scan_signals is not None:
+            return  # Already scanning this download
+
+        self._install_scan_dir = target_dir
+        self.install_button.setEnabled(False)
+        self.status_label.setText("Scanning game files...")
+        self.status_label.setStyleSheet("")
+
+        # On Windows games are launched directly, so no UMU lookup is needed
+        find_umu_candidates = None if sys.platform == "win32" else self._game_installer.find_umu_candidates
+        worker = InstallScanWorker(target_dir, self._launcher_resolver.find_launcher_paths, find_umu_candidates)
+        worker.signals.finished.connect(self._on_install_scan_finished, Qt.ConnectionType.QueuedConnection)
+        worker.signals.error.connect(self._on_install_scan_error, Qt.ConnectionType.QueuedConnection)
+        # Keep the signals object alive until the queued result is delivered
+        self._install_scan_signals = worker.signals
+        QThreadPool.globalInstance().start(worker)
+
+    @pyqtSlot(dict)
+    def _on_install_scan_finished(self, scan: dict) -> None:
+        """Continue the installation with the scan results from InstallScanWorker.
+
+        On Linux, lets the user pick the UMU entry and configuration, then starts
+        the installation via ``_start_linux_installation``. On Windows, launches
+        the selected executable directly.
+
+        Args:
+            scan: Dict with ``umu_results`` and ``launcher_paths``.
         """
+        self._install_scan_signals = None
+        self.install_button.setEnabled(True)
+        self.status_label.setText(f"Completed ({format_size(self.record.get('total_bytes', 0))})")
+        target_dir = self._install_scan_dir
+        launcher_paths = scan["launcher_paths"]
+
         if sys.platform == "win32":
-            launcher_to_run = self._handle_launcher_selection(target_dir)
+            launcher_to_run = self._handle_launcher_selection(target_dir, launcher_paths)
             if launcher_to_run is None:
                 return  # User cancelled or error
 
@@ -337,7 +503,7 @@ class DownloadItemWidget(QWidget):
             return
 
         # --- Linux Logic ---
-        umu_id, store = self._game_installer.detect_umu_game_id(target_dir)
+        umu_id, store = self._game_installer.select_umu_game_id(scan["umu_results"])
         wine_prefix_path = self._game_installer.build_wine_prefix(target_dir)
         self.current_wine_prefix = wine_prefix_path
 
@@ -354,12 +520,24 @@ class DownloadItemWidget(QWidget):
 
         self.current_install_config = install_config
 
-        launcher_to_run = self._handle_launcher_selection(target_dir)
+        launcher_to_run = self._handle_launcher_selection(target_dir, launcher_paths)
         if launcher_to_run is None:
             return  # User cancelled or no .exe found
 
         self._start_linux_installation(launcher_to_run, target_dir, self.current_install_config)
 
+    @pyqtSlot(str)
+    def _on_install_scan_error(self, message: str) -> None:
+        """Let the user retry the installation after InstallScanWorker failed.
+
+        Args:
+            message: Description of the scan error.
+        """
+        self._install_scan_signals = None
+        self.install_button.setEnabled(True)
+        self.status_label.setText(f"Scan failed: {message}")
+        self.status_label.setStyleSheet("color: red;")
+
     def _start_windows_installation(self, launcher_to_run: str) -> None:
         """Launch the game executable directly via QProcess (Windows path).
 
@@ -384,10 +562,13 @@ class DownloadItemWidget(QWidget):
             target_dir: Download target directory (unused, for future use).
             install_config: Dict of environment variables and UMU settings.
         """
-        # Show loading dialog before launching
+        # Show loading dialog before launching; one instance is reused for every launch of this row
         game_name = self.filename_label.text()
-        self._loading_dialog = LaunchLoadingDialog(game_name, parent=self)
-        self._loading_dialog.show()
+        if self._loading_dialog is None:
+            self._loading_dialog = LaunchLoadingDialog(game_name, parent=self)
+            self._loading_dialog.show()
+        else:
+            self._loading_dialog.restart(game_name)
 
         proton_path = self.settings.get("PROTONPATH") if self.settings else None
         self.run_process = self._game_launcher.start_linux(
@@ -399,7 +580,6 @@ class DownloadItemWidget(QWidget):
         )
         if self.run_process is None:
             self._loading_dialog.close()
-            self._loading_dialog = None
             self.status_label.setText("Launch failed. Is 'umu-run' installed?")
             self.status_label.setStyleSheet("color: red;")
             self.current_wine_prefix = None
@@ -437,7 +617,7 @@ class DownloadItemWidget(QWidget):
             logger.info("Checking for shortcuts in: %s", shortcuts_dir)
 
             if os.path.isdir(shortcuts_dir):
-                desktop_files = glob.glob(os.path.join(shortcuts_dir, "*.desktop"))
+                desktop_files = list_files(shortcuts_dir, suffix=".desktop")
 
                 if desktop_files:
                     logger.info("Found %d potential .desktop files.", len(desktop_files))
@@ -458,9 +638,14 @@ class DownloadItemWidget(QWidget):
         else:
             logger.info("WINEPREFIX path not set or does not exist, skipping shortcut check.")
 
-        size = self.record.get("total_bytes", 0)
-        self.status_label.setText(f"Completed ({format_size(size)})")
-        self.status_label.setStyleSheet("")
+        if exit_status == QProcess.ExitStatus.CrashExit or exit_code:
+            logger.warning("umu-run process did not exit cleanly (code %s, status %s).", exit_code, exit_status)
+            self.status_label.setText(f"Crashed (code {exit_code})")
+            self.status_label.setStyleSheet("color: red;")
+        else:
+            size = self.record.get("total_bytes", 0)
+            self.status_label.setText(f"Completed ({format_size(size)})")
+            self.status_label.setStyleSheet("")
 
         self.current_install_config = None
         self.current_wine_prefix = None
@@ -3,17 +3,22 @@ import logging
 import os
 from typing import Any
 
-from PyQt6.QtGui import QCloseEvent
-from PyQt6.QtWidgets import (QGridLayout, QWidget, QScrollArea, QVBoxLayout, QPushButton, QHBoxLayout, QSpacerItem, QSizePolicy)
+from PyQt6.QtCore import QThreadPool, QTimer, Qt
+from PyQt6.QtGui import QCloseEvent, QShowEvent
+from PyQt6.QtWidgets import (QWidget, QScrollArea, QVBoxLayout, QPushButton, QHBoxLayout, QSpacerItem, QSizePolicy)
 
+from gameyfin_frontend.config import HISTORY_PAGE_SIZE, HISTORY_SAVE_DELAY_MS
 from gameyfin_frontend.settings import SettingsManager
 from gameyfin_frontend.umu_database import UmuDatabase
 from gameyfin_frontend.widgets.download_item import DownloadItemWidget
-from gameyfin_frontend.workers import StreamDownloadWorker
+from gameyfin_frontend.workers import ExistingDirsWorker, StreamDownloadWorker
 from gameyfin_frontend.services import DownloadHistoryService
 
 logger = logging.getLogger(__name__)
 
+# Stretch of the icon, filename, progress, status and button cells of a download row
+_ROW_STRETCH = (0, 4, 2, 2, 0)
+
 
 class DownloadManagerWidget(QWidget):
 
@@ -36,35 +41,60 @@ class DownloadManagerWidget(QWidget):
             settings.get_downloads_json_path()
         ) if settings else None
         self.download_records: list[dict[str, Any]] = []
-        self.widget_map: dict[DownloadItemWidget, list[QWidget]] = {}
+        # Each download's row widget, in display order; rows are added and removed
+        # without touching the others
+        self.widget_map: dict[DownloadItemWidget, QWidget] = {}
+        # Reverse index of widget_map by download URL for duplicate detection
+        self._by_url: dict[str, DownloadItemWidget] = {}
+        # History records that have no row yet, in display order; they follow all rows
+        self._unloaded_records: list[dict[str, Any]] = []
+        # Signals of running history directory checks, kept alive until their results arrive
+        self._dir_check_signals: list = []
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(HISTORY_SAVE_DELAY_MS)
+        self._save_timer.timeout.connect(self.save_history)
 
         self.main_layout = QVBoxLayout(self)
         self.scroll_area = QScrollArea(self)
         self.scroll_area.setWidgetResizable(True)
         self.scroll_content = QWidget()
 
-        self.downloads_layout = QGridLayout(self.scroll_content)
-
-        self.downloads_layout.setColumnStretch(1, 4)
-        self.downloads_layout.setColumnStretch(2, 2)
-        self.downloads_layout.setColumnStretch(3, 2)
-        self.downloads_layout.setColumnStretch(4, 1)
+        self.downloads_layout = QVBoxLayout(self.scroll_content)
+        # Trailing stretch pushes all rows to the top; rows are always inserted before it
+        self.downloads_layout.addStretch(1)
 
         self.scroll_area.setWidget(self.scroll_content)
         self.main_layout.addWidget(self.scroll_area)
 
+        # History rows are created a page at a time, as the list is scrolled to its end
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._on_scroll_value_changed)
+        scroll_bar.rangeChanged.connect(self._on_scroll_range_changed)
+
         self.load_history()
 
     def add_download_to_grid(self, controller: DownloadItemWidget) -> None:
-        """Adds a download item widget to the grid layout at the next available row."""
-        row = self.downloads_layout.rowCount()
-        widgets = controller.get_widgets_for_grid()
-        self.downloads_layout.addWidget(widgets[0], row, 0)
-        self.downloads_layout.addWidget(widgets[1], row, 1)
-        self.downloads_layout.addWidget(widgets[2], row, 2)
-        self.downloads_layout.addWidget(widgets[3], row, 3)
-        self.downloads_layout.addWidget(widgets[4], row, 4)
-        self.widget_map[controller] = widgets
+        """Adds a download item widget as the last row of the list."""
+        self.insert_row_at(self.downloads_layout.count() - 1, controller)
+
+    @staticmethod
+    def _build_row(controller: DownloadItemWidget) -> QWidget:
+        """Lay out a download's widgets in one row container.
+
+        The stretching cells ignore their size hints and are sized by stretch
+        alone, and the icon and button cells have fixed widths, so the cells
+        line up across rows although each row has its own layout.
+        """
+        row = QWidget()
+        layout = QHBoxLayout(row)
+        layout.setContentsMargins(0, 0, 0, 0)
+        for widget, stretch in zip(controller.get_widgets_for_grid(), _ROW_STRETCH):
+            if stretch:
+                widget.setSizePolicy(QSizePolicy.Policy.Ignored, widget.sizePolicy().verticalPolicy())
+            layout.addWidget(widget, stretch)
+        return row
 
     def add_download(self, worker: StreamDownloadWorker, record: dict[str, Any]) -> None:
         """Add a new download to the grid and persist it to history."""
@@ -81,17 +111,18 @@ class DownloadManagerWidget(QWidget):
         if existing_record:
             existing_controller = self.find_controller_by_record(existing_record)
             if existing_controller:
-                self.remove_download_item(existing_controller)
+                self._remove_row(existing_controller)
+            else:
+                self._unloaded_records = [r for r in self._unloaded_records if r is not existing_record]
 
         self.insert_row_at(0, controller)
-        if controller.record not in self.download_records:
-            self.download_records.insert(0, controller.record)
-
-        self.save_history()
+        # Rebuilds download_records once for the replaced row and the new one
+        self._schedule_save()
 
     def on_download_finished(self, record: dict[str, Any]) -> None:
         """Save download history, refresh prefix list, and notify on completion."""
-        self.save_history()
+        # The record was updated in place and keeps its position in download_records
+        self._schedule_write()
         if self.prefix_manager:
             self.prefix_manager.refresh_prefixes()
 
@@ -118,42 +149,91 @@ class DownloadManagerWidget(QWidget):
             self.prefix_manager.refresh_prefixes()
 
     def load_history(self) -> None:
-        """Load persisted download history from JSON and recreate widgets for each record."""
+        """Load persisted download history from JSON and create rows for its first page."""
         try:
             if self.download_history:
                 self.download_records = self.download_history.load()
-
-                for record in reversed(self.download_records):
-                    controller = DownloadItemWidget(self.umu_database, record=record, settings=self.settings)
-                    controller.remove_requested.connect(self.remove_download_item)
-                    self.add_download_to_grid(controller)
-
-            # Add a stretch row at the bottom to push all items to the top
-            self.downloads_layout.setRowStretch(self.downloads_layout.rowCount(), 1)
+                self._unloaded_records = self.download_records[::-1]
+                self._load_more_history()
 
         except (json.JSONDecodeError, OSError) as e:
             logger.error("Error loading download history: %s", e)
             self.download_records = []
 
+    def _load_more_history(self) -> None:
+        """Create rows for the next HISTORY_PAGE_SIZE history records."""
+        page = self._unloaded_records[:HISTORY_PAGE_SIZE]
+        del self._unloaded_records[:HISTORY_PAGE_SIZE]
+
+        completed = []
+        # Repaint the list once for the whole page rather than after every row
+        self.scroll_content.setUpdatesEnabled(False)
+        try:
+            for record in page:
+                controller = DownloadItemWidget(self.umu_database, record=record, settings=self.settings,
+                                                tray=self.tray, check_dir=False)
+                controller.remove_requested.connect(self.remove_download_item)
+                self.add_download_to_grid(controller)
+                if record.get("status") == "Completed":
+                    completed.append(controller)
+        finally:
+            self.scroll_content.setUpdatesEnabled(True)
+
+        if completed:
+            # Check the completed download folders off the UI thread; a slow or hung
+            # filesystem would otherwise stall startup and scrolling
+            worker = ExistingDirsWorker([controller.record.get("path", "") for controller in completed])
+            signals = worker.signals
+            signals.finished.connect(
+                lambda existing: self._on_history_dirs_checked(signals, completed, existing),
+                Qt.ConnectionType.QueuedConnection,
+            )
+            self._dir_check_signals.append(signals)
+            QThreadPool.globalInstance().start(worker)
+
+    def _on_history_dirs_checked(self, signals, controllers: list[DownloadItemWidget], existing: set[str]) -> None:
+        """Mark the rows of a history page whose download directory no longer exists."""
+        self._dir_check_signals.remove(signals)
+        for controller in controllers:
+            # Skip rows removed while the check was running
+            if controller in self.widget_map and controller.record.get("path", "") not in existing:
+                controller.mark_missing()
+
+    def _on_scroll_value_changed(self, value: int) -> None:
+        """Load more history once the list is scrolled within a page of its end."""
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        if self._unloaded_records and value >= scroll_bar.maximum() - scroll_bar.pageStep():
+            self._load_more_history()
+
+    def _on_scroll_range_changed(self, minimum: int, maximum: int) -> None:
+        """Load more history while the rows do not fill the list, leaving nothing to scroll."""
+        if self._unloaded_records and maximum <= minimum:
+            self._load_more_history()
+
+    def _current_records(self) -> list[dict[str, Any]]:
+        """Return all download records in display order, including those without a row yet."""
+        # widget_map is kept in display order, so no layout walk is needed
+        return [controller.record for controller in self.widget_map] + self._unloaded_records
+
+    def _schedule_save(self) -> None:
+        """Refresh the record list after rows were added or removed and write it shortly after."""
+        self.download_records = self._current_records()
+        self._schedule_write()
+
+    def _schedule_write(self) -> None:
+        """Write the history to disk shortly, unless a write is already pending.
+
+        Changes arriving while a write is pending ride along with it instead
+        of rewriting the history file each time.
+        """
+        if not self._save_timer.isActive():
+            self._save_timer.start()
+
     def save_history(self) -> None:
-        """Persist the current download list to JSON, preserving grid order."""
+        """Persist the current download list to JSON, preserving display order."""
+        self._save_timer.stop()
         try:
-            # Rebuild records from widget_map to ensure correct order
-            label_to_controller = {
-                widgets[1]: controller
-                for controller, widgets in self.widget_map.items()
-            }
-
-            records = []
-            for row in range(self.downloads_layout.rowCount() - 1):  # -1 to skip stretch
-                item = self.downloads_layout.itemAtPosition(row, 1)
-                if item:
-                    widget = item.widget()
-                    if not widget:
-                        continue
-                    controller = label_to_controller.get(widget)
-                    if controller:
-                        records.append(controller.record)
+            records = self._current_records()
 
             self.download_records = records
 
@@ -162,6 +242,12 @@ class DownloadManagerWidget(QWidget):
         except OSError as e:
             logger.error("Error saving download history: %s", e)
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """Catch up on progress that downloads received while this tab was hidden."""
+        super().showEvent(event)
+        for controller in self.widget_map:
+            controller.show_pending_progress()
+
     def closeEvent(self, event: QCloseEvent):
         """Persist download history before the widget is closed."""
         self.save_history()
@@ -169,10 +255,7 @@ class DownloadManagerWidget(QWidget):
 
     def find_controller_by_url(self, url: str) -> DownloadItemWidget | None:
         """Find a download controller by its URL for duplicate detection."""
-        for controller in self.widget_map.keys():
-            if controller.record.get("url") == url:
-                return controller
-        return None
+        return self._by_url.get(url)
 
     def find_controller_by_record(self, record: dict[str, Any]) -> DownloadItemWidget | None:
         """Find a download controller by its record dict."""
@@ -182,84 +265,46 @@ class DownloadManagerWidget(QWidget):
         return None
 
     def remove_download_item(self, controller: DownloadItemWidget) -> None:
-        """Remove a download widget from the grid and clean up its resources."""
-        if controller not in self.widget_map:
-            return
-
-        # Remove the old stretch row (it's at the last index)
-        current_row_count = self.downloads_layout.rowCount()
-        self.downloads_layout.setRowStretch(current_row_count - 1, 0)
-
-        widgets_to_remove = self.widget_map.pop(controller)
-
-        row_to_remove = -1
-        for i in range(current_row_count):
-            item = self.downloads_layout.itemAtPosition(i, 0)
-            if item and item.widget() == widgets_to_remove[0]:
-                row_to_remove = i
-                break
-
-        if row_to_remove == -1:
-            # Item not found, re-add stretch and exit
-            self.downloads_layout.setRowStretch(self.downloads_layout.rowCount(), 1)
-            controller.deleteLater()  # Still delete the controller
-            self.save_history()  # Re-save
-            return
-
-        # Remove all widgets from the specified row
-        for col in range(self.downloads_layout.columnCount()):
-            item = self.downloads_layout.itemAtPosition(row_to_remove, col)
-            if item:
-                widget = item.widget()
-                if widget:
-                    self.downloads_layout.removeWidget(widget)
-                    widget.deleteLater()
-
-        # Shift all subsequent rows up
-        for row in range(row_to_remove + 1, self.downloads_layout.rowCount()):
-            for col in range(self.downloads_layout.columnCount()):
-                item = self.downloads_layout.itemAtPosition(row, col)
-                if item:
-                    # Take the item from its current position
-                    taken_item = self.downloads_layout.takeAt(self.downloads_layout.indexOf(item))
-                    if taken_item:
-                        # Add it to the row above
-                        self.downloads_layout.addItem(taken_item, row - 1, col)
-
-        self.downloads_layout.setRowStretch(self.downloads_layout.rowCount() - 1, 1)
+        """Remove a download widget from the list and clean up its resources."""
+        if self._remove_row(controller):
+            self._schedule_save()
+
+    def _remove_row(self, controller: DownloadItemWidget) -> bool:
+        """Take a download's row out of the list and delete it, leaving the history alone.
+
+        Returns:
+            True if the controller had a row.
+        """
+        row = self.widget_map.pop(controller, None)
+        if row is None:
+            return False
+        url = controller.record.get("url")
+        if self._by_url.get(url) is controller:
+            del self._by_url[url]
+
+        self.downloads_layout.removeWidget(row)
+        row.deleteLater()
 
         controller.deleteLater()
-        self.save_history()
+        return True
 
     def insert_row_at(self, row_index: int, controller: DownloadItemWidget) -> None:
-        """Insert a download widget at a specific grid row, shifting existing rows down.
+        """Insert a download widget at a specific row; rows below it move down with it.
 
         Args:
             row_index: The row index to insert at.
             controller: The DownloadItemWidget to insert.
         """
-        # Remove the old stretch row
-        current_row_count = self.downloads_layout.rowCount()
-        if current_row_count > 0:
-            self.downloads_layout.setRowStretch(current_row_count - 1, 0)
-
-        # Shift all existing rows down by one
-        for row in range(current_row_count - 2, row_index - 1, -1):
-            for col in range(self.downloads_layout.columnCount()):
-                item = self.downloads_layout.itemAtPosition(row, col)
-                if item:
-                    taken_item = self.downloads_layout.takeAt(self.downloads_layout.indexOf(item))
-                    if taken_item:
-                        self.downloads_layout.addItem(taken_item, row + 1, col)
-
-        widgets = controller.get_widgets_for_grid()
-        self.downloads_layout.addWidget(widgets[0], row_index, 0)
-        self.downloads_layout.addWidget(widgets[1], row_index, 1)
-        self.downloads_layout.addWidget(widgets[2], row_index, 2)
-        self.downloads_layout.addWidget(widgets[3], row_index, 3)
-        self.downloads_layout.addWidget(widgets[4], row_index, 4)
-
-        # Re-add the stretch row at the new bottom
-        self.downloads_layout.setRowStretch(self.downloads_layout.rowCount(), 1)
-
-        self.widget_map[controller] = widgets
+        row = self._build_row(controller)
+        self.downloads_layout.insertWidget(row_index, row)
+        if row_index >= len(self.widget_map):
+            self.widget_map[controller] = row
+        elif row_index == 0:
+            self.widget_map = {controller: row, **self.widget_map}
+        else:
+            items = list(self.widget_map.items())
+            items.insert(row_index, (controller, row))
+            self.widget_map = dict(items)
+        url = controller.record.get("url")
+        if url is not None:
+            self._by_url[url] = controller
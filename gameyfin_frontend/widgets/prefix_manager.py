@@ -1,4 +1,3 @@
-import glob
 import logging
 import os
 import subprocess
@@ -12,6 +11,7 @@ from gameyfin_frontend.dialogs import InstallConfigDialog, LaunchLoadingDialog
 from gameyfin_frontend.umu_database import UmuDatabase
 from gameyfin_frontend.settings import SettingsManager
 from gameyfin_frontend.services import PrefixService, ShortcutService
+from gameyfin_frontend.utils import list_files
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +64,7 @@ class PrefixItemWidget(QWidget):
         scripts = []
         for sd in self.scripts_dirs:
             if os.path.exists(sd):
-                scripts.extend(glob.glob(os.path.join(sd, "*.sh")))
+                scripts.extend(list_files(sd, suffix=".sh"))
         scripts.sort()
 
         if not scripts:
@@ -93,9 +93,12 @@ class PrefixItemWidget(QWidget):
                 # Use the script filename (without .sh) as the display name
                 script_name = os.path.splitext(os.path.basename(script_path))[0]
 
-                # Show loading dialog before launching (keep reference to prevent GC)
-                self._loading_dialog = LaunchLoadingDialog(script_name, parent=self)
-                self._loading_dialog.show()
+                # Show loading dialog before launching (keep reference to prevent GC and reuse it)
+                if self._loading_dialog is None:
+                    self._loading_dialog = LaunchLoadingDialog(script_name, parent=self)
+                    self._loading_dialog.show()
+                else:
+                    self._loading_dialog.restart(script_name)
 
                 subprocess.Popen([script_path], cwd=os.path.dirname(script_path),
                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
@@ -114,7 +117,7 @@ class PrefixItemWidget(QWidget):
                                 "Shortcuts are usually captured during the installation process.")
             return
 
-        desktop_files = glob.glob(os.path.join(shortcuts_dir, "*.desktop"))
+        desktop_files = list_files(shortcuts_dir, suffix=".desktop")
         if not desktop_files:
             QMessageBox.warning(self, "No Shortcuts Found", "No .desktop files found in the proton_shortcuts directory.")
             return
@@ -268,7 +271,7 @@ class PrefixManagerWidget(QWidget):
         initial_config, _scripts_dir = self.prefix_service.load_config_from_scripts_dir(game_name)
 
         dialog = InstallConfigDialog(
-            umu_database=self.umu_database,
+            db_provider=lambda: self.umu_database,
             parent=self,
             wine_prefix_path=prefix_path,
             initial_config=initial_config
@@ -1,20 +1,78 @@
 import logging
 import os
+import queue
+import threading
 import time
-from typing import Any
+from typing import Any, Callable, Iterator
 
 import requests
 from stream_unzip import stream_unzip
-from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QThread
+from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot, QThread, QThreadPool, QRunnable
 
-from .config import DOWNLOAD_CHUNK_SIZE, PROGRESS_SIGNAL_INTERVAL
+from .config import DOWNLOAD_CHUNK_SIZE, DOWNLOAD_READ_AHEAD_CHUNKS, MAX_CONCURRENT_DOWNLOADS, PROGRESS_SIGNAL_INTERVAL
+from .utils import find_existing_dirs
 
 logger = logging.getLogger(__name__)
 
+# Pool running StreamDownloadWorker.run, created by download_thread_pool()
+_DOWNLOAD_POOL: QThreadPool | None = None
+
+
+def download_thread_pool() -> QThreadPool:
+    """Return the pool that runs downloads, reusing its threads between downloads.
+
+    Downloads block for their whole duration, so they get their own pool rather
+    than occupying the global one used for short tasks like UMU searches.
+    """
+    global _DOWNLOAD_POOL
+    if _DOWNLOAD_POOL is None:
+        _DOWNLOAD_POOL = QThreadPool()
+        _DOWNLOAD_POOL.setMaxThreadCount(MAX_CONCURRENT_DOWNLOADS)
+    return _DOWNLOAD_POOL
+
+
+def _read_ahead(chunks: Iterator[bytes], depth: int) -> Iterator[bytes]:
+    """Yield the items of *chunks* while a background thread fetches up to *depth* of them ahead.
+
+    Socket reads, zlib and file writes all release the GIL, so receiving the next
+    chunks overlaps with extracting the current one. An exception raised by
+    *chunks* is re-raised here, after the chunks read before it.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    stopped = threading.Event()
+    end = object()
+
+    def put(item: Any) -> bool:
+        """Queue *item*, giving up once the consumer has stopped."""
+        while not stopped.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def fetch() -> None:
+        try:
+            for chunk in chunks:
+                if not put(chunk):
+                    return
+        except Exception as e:  # Handed to the consumer, which handles it as before
+            put(e)
+        else:
+            put(end)
+
+    threading.Thread(target=fetch, name="download-read-ahead", daemon=True).start()
+    try:
+        while (item := buffer.get()) is not end:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+
 
 class StreamDownloadWorker(QObject):
-    progress = pyqtSignal(int)
-    current_file = pyqtSignal(str)
     bytes_received = pyqtSignal("long long", "long long")
     finished = pyqtSignal()
     error = pyqtSignal(str)
@@ -22,7 +80,7 @@ class StreamDownloadWorker(QObject):
     def __init__(self, url: str, target_dir: str, cookies: dict[str, Any] | None = None, estimated_total: int = 0, bandwidth_limit: int = 0) -> None:
         """Initialize a background worker that streams a URL to a directory while unzipping.
 
-        Emits progress, bytes_received, current_file, finished, and error signals.
+        Emits bytes_received, finished, and error signals.
 
         Args:
             url: The URL to download from.
@@ -70,8 +128,6 @@ class StreamDownloadWorker(QObject):
                     now = time.monotonic()
                     if now - last_signal_time >= PROGRESS_SIGNAL_INTERVAL:
                         self.bytes_received.emit(received, total)
-                        if total > 0:
-                            self.progress.emit(min(int(received / total * 100), 99))
                         last_signal_time = now
                     # Bandwidth throttling: sleep if we're going too fast
                     if self.bandwidth_limit > 0:
@@ -83,7 +139,13 @@ class StreamDownloadWorker(QObject):
                         chunk_bytes = 0
                     yield chunk
 
-            for file_name, _file_size, unzipped_chunks in stream_unzip(http_chunks()):
+            # Directories known to exist, so members sharing a directory skip the makedirs syscalls
+            known_dirs = {real_target}
+            # Resolved parent directories, so members sharing a directory resolve its path once
+            real_parents: dict[str, str] = {}
+
+            for file_name, _file_size, unzipped_chunks in stream_unzip(
+                    _read_ahead(http_chunks(), DOWNLOAD_READ_AHEAD_CHUNKS)):
                 if not self._is_running:
                     for _ in unzipped_chunks:
                         pass
@@ -91,23 +153,36 @@ class StreamDownloadWorker(QObject):
                     return
 
                 name_str = file_name.decode('utf-8', errors='replace')
-                self.current_file.emit(f"Extracting: {name_str}")
 
-                target_path = os.path.realpath(os.path.join(self.target_dir, name_str))
+                member_path = os.path.join(self.target_dir, name_str)
+                parent, base = os.path.split(member_path)
+                if base in ("", ".", ".."):
+                    target_path = os.path.realpath(member_path)
+                else:
+                    real_parent = real_parents.get(parent)
+                    if real_parent is None:
+                        real_parent = real_parents[parent] = os.path.realpath(parent)
+                    target_path = os.path.join(real_parent, base)
+                    # Extraction never creates links, but the target dir may hold some from before
+                    if os.path.islink(target_path):
+                        target_path = os.path.realpath(target_path)
                 if not target_path.startswith(real_target + os.sep) and target_path != real_target:
                     for _ in unzipped_chunks:
                         pass
                     continue
 
                 if name_str.endswith('/'):
-                    os.makedirs(target_path, exist_ok=True)
+                    if target_path not in known_dirs:
+                        os.makedirs(target_path, exist_ok=True)
+                        known_dirs.add(target_path)
                     for _ in unzipped_chunks:
                         pass
                     continue
 
                 parent_dir = os.path.dirname(target_path)
-                if parent_dir:
+                if parent_dir and parent_dir not in known_dirs:
                     os.makedirs(parent_dir, exist_ok=True)
+                    known_dirs.add(parent_dir)
 
                 with open(target_path, 'wb') as f:
                     for chunk in unzipped_chunks:
@@ -116,7 +191,6 @@ class StreamDownloadWorker(QObject):
                             return
                         f.write(chunk)
 
-            self.progress.emit(100)
             self.finished.emit()
 
         except requests.exceptions.RequestException as e:
@@ -163,12 +237,12 @@ class ProcessMonitorWorker(QThread):
             logger.warning("ProcessMonitor: Invalid PID (%s), stopping.", self.pid)
             return
 
-        logger.info("ProcessMonitor: Monitoring PID %s", self.pid)
+        logger.debug("ProcessMonitor: Monitoring PID %s", self.pid)
         while self._running:
             try:
                 os.kill(self.pid, 0)
             except OSError:
-                logger.info("ProcessMonitor: PID %s finished.", self.pid)
+                logger.debug("ProcessMonitor: PID %s finished.", self.pid)
                 self._running = False
                 break
             else:
@@ -176,9 +250,136 @@ class ProcessMonitorWorker(QThread):
                     break
                 self.msleep(1000)
 
-        logger.info("ProcessMonitor: Stopping monitor for %s", self.pid)
+        logger.debug("ProcessMonitor: Stopping monitor for %s", self.pid)
         self.finished.emit()
 
     def stop(self) -> None:
         """Stops the process monitor thread."""
         self._running = False
+
+
+class UmuSearchSignals(QObject):
+    """Signals emitted by UmuSearchWorker (QRunnable cannot define signals itself)."""
+
+    finished = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+
+class UmuSearchWorker(QRunnable):
+    """Runs a UMU partial-title search on a QThreadPool thread."""
+
+    def __init__(self, umu_database: Any, title: str) -> None:
+        """Initialize a search worker.
+
+        Args:
+            umu_database: UmuDatabase instance to search.
+            title: Partial game title to search for.
+        """
+        super().__init__()
+        self.umu_database = umu_database
+        self.title = title
+        self.signals = UmuSearchSignals()
+
+    def run(self) -> None:
+        """Search the UMU database and emit the matching entries that carry a umu_id."""
+        try:
+            results = self.umu_database.search_by_partial_title(self.title)
+
+            processed_list = []
+            if isinstance(results, list):
+                processed_list = results
+            elif isinstance(results, dict) and results.get("umu_id"):
+                processed_list = [results]
+
+            self.signals.finished.emit([entry for entry in processed_list if entry.get("umu_id")])
+        except (ValueError, KeyError, TypeError, RuntimeError) as e:
+            logger.error("Search error for title '%s': %s", self.title, e)
+            self.signals.error.emit(str(e))
+
+
+class DesktopNameSignals(QObject):
+    """Signals emitted by DesktopNameWorker."""
+
+    finished = pyqtSignal(list)
+
+
+class DesktopNameWorker(QRunnable):
+    """Reads the display names of a chunk of .desktop files on a QThreadPool thread."""
+
+    def __init__(self, file_paths: list[str], parse_name: Callable[[str], str]) -> None:
+        """Initialize a name-parsing worker.
+
+        Args:
+            file_paths: The .desktop files to read.
+            parse_name: Callable returning the display name for a file path.
+        """
+        super().__init__()
+        self.file_paths = file_paths
+        self.parse_name = parse_name
+        self.signals = DesktopNameSignals()
+
+    def run(self) -> None:
+        """Emit a list of (file_path, name) pairs for the chunk."""
+        self.signals.finished.emit([(path, self.parse_name(path)) for path in self.file_paths])
+
+
+class InstallScanSignals(QObject):
+    """Signals emitted by InstallScanWorker."""
+
+    finished = pyqtSignal(dict)
+    error = pyqtSignal(str)
+
+
+class InstallScanWorker(QRunnable):
+    """Looks up UMU entries and enumerates launchers for a downloaded game on a QThreadPool thread."""
+
+    def __init__(self, target_dir: str, find_launcher_paths: Callable[[str], list[str]],
+                 find_umu_candidates: Callable[[str], list[dict[str, Any]]] | None = None) -> None:
+        """Initialize a post-download scan worker.
+
+        Args:
+            target_dir: Download target directory containing the game.
+            find_launcher_paths: Callable returning the .exe paths under a directory.
+            find_umu_candidates: Optional callable returning the UMU entries for a
+                directory; skipped (empty results) when None.
+        """
+        super().__init__()
+        self.target_dir = target_dir
+        self.find_launcher_paths = find_launcher_paths
+        self.find_umu_candidates = find_umu_candidates
+        self.signals = InstallScanSignals()
+
+    def run(self) -> None:
+        """Emit a dict with the ``umu_results`` and ``launcher_paths`` for the directory."""
+        try:
+            umu_results = self.find_umu_candidates(self.target_dir) if self.find_umu_candidates else []
+            launcher_paths = self.find_launcher_paths(self.target_dir)
+        except (ValueError, KeyError, TypeError, RuntimeError, OSError) as e:
+            logger.error("Install scan error for '%s': %s", self.target_dir, e)
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit({"umu_results": umu_results, "launcher_paths": launcher_paths})
+
+
+class ExistingDirsSignals(QObject):
+    """Signals emitted by ExistingDirsWorker."""
+
+    finished = pyqtSignal(set)
+
+
+class ExistingDirsWorker(QRunnable):
+    """Checks which download directories still exist on a QThreadPool thread."""
+
+    def __init__(self, paths: list[str]) -> None:
+        """Initialize a directory check worker.
+
+        Args:
+            paths: Directory paths to check.
+        """
+        super().__init__()
+        self.paths = paths
+        self.signals = ExistingDirsSignals()
+
+    def run(self) -> None:
+        """Emit the subset of the paths that are existing directories."""
+        self.signals.finished.emit(find_existing_dirs(self.paths))
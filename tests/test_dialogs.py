@@ -88,6 +88,42 @@ class TestInstallConfigDialog:
         assert config["CUSTOM_VAR"] == "value123"
         assert config["ANOTHER"] == "foo"
 
+    def test_get_config_keeps_initial_extra_vars(self, qtbot, mock_umu_database):
+        from gameyfin_frontend.dialogs import InstallConfigDialog
+        dialog = InstallConfigDialog(
+            umu_database=mock_umu_database,
+            initial_config={"MANGOHUD": "1", "DXVK_HUD": "fps", "WINEDEBUG": "-all"},
+        )
+        qtbot.addWidget(dialog)
+        assert dialog.extra_vars_input.toPlainText() == "DXVK_HUD=fps\nWINEDEBUG=-all"
+        config = dialog.get_config()
+        assert config["DXVK_HUD"] == "fps"
+        assert config["WINEDEBUG"] == "-all"
+
+        dialog.extra_vars_input.setPlainText("  DXVK_HUD = full \nnot a var\n=orphan\n# WINEDEBUG=+all\nOPTS=a=b")
+        config = dialog.get_config()
+        assert config["DXVK_HUD"] == "full"
+        assert config["OPTS"] == "a=b"
+        assert "WINEDEBUG" not in config
+        assert "# WINEDEBUG" not in config
+        assert "" not in config
+
+    def test_get_config_normalizes_unedited_initial_extra_vars(self, qtbot, mock_umu_database):
+        from gameyfin_frontend.dialogs import InstallConfigDialog
+        dialog = InstallConfigDialog(
+            umu_database=mock_umu_database,
+            initial_config={" DXVK_HUD ": " fps ", "WINE_LARGE_ADDRESS_AWARE": 1},
+        )
+        qtbot.addWidget(dialog)
+        unedited = dialog.get_config()
+        # Re-parsing the same text must give the same variables as the cached ones
+        dialog.extra_vars_input.setPlainText(dialog.extra_vars_input.toPlainText() + "\n")
+        reparsed = dialog.get_config()
+        assert unedited == reparsed
+        assert unedited["DXVK_HUD"] == "fps"
+        assert unedited["WINE_LARGE_ADDRESS_AWARE"] == "1"
+        assert " DXVK_HUD " not in unedited
+
     def test_get_config_with_store_none(self, qtbot, mock_umu_database):
         from gameyfin_frontend.dialogs import InstallConfigDialog
         dialog = InstallConfigDialog(umu_database=mock_umu_database)
@@ -104,6 +140,105 @@ class TestInstallConfigDialog:
         config = dialog.get_config()
         assert config["STORE"] == "steam"
 
+    def test_search_runs_on_thread_pool_and_populates_fields(self, qtbot, mock_umu_database):
+        from gameyfin_frontend.dialogs import InstallConfigDialog, SelectUmuIdDialog
+        mock_umu_database.search_by_partial_title.return_value = [
+            {"umu_id": "UMU-1", "title": "Game A", "store": "steam"},
+        ]
+        dialog = InstallConfigDialog(umu_database=mock_umu_database)
+        qtbot.addWidget(dialog)
+        with patch("gameyfin_frontend.dialogs.QInputDialog.getText", return_value=("game a", True)), \
+             patch.object(SelectUmuIdDialog, "exec", return_value=SelectUmuIdDialog.DialogCode.Accepted), \
+             patch.object(SelectUmuIdDialog, "get_selected_entry",
+                          return_value={"umu_id": "UMU-1", "store": "steam"}):
+            dialog.search_for_game_id()
+            qtbot.waitUntil(lambda: dialog.search_action.isEnabled(), timeout=2000)
+        assert dialog.gameid_input.text() == "UMU-1"
+        assert dialog.store_combo.currentText() == "steam"
+
+    def test_db_provider_is_only_called_on_search(self, qtbot, mock_umu_database):
+        from gameyfin_frontend.dialogs import InstallConfigDialog
+        provider = MagicMock(return_value=mock_umu_database)
+        dialog = InstallConfigDialog(db_provider=provider)
+        qtbot.addWidget(dialog)
+        provider.assert_not_called()
+        with patch("gameyfin_frontend.dialogs.QInputDialog.getText", return_value=("game", True)), \
+             patch("gameyfin_frontend.dialogs.QMessageBox.information"):
+            dialog.search_for_game_id()
+            qtbot.waitUntil(lambda: dialog.search_action.isEnabled(), timeout=2000)
+        provider.assert_called_once_with()
+        mock_umu_database.search_by_partial_title.assert_called_once_with("game")
+
+    def test_run_winecfg_starts_umu_without_shell(self, qtbot, mock_umu_database, tmp_path):
+        from gameyfin_frontend.dialogs import InstallConfigDialog
+        prefix = str(tmp_path / "game_pfx")
+        dialog = InstallConfigDialog(umu_database=mock_umu_database, wine_prefix_path=prefix)
+        qtbot.addWidget(dialog)
+        with patch("gameyfin_frontend.dialogs.QProcess") as mock_process_cls:
+            mock_process_cls.return_value.startDetached.return_value = (True, 1234)
+            dialog.run_winecfg()
+        process = mock_process_cls.return_value
+        process.setProgram.assert_called_once_with("umu-run")
+        process.setArguments.assert_called_once_with(["winecfg"])
+        env = process.setProcessEnvironment.call_args[0][0]
+        assert env.value("WINEPREFIX") == prefix
+        assert env.value("PROTONPATH") == "GE-Proton"
+        assert os.path.isdir(prefix)
+
+    def test_base_process_env_returns_independent_copies(self):
+        from gameyfin_frontend.dialogs import _base_process_env
+        first = _base_process_env()
+        first.insert("WINEPREFIX", "/tmp/one_pfx")
+        second = _base_process_env()
+        assert second.value("WINEPREFIX") != "/tmp/one_pfx"
+
+    def test_store_list_follows_settings(self, qtbot, mock_umu_database, mock_settings):
+        from gameyfin_frontend.dialogs import InstallConfigDialog
+        dialog = InstallConfigDialog(umu_database=mock_umu_database, settings=mock_settings)
+        qtbot.addWidget(dialog)
+        assert dialog.store_combo.count() == 3
+
+        mock_settings._data["GF_UMU_DB_STORES"] = ["none", "gog"]
+        dialog = InstallConfigDialog(umu_database=mock_umu_database, settings=mock_settings)
+        qtbot.addWidget(dialog)
+        assert dialog.store_combo.count() == 2
+
+    def test_title_completer_fills_umu_id_and_store(self, qtbot, mock_umu_database):
+        from PyQt6.QtCore import QEvent, Qt
+        from PyQt6.QtGui import QFocusEvent
+        from PyQt6.QtWidgets import QApplication
+        from gameyfin_frontend.dialogs import InstallConfigDialog
+        mock_umu_database.cached_titles.return_value = ["The Witcher 3", "Hades"]
+        mock_umu_database.get_cached_games_by_title.return_value = [
+            {"umu_id": "umu-292030", "title": "The Witcher 3", "store": "gog"}
+        ]
+        dialog = InstallConfigDialog(umu_database=mock_umu_database, settings=None)
+        qtbot.addWidget(dialog)
+        assert dialog.gameid_input.completer() is None
+
+        QApplication.sendEvent(dialog.gameid_input, QFocusEvent(QEvent.Type.FocusIn))
+        completer = dialog.gameid_input.completer()
+        assert completer.filterMode() == Qt.MatchFlag.MatchContains
+        assert completer.model().stringList() == ["The Witcher 3", "Hades"]
+
+        completer.activated[str].emit("The Witcher 3")
+        qtbot.waitUntil(lambda: dialog.gameid_input.text() == "umu-292030")
+        assert dialog.store_combo.currentText() == "gog"
+        mock_umu_database.get_cached_games_by_title.assert_called_once_with("The Witcher 3")
+
+    def test_title_completer_restores_text_without_match(self, qtbot, mock_umu_database):
+        from PyQt6.QtCore import QEvent
+        from PyQt6.QtGui import QFocusEvent
+        from PyQt6.QtWidgets import QApplication
+        from gameyfin_frontend.dialogs import InstallConfigDialog
+        mock_umu_database.cached_titles.return_value = ["Hades"]
+        mock_umu_database.get_cached_games_by_title.return_value = [{"title": "Hades", "store": "steam"}]
+        dialog = InstallConfigDialog(umu_database=mock_umu_database, settings=None)
+        qtbot.addWidget(dialog)
+        QApplication.sendEvent(dialog.gameid_input, QFocusEvent(QEvent.Type.FocusIn))
+        dialog.gameid_input.completer().activated[str].emit("Hades")
+        qtbot.waitUntil(lambda: mock_umu_database.get_cached_games_by_title.called)
+        assert dialog.gameid_input.text() == "umu-default"
 
 class TestSelectLauncherDialog:
     def test_dialog_initializes(self, qtbot):
@@ -116,7 +251,19 @@ class TestSelectLauncherDialog:
         from gameyfin_frontend.dialogs import SelectLauncherDialog
         dialog = SelectLauncherDialog("/target/dir", ["/target/dir/game.exe", "/target/dir/launcher.exe"])
         qtbot.addWidget(dialog)
-        assert dialog.list_widget.count() == 2
+        assert dialog.model.rowCount() == 2
+
+    def test_displays_paths_relative_to_target_dir(self, qtbot):
+        from gameyfin_frontend.dialogs import SelectLauncherDialog
+        dialog = SelectLauncherDialog("/target/dir", ["/target/dir/bin/game.exe"])
+        qtbot.addWidget(dialog)
+        assert dialog.model.data(dialog.model.index(0)) == os.path.join("bin", "game.exe")
+
+    def test_displays_relpath_outside_target_dir(self, qtbot):
+        from gameyfin_frontend.dialogs import SelectLauncherDialog
+        dialog = SelectLauncherDialog("/target/dir", ["/target/other/game.exe"])
+        qtbot.addWidget(dialog)
+        assert dialog.model.data(dialog.model.index(0)) == os.path.join("..", "other", "game.exe")
 
     def test_ok_button_disabled_initially(self, qtbot):
         from gameyfin_frontend.dialogs import SelectLauncherDialog
@@ -128,7 +275,7 @@ class TestSelectLauncherDialog:
         from gameyfin_frontend.dialogs import SelectLauncherDialog
         dialog = SelectLauncherDialog("/target/dir", ["/target/dir/game.exe"])
         qtbot.addWidget(dialog)
-        dialog.list_widget.setCurrentRow(0)
+        dialog.list_view.setCurrentIndex(dialog.model.index(0))
         assert dialog.ok_button.isEnabled() is True
 
     def test_get_selected_launcher(self, qtbot):
@@ -136,7 +283,7 @@ class TestSelectLauncherDialog:
         paths = ["/target/dir/a.exe", "/target/dir/b.exe"]
         dialog = SelectLauncherDialog("/target/dir", paths)
         qtbot.addWidget(dialog)
-        dialog.list_widget.setCurrentRow(1)
+        dialog.list_view.setCurrentIndex(dialog.model.index(1))
         result = dialog.get_selected_launcher()
         assert result == "/target/dir/b.exe"
 
@@ -166,14 +313,14 @@ class TestSelectUmuIdDialog:
         ]
         dialog = SelectUmuIdDialog(results)
         qtbot.addWidget(dialog)
-        assert dialog.list_widget.count() == 1
+        assert dialog.model.rowCount() == 1
 
     def test_display_text_includes_store(self, qtbot):
         from gameyfin_frontend.dialogs import SelectUmuIdDialog
         results = [{"umu_id": "UMU-1", "title": "Test Game", "store": "steam"}]
         dialog = SelectUmuIdDialog(results)
         qtbot.addWidget(dialog)
-        item_text = dialog.list_widget.item(0).text()
+        item_text = dialog.model.data(dialog.model.index(0))
         assert "Test Game" in item_text
         assert "steam" in item_text
 
@@ -185,7 +332,7 @@ class TestSelectUmuIdDialog:
         ]
         dialog = SelectUmuIdDialog(results)
         qtbot.addWidget(dialog)
-        dialog.list_widget.setCurrentRow(1)
+        dialog.list_view.setCurrentIndex(dialog.model.index(1))
         entry = dialog.get_selected_entry()
         assert entry["umu_id"] == "UMU-2"
         assert entry["store"] == "gog"
@@ -260,6 +407,7 @@ class TestSelectShortcutsDialog:
         dialog.deselect_all()
         for cb, _ in dialog.desktop_checkboxes + dialog.apps_checkboxes:
             assert not cb.isChecked()
+        assert dialog.scroll_content.updatesEnabled()
 
     def test_get_selected_files(self, qtbot, tmp_path):
         from gameyfin_frontend.dialogs import SelectShortcutsDialog
@@ -276,12 +424,52 @@ class TestSelectShortcutsDialog:
         assert f1 in desktop_selected
         assert f2 not in desktop_selected
 
+    def test_many_files_are_parsed_on_thread_pool(self, qtbot, tmp_path):
+        from PyQt6.QtWidgets import QDialogButtonBox
+        from gameyfin_frontend.dialogs import SelectShortcutsDialog
+        desktop_files = []
+        for i in range(12):
+            path = tmp_path / f"game{i}.desktop"
+            path.write_text(f"[Desktop Entry]\nName=Game {i}\n")
+            desktop_files.append(str(path))
+        dialog = SelectShortcutsDialog(desktop_files)
+        qtbot.addWidget(dialog)
+        ok_button = dialog.button_box.button(QDialogButtonBox.StandardButton.Ok)
+        assert not ok_button.isEnabled()
+        qtbot.waitUntil(lambda: len(dialog.apps_checkboxes) == 12, timeout=2000)
+        assert ok_button.isEnabled()
+        assert [cb.text() for cb, _ in dialog.desktop_checkboxes] == [f"Game {i}" for i in range(12)]
+        assert [fp for _, fp in dialog.apps_checkboxes] == desktop_files
+
     def test_parse_desktop_name(self):
         from gameyfin_frontend.dialogs import SelectShortcutsDialog
         # Should return basename if file is not a valid desktop file
         result = SelectShortcutsDialog.parse_desktop_name("/some/path/file.txt")
         assert result == "file.txt"
 
+    def test_parse_desktop_name_reads_name(self, valid_desktop_file):
+        from gameyfin_frontend.dialogs import SelectShortcutsDialog
+        assert SelectShortcutsDialog.parse_desktop_name(valid_desktop_file) == "TestGame"
+
+    def test_parse_desktop_name_without_header(self, desktop_file_missing_header):
+        from gameyfin_frontend.dialogs import SelectShortcutsDialog
+        assert SelectShortcutsDialog.parse_desktop_name(desktop_file_missing_header) == "TestGameNoHeader"
+
+    def test_parse_desktop_name_ignores_other_groups(self, tmp_path):
+        from gameyfin_frontend.dialogs import SelectShortcutsDialog
+        path = tmp_path / "game.desktop"
+        path.write_text("[Desktop Action Play]\nName=Play\n\n[Desktop Entry]\nName[de]=Spiel\nName = Game\n")
+        assert SelectShortcutsDialog.parse_desktop_name(str(path)) == "Game"
+
+    def test_parse_desktop_name_reads_utf8(self, tmp_path):
+        from gameyfin_frontend.dialogs import SelectShortcutsDialog
+        path = tmp_path / "game.desktop"
+        path.write_bytes("[Desktop Entry]\nName=Spiel f\u00fcr Zwei\n".encode("utf-8"))
+        with patch("builtins.open", wraps=open) as opened:
+            assert SelectShortcutsDialog.parse_desktop_name(str(path)) == "Spiel f\u00fcr Zwei"
+        # Independent of the locale, like parse_desktop_file
+        assert opened.call_args.kwargs["encoding"] == "utf-8"
+
 
 class TestLaunchLoadingDialog:
     def test_dialog_initializes(self, qtbot):
@@ -330,6 +518,27 @@ class TestLaunchLoadingDialog:
         assert dialog._safety_timer is not None
         assert dialog._safety_timer.isActive()
 
+    def test_restart_reuses_closed_dialog(self, qtbot):
+        from gameyfin_frontend.dialogs import LaunchLoadingDialog
+        dialog = LaunchLoadingDialog(game_name="First")
+        qtbot.addWidget(dialog)
+        dialog.show()
+        dialog._wineserver_running = lambda: True
+        dialog._on_poll()
+        dialog._grace_timer.timeout.emit()
+        assert not dialog.isVisible()
+        assert not dialog._poll_timer.isActive()
+
+        dialog._wineserver_running = lambda: False
+        dialog.restart("Second")
+        assert dialog.isVisible()
+        assert dialog.name_label.text() == "Launching Second…"
+        assert not dialog._wineserver_detected
+        assert not dialog._grace_timer.isActive()
+        assert dialog._poll_timer.isActive()
+        assert dialog._safety_timer.isActive()
+        dialog.close()
+
     def test_spinner_animates(self, qtbot):
         from gameyfin_frontend.dialogs import _SpinnerWidget
         spinner = _SpinnerWidget()
@@ -25,6 +25,7 @@ class TestFormatSize:
 
     def test_terabytes(self):
         assert format_size(1099511627776) == "1.00 TB"
+        assert format_size(1 << 50) == "1024.00 TB"
 
     def test_precision(self):
         result = format_size(1234567890)
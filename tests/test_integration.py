@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import os
+import threading
 import time
 from collections import defaultdict
 from unittest.mock import MagicMock
@@ -186,6 +187,26 @@ class TestDownloadHistoryRoundTrip:
         loaded = service.load()
         assert loaded == []
 
+    def test_loads_indented_history_from_older_versions(self, tmp_app_data):
+        """Histories written indented by earlier versions still load, non-ASCII names included."""
+        json_path = os.path.join(tmp_app_data, "downloads.json")
+        records = [{"url": "http://example.com/spiel.zip", "filename": "Spiel für Zwei.zip", "status": "Completed"}]
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, indent=4, ensure_ascii=False)
+
+        service = DownloadHistoryService(json_path)
+        assert service.load() == records
+        service.save(records)
+        assert service.load() == records
+
+    def test_undecodable_history_file(self, tmp_app_data):
+        """A history file that is not valid text loads as empty."""
+        json_path = os.path.join(tmp_app_data, "downloads.json")
+        with open(json_path, "wb") as f:
+            f.write(b'[{"filename": "\xff\xfe"}]')
+
+        assert DownloadHistoryService(json_path).load() == []
+
 
 class TestDownloadAddRemoveCycle:
     """Test the full download add/remove lifecycle with DownloadManagerWidget."""
@@ -210,8 +231,8 @@ class TestDownloadAddRemoveCycle:
         )
         qtbot.addWidget(widget)
 
-        # Verify grid is empty initially (empty row 0 + stretch row at bottom)
-        assert widget.downloads_layout.rowCount() == 2
+        # Verify the list is empty initially (only the stretch at the bottom)
+        assert widget.downloads_layout.count() == 1
 
     def test_load_history_and_verify_widgets(self, qtbot, mock_umu_database, tmp_app_data):
         """Load persisted history and verify widgets are created for each record."""
@@ -277,6 +298,169 @@ class TestDownloadAddRemoveCycle:
         # Verify only one item remains
         assert len(widget.widget_map) == 1
 
+    def test_insert_and_remove_keep_row_order(self, qtbot, mock_umu_database, tmp_app_data):
+        """Rows inserted at the top and removed from the middle keep the saved order.
+
+        History loads newest first, so the pre-populated rows show as b, a.
+        """
+        from gameyfin_frontend.widgets.download_manager import DownloadManagerWidget
+        from gameyfin_frontend.widgets.download_item import DownloadItemWidget
+        from unittest.mock import MagicMock
+
+        json_path = os.path.join(tmp_app_data, "downloads.json")
+        service = DownloadHistoryService(json_path)
+        service.save([
+            {"url": "http://example.com/a.zip", "filename": "a.zip", "path": "/tmp/a", "status": "Failed"},
+            {"url": "http://example.com/b.zip", "filename": "b.zip", "path": "/tmp/b", "status": "Failed"},
+        ])
+
+        settings_mock = MagicMock()
+        settings_mock.get_downloads_json_path.return_value = json_path
+
+        widget = DownloadManagerWidget(umu_database=mock_umu_database, settings=settings_mock)
+        qtbot.addWidget(widget)
+
+        record = {"url": "http://example.com/c.zip", "filename": "c.zip", "path": "/tmp/c", "status": "Failed"}
+        new_controller = DownloadItemWidget(mock_umu_database, record=record, settings=settings_mock)
+        widget.insert_row_at(0, new_controller)
+        widget.save_history()
+        assert [r["filename"] for r in widget.download_records] == ["c.zip", "b.zip", "a.zip"]
+
+        middle = widget.find_controller_by_url("http://example.com/b.zip")
+        widget.remove_download_item(middle)
+        assert [r["filename"] for r in widget.download_records] == ["c.zip", "a.zip"]
+        assert widget.downloads_layout.count() == 3  # two rows + the stretch
+
+    def test_removals_are_written_once(self, qtbot, mock_umu_database, tmp_app_data):
+        """A burst of removals updates the records at once and writes the history a single time."""
+        from gameyfin_frontend.widgets.download_manager import DownloadManagerWidget
+        from unittest.mock import MagicMock
+
+        json_path = os.path.join(tmp_app_data, "downloads.json")
+        service = DownloadHistoryService(json_path)
+        service.save([
+            {"url": f"http://example.com/{name}.zip", "filename": f"{name}.zip", "path": f"/tmp/{name}", "status": "Failed"}
+            for name in ("a", "b", "c")
+        ])
+
+        settings_mock = MagicMock()
+        settings_mock.get_downloads_json_path.return_value = json_path
+
+        widget = DownloadManagerWidget(umu_database=mock_umu_database, settings=settings_mock)
+        qtbot.addWidget(widget)
+        widget.download_history.save = MagicMock(wraps=widget.download_history.save)
+
+        widget.remove_download_item(widget.find_controller_by_url("http://example.com/a.zip"))
+        widget.remove_download_item(widget.find_controller_by_url("http://example.com/b.zip"))
+        assert [r["filename"] for r in widget.download_records] == ["c.zip"]
+        widget.download_history.save.assert_not_called()
+
+        qtbot.waitUntil(lambda: widget.download_history.save.called)
+        widget.download_history.save.assert_called_once()
+        assert [r["filename"] for r in service.load()] == ["c.zip"]
+        assert not os.path.exists(json_path + ".tmp")
+
+    def test_redownload_replaces_the_existing_row(self, qtbot, mock_umu_database, tmp_app_data):
+        """Downloading a URL again swaps its row for a new one at the top, keeping a single record."""
+        from gameyfin_frontend.widgets.download_manager import DownloadManagerWidget
+        from unittest.mock import MagicMock, patch
+
+        json_path = os.path.join(tmp_app_data, "downloads.json")
+        DownloadHistoryService(json_path).save([
+            {"url": f"http://example.com/{name}.zip", "filename": f"{name}.zip", "path": f"/tmp/{name}", "status": "Failed"}
+            for name in ("a", "b")
+        ])
+        settings_mock = MagicMock()
+        settings_mock.get_downloads_json_path.return_value = json_path
+        widget = DownloadManagerWidget(umu_database=mock_umu_database, settings=settings_mock)
+        qtbot.addWidget(widget)
+        old = widget.find_controller_by_url("http://example.com/a.zip")
+
+        record = {"url": "http://example.com/a.zip", "filename": "a.zip", "path": "/tmp/a", "status": "Downloading"}
+        with patch("gameyfin_frontend.widgets.download_item.download_thread_pool"):
+            widget.add_download(MagicMock(), record)
+
+        assert old not in widget.widget_map
+        assert widget.find_controller_by_url("http://example.com/a.zip").record is record
+        assert [r["filename"] for r in widget.download_records] == ["a.zip", "b.zip"]
+        assert widget.download_records[0] is record
+
+    def test_finished_download_is_saved_in_place(self, qtbot, mock_umu_database, tmp_app_data):
+        """A finished download schedules a write without rebuilding the record list."""
+        from gameyfin_frontend.widgets.download_manager import DownloadManagerWidget
+        from unittest.mock import MagicMock
+
+        json_path = os.path.join(tmp_app_data, "downloads.json")
+        DownloadHistoryService(json_path).save([
+            {"url": "http://example.com/a.zip", "filename": "a.zip", "path": "/tmp/a", "status": "Failed"},
+        ])
+        settings_mock = MagicMock()
+        settings_mock.get_downloads_json_path.return_value = json_path
+        widget = DownloadManagerWidget(umu_database=mock_umu_database, settings=settings_mock)
+        qtbot.addWidget(widget)
+
+        records = widget.download_records
+        records[0]["status"] = "Completed"
+        widget.on_download_finished(records[0])
+        assert widget.download_records is records
+        assert widget._save_timer.isActive()
+
+        qtbot.waitUntil(lambda: not widget._save_timer.isActive())
+        assert DownloadHistoryService(json_path).load()[0]["status"] == "Completed"
+
+    def test_history_rows_are_created_a_page_at_a_time(self, qtbot, mock_umu_database, tmp_app_data, monkeypatch):
+        """Only the first page of history gets rows; the rest keep their place until scrolled to."""
+        from gameyfin_frontend.widgets import download_manager
+        from unittest.mock import MagicMock
+
+        monkeypatch.setattr(download_manager, "HISTORY_PAGE_SIZE", 2)
+        json_path = os.path.join(tmp_app_data, "downloads.json")
+        records = [
+            {"url": f"http://example.com/{i}.zip", "filename": f"{i}.zip", "path": f"/tmp/{i}", "status": "Failed"}
+            for i in range(5)
+        ]
+        DownloadHistoryService(json_path).save(records)
+
+        settings_mock = MagicMock()
+        settings_mock.get_downloads_json_path.return_value = json_path
+        widget = download_manager.DownloadManagerWidget(umu_database=mock_umu_database, settings=settings_mock)
+        qtbot.addWidget(widget)
+
+        assert [c.record["filename"] for c in widget.widget_map] == ["4.zip", "3.zip"]
+        widget.save_history()
+        assert widget.download_records == records[::-1]
+
+        scroll_bar = widget.scroll_area.verticalScrollBar()
+        widget._on_scroll_value_changed(scroll_bar.maximum())
+        assert [c.record["filename"] for c in widget.widget_map] == ["4.zip", "3.zip", "2.zip", "1.zip"]
+        widget.save_history()
+        assert widget.download_records == records[::-1]
+
+    def test_missing_history_dirs_are_marked_after_loading(self, qtbot, mock_umu_database, tmp_app_data):
+        """Completed rows show up at once and are flagged when the background check finds their folder gone."""
+        from gameyfin_frontend.widgets.download_manager import DownloadManagerWidget
+        from unittest.mock import MagicMock
+
+        json_path = os.path.join(tmp_app_data, "downloads.json")
+        present = os.path.join(tmp_app_data, "present")
+        os.makedirs(present)
+        DownloadHistoryService(json_path).save([
+            {"url": "http://example.com/a.zip", "filename": "a.zip", "path": present, "status": "Completed"},
+            {"url": "http://example.com/b.zip", "filename": "b.zip", "path": os.path.join(tmp_app_data, "gone"),
+             "status": "Completed"},
+        ])
+
+        settings_mock = MagicMock()
+        settings_mock.get_downloads_json_path.return_value = json_path
+        widget = DownloadManagerWidget(umu_database=mock_umu_database, settings=settings_mock)
+        qtbot.addWidget(widget)
+
+        found = widget.find_controller_by_url("http://example.com/a.zip")
+        missing = widget.find_controller_by_url("http://example.com/b.zip")
+        qtbot.waitUntil(lambda: not widget._dir_check_signals)
+        assert missing.status_label.text() == "Directory not found"
+        assert found.install_button.isEnabled()
+
 
 class TestUmuDatabaseCacheCycle:
     """Test UmuDatabase cache build and lookup cycle."""
@@ -284,6 +468,7 @@ class TestUmuDatabaseCacheCycle:
     def test_cache_build_and_lookup(self, mock_settings):
         """Build cache from entries, then verify all three indexes work."""
         db = UmuDatabase.__new__(UmuDatabase)
+        db._search_lock = threading.Lock()
         db.settings = mock_settings
         db._games_by_title = defaultdict(list)
         db._games_by_codename = defaultdict(list)
@@ -316,6 +501,7 @@ class TestUmuDatabaseCacheCycle:
     def test_cache_persists_and_reloads(self, mock_settings, umu_cache_file):
         """Save cache to disk, create new instance, load and verify all indexes."""
         db = UmuDatabase.__new__(UmuDatabase)
+        db._search_lock = threading.Lock()
         db.settings = mock_settings
         db._games_by_title = defaultdict(list)
         db._games_by_codename = defaultdict(list)
@@ -332,6 +518,7 @@ class TestUmuDatabaseCacheCycle:
 
         # Create new instance and load
         db2 = UmuDatabase.__new__(UmuDatabase)
+        db2._search_lock = threading.Lock()
         db2.settings = mock_settings
         db2._games_by_title = defaultdict(list)
         db2._games_by_codename = defaultdict(list)
@@ -348,6 +535,7 @@ class TestUmuDatabaseCacheCycle:
     def test_codename_lookup_uses_cache_first(self, mock_settings):
         """get_game_by_codename should check cache before hitting API."""
         db = UmuDatabase.__new__(UmuDatabase)
+        db._search_lock = threading.Lock()
         db.settings = mock_settings
         db._games_by_title = defaultdict(list)
         db._games_by_codename = defaultdict(list, {"999": [{"umu_id": "UMU-TEST", "title": "Cached Game", "codename": "999"}]})
@@ -371,6 +559,7 @@ class TestUmuDatabaseCacheCycle:
     def test_umu_id_lookup_uses_cache_first(self, mock_settings):
         """get_game_by_umu_id should check cache before hitting API."""
         db = UmuDatabase.__new__(UmuDatabase)
+        db._search_lock = threading.Lock()
         db.settings = mock_settings
         db._games_by_title = defaultdict(list)
         db._games_by_codename = defaultdict(list)
@@ -395,6 +584,7 @@ class TestUmuDatabaseCacheCycle:
     def test_codename_fallback_to_api_when_not_cached(self, mock_settings):
         """get_game_by_codename should fall back to API when codename is not in cache."""
         db = UmuDatabase.__new__(UmuDatabase)
+        db._search_lock = threading.Lock()
         db.settings = mock_settings
         db._games_by_title = defaultdict(list)
         db._games_by_codename = defaultdict(list)  # Empty — codename not cached
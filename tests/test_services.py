@@ -51,6 +51,23 @@ class TestLauncherResolver:
         paths = resolver.find_launcher_paths(str(game_dir))
         assert len(paths) == 3
 
+    def test_find_launcher_paths_matches_os_walk(self, tmp_path, mock_umu_database, mock_settings):
+        resolver = LauncherResolver()
+        game_dir = tmp_path / "game"
+        for sub in ("a", "a/deep", "b", "c"):
+            (game_dir / sub).mkdir(parents=True)
+        for name in ("Game.EXE", "a/x.exe", "a/deep/y.Exe", "b/z.exe", "c/data.bin", "setup.exe.txt"):
+            (game_dir / name).touch()
+        (game_dir / "link").symlink_to(game_dir / "a")
+
+        expected = [
+            os.path.join(root, f)
+            for root, _dirs, files in os.walk(str(game_dir))
+            for f in files if f.lower().endswith(".exe")
+        ]
+        assert resolver.find_launcher_paths(str(game_dir)) == expected
+        assert len(expected) == 4
+
     def test_find_launcher_paths_no_exe(self, tmp_path, mock_umu_database, mock_settings):
         resolver = LauncherResolver()
         game_dir = tmp_path / "game"
@@ -110,6 +127,20 @@ class TestGameInstaller:
         assert umu_id == "umu-12345"
         assert store == "steam"
 
+    def test_read_product_id_stops_at_top_level_id(self, tmp_path):
+        from gameyfin_frontend.services.game_installer import _read_product_id
+
+        path = tmp_path / "product_1.json"
+        path.write_text('{"name": "G", "build": {"id": "nested"}, "id" : 1207658924, "rest": [1, 2,')
+        assert _read_product_id(str(path)) == 1207658924
+
+        path.write_text(json.dumps({"name": "G", "build": {"id": "nested"}}))
+        assert _read_product_id(str(path)) is None
+
+        path.write_text('["id", 1]')
+        with pytest.raises(json.JSONDecodeError):
+            _read_product_id(str(path))
+
     def test_detect_umu_game_id_title_fallback(self, tmp_path, mock_umu_database, mock_settings):
         from gameyfin_frontend.services import GameInstaller
 
@@ -159,6 +190,24 @@ class TestGameInstaller:
         assert umu_id == "umu-default"
         assert store == "none"
 
+    @pytest.mark.parametrize("content", ["", "not valid json {{{"])
+    def test_unusable_product_json_falls_back_to_title(self, tmp_path, mock_umu_database, mock_settings, content):
+        from gameyfin_frontend.services import GameInstaller
+        from gameyfin_frontend.services import game_installer
+
+        game_dir = tmp_path / "game"
+        game_dir.mkdir()
+        (game_dir / "product_bad.json").write_text(content)
+        mock_settings.get.side_effect = lambda key, default=None: {"filename": "my_game.zip"}.get(key, default)
+        mock_umu_database.search_by_partial_title.return_value = [{"umu_id": "umu-1", "store": "gog"}]
+
+        installer = GameInstaller(mock_umu_database, mock_settings, None)
+        with patch.object(game_installer, "_read_product_id", wraps=game_installer._read_product_id) as read:
+            assert installer.find_umu_candidates(str(game_dir)) == [{"umu_id": "umu-1", "store": "gog"}]
+        # Empty files are rejected by size without being parsed
+        assert read.called == bool(content)
+        mock_umu_database.search_by_partial_title.assert_called_once_with("my game")
+
     def test_prompt_install_config_cancelled(self, mock_umu_database, mock_settings):
         from gameyfin_frontend.services import GameInstaller
 
@@ -177,6 +226,9 @@ class TestGameInstaller:
                 wine_prefix_path="/tmp/pfx",
             )
             assert result is None
+            # The dialog only asks for the database once it needs it
+            assert "umu_database" not in MockDialog.call_args.kwargs
+            assert MockDialog.call_args.kwargs["db_provider"]() is mock_umu_database
 
 
 class TestGameLauncher:
@@ -200,13 +252,11 @@ class TestGameLauncher:
             )
 
             assert result is not None
-            MockProcess.return_value.start.assert_called_once()
-            call_args = MockProcess.return_value.start.call_args
-            assert call_args[0][0] == "/bin/sh"
-            # start("/bin/sh", ["-c", "PROTONPATH=... exec umu-run ..."])
-            command_str = call_args[0][1][1]
-            assert "exec umu-run" in command_str
-            assert 'PROTONPATH="GE-Proton10"' in command_str
+            MockProcess.return_value.start.assert_called_once_with("umu-run", ["/tmp/game/game.exe"])
+            env = MockProcess.return_value.setProcessEnvironment.call_args[0][0]
+            assert env.value("PROTONPATH") == "GE-Proton10"
+            assert env.value("WINEPREFIX") == "/tmp/prefixes/my_game_pfx"
+            assert env.value("USE_HOST_UMU") == "1"
 
     @pytest.mark.skipif(sys.platform == "win32", reason="Linux-only test")
     def test_start_linux_missing_prefix(self, mock_settings):
@@ -238,4 +288,30 @@ class TestGameLauncher:
             assert result is not None
             MockProcess.return_value.setProgram.assert_called_once_with("/tmp/game/game.exe")
             MockProcess.return_value.setWorkingDirectory.assert_called_once_with("/tmp/game")
-            MockProcess.return_value.start.assert_called_once()
\ No newline at end of file
+            MockProcess.return_value.start.assert_called_once()
+
+
+class TestShortcutService:
+    def test_detect_existing_shortcuts_lists_each_dir_once(self, tmp_path, monkeypatch):
+        from gameyfin_frontend.services.shortcut_service import ShortcutService
+        desktop_dir = tmp_path / "Desktop"
+        apps_dir = tmp_path / "apps"
+        desktop_dir.mkdir()
+        apps_dir.mkdir()
+        (desktop_dir / "a.desktop").touch()
+        (apps_dir / "b.desktop").touch()
+        monkeypatch.setattr("gameyfin_frontend.services.shortcut_service.get_xdg_user_dir", lambda name: desktop_dir)
+        monkeypatch.setattr("gameyfin_frontend.services.shortcut_service.get_applications_dir", lambda: str(apps_dir))
+
+        with patch("gameyfin_frontend.services.shortcut_service.os.listdir", wraps=os.listdir) as listdir:
+            result = ShortcutService(None).detect_existing_shortcuts(
+                ["/pfx/a.desktop", "/pfx/b.desktop", "/pfx/c.desktop"]
+            )
+        assert result == (["a.desktop"], ["b.desktop"])
+        assert listdir.call_count == 2
+
+    def test_detect_existing_shortcuts_without_directories(self, tmp_path, monkeypatch):
+        from gameyfin_frontend.services.shortcut_service import ShortcutService
+        monkeypatch.setattr("gameyfin_frontend.services.shortcut_service.get_xdg_user_dir", lambda name: tmp_path / "x")
+        monkeypatch.setattr("gameyfin_frontend.services.shortcut_service.get_applications_dir", lambda: str(tmp_path / "y"))
+        assert ShortcutService(None).detect_existing_shortcuts(["/pfx/a.desktop"]) == ([], [])
@@ -1,5 +1,7 @@
 import json
 import os
+import sys
+import threading
 from collections import defaultdict
 
 import pytest
@@ -37,6 +39,7 @@ def fresh_umu_database(mock_settings):
     """Create a UmuDatabase with an empty cache (no API calls)."""
     # Patch _request_umu_api to return empty list (no network needed)
     db = UmuDatabase.__new__(UmuDatabase)
+    db._search_lock = threading.Lock()
     db.settings = mock_settings
     db._games_by_title = defaultdict(list)
     db._games_by_codename = defaultdict(list)
@@ -136,6 +139,89 @@ class TestSearchByPartialTitle:
         results = fresh_umu_database.search_by_partial_title("test")
         assert len(results) == 2
 
+    def test_repeated_search_uses_cache(self, fresh_umu_database, sample_umu_entries, monkeypatch):
+        fresh_umu_database._games_by_title = defaultdict(list, {e["title"]: [e] for e in sample_umu_entries})
+        first = fresh_umu_database.search_by_partial_title("Baldurs")
+        calls = []
+        original = fresh_umu_database._normalize_string
+        monkeypatch.setattr(fresh_umu_database, "_normalize_string", lambda t: calls.append(t) or original(t))
+        second = fresh_umu_database.search_by_partial_title("baldurs")
+        assert second == first
+        assert calls == ["baldurs"]
+
+    def test_extended_search_only_rechecks_previous_matches(self, fresh_umu_database, sample_umu_entries):
+        fresh_umu_database._games_by_title = defaultdict(list, {e["title"]: [e] for e in sample_umu_entries})
+        fresh_umu_database.search_by_partial_title("baldurs")
+        fresh_umu_database._title_index.candidates = lambda term: pytest.fail("index scanned again")
+        results = fresh_umu_database.search_by_partial_title("baldurs gate 3")
+        assert [r["umu_id"] for r in results] == ["UMU-002"]
+
+    def test_titles_are_normalized_once(self, fresh_umu_database, sample_umu_entries, monkeypatch):
+        fresh_umu_database._games_by_title = defaultdict(list, {e["title"]: [e] for e in sample_umu_entries})
+        calls = []
+        original = fresh_umu_database._normalize_string
+        monkeypatch.setattr(fresh_umu_database, "_normalize_string", lambda t: calls.append(t) or original(t))
+        fresh_umu_database.search_by_partial_title("witcher")
+        fresh_umu_database.search_by_partial_title("cyberpunk")
+        # One call per title for the index, then one per search term
+        assert len(calls) == len(sample_umu_entries) + 2
+
+    def test_trigram_index_matches_scan(self, fresh_umu_database, sample_umu_entries, monkeypatch):
+        import gameyfin_frontend.umu_database as umu_database_module
+        fresh_umu_database._games_by_title = defaultdict(list, {e["title"]: [e] for e in sample_umu_entries})
+        terms = ["baldurs gate", "gate", "wi", "the witcher 3", "nomatch"]
+        scanned = [fresh_umu_database.search_by_partial_title(t) for t in terms]
+
+        monkeypatch.setattr(umu_database_module, "TRIGRAM_INDEX_MIN_TITLES", 0)
+        fresh_umu_database._build_title_cache(sample_umu_entries)
+        indexed = [fresh_umu_database.search_by_partial_title(t) for t in terms]
+        assert fresh_umu_database._title_index._trigrams is not None
+        assert indexed == scanned
+
+    def test_rebuild_invalidates_search_cache(self, fresh_umu_database, sample_umu_entries):
+        fresh_umu_database._build_title_cache(sample_umu_entries)
+        assert len(fresh_umu_database.search_by_partial_title("witcher")) == 1
+        fresh_umu_database._build_title_cache([])
+        assert fresh_umu_database.search_by_partial_title("witcher") == []
+
+    def test_concurrent_searches_share_cache_safely(self, fresh_umu_database, sample_umu_entries, monkeypatch):
+        import gameyfin_frontend.umu_database as umu_database_module
+        monkeypatch.setattr(umu_database_module, "SEARCH_CACHE_SIZE", 4)
+        fresh_umu_database._games_by_title = defaultdict(list, {e["title"]: [e] for e in sample_umu_entries})
+        terms = ["b", "ba", "bal", "baldurs", "gate", "wi", "witcher", "the", "cyber", "nomatch"]
+        expected = {t: fresh_umu_database.search_by_partial_title(t) for t in terms}
+        fresh_umu_database._invalidate_search_cache()
+
+        errors = []
+
+        def search_all():
+            try:
+                for _ in range(50):
+                    for term in terms:
+                        assert fresh_umu_database.search_by_partial_title(term) == expected[term]
+            except Exception as e:
+                errors.append(e)
+
+        old_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=search_all) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(old_interval)
+        assert errors == []
+
+
+class TestCachedTitles:
+    def test_lists_titles_and_entries(self, fresh_umu_database, sample_umu_entries):
+        fresh_umu_database._build_title_cache(sample_umu_entries)
+        assert "The Witcher 3" in fresh_umu_database.cached_titles()
+        assert fresh_umu_database.get_cached_games_by_title("The Witcher 3")[0]["umu_id"] == "UMU-003"
+        assert fresh_umu_database.get_cached_games_by_title("Missing") == []
+
 
 class TestBuildTitleCache:
     def test_builds_title_index(self, fresh_umu_database, sample_umu_entries):
@@ -40,6 +40,52 @@ class TestParseDesktopFile:
         # Should have "Name" not "name" or "NAME"
         assert "Name" in result["Desktop Entry"]
 
+    def test_keeps_percent_codes_and_spacing(self, tmp_path):
+        path = tmp_path / "game.desktop"
+        path.write_text("[Desktop Entry]\n# comment\nName = My Game\nExec=game %U\n\n")
+        result = parse_desktop_file(str(path))
+        assert result == {"Desktop Entry": {"Name": "My Game", "Exec": "game %U"}}
+
+    def test_reads_utf8_and_rejects_malformed_lines(self, tmp_path):
+        path = tmp_path / "game.desktop"
+        path.write_bytes("[Desktop Entry]\r\nName=Spiel \u00fc\r\n".encode("utf-8"))
+        assert parse_desktop_file(str(path)) == {"Desktop Entry": {"Name": "Spiel \u00fc"}}
+
+        path.write_text("Name=Game\nnot a key value line\n")
+        assert parse_desktop_file(str(path)) is None
+
+    def test_multiple_groups_fall_back_to_configparser(self, tmp_path):
+        path = tmp_path / "game.desktop"
+        path.write_text("[Desktop Entry]\nName=Game\nActions=Cfg;\n\n[Desktop Action Cfg]\nName=Configure\n")
+        result = parse_desktop_file(str(path))
+        assert result["Desktop Entry"]["Name"] == "Game"
+        assert result["Desktop Action Cfg"] == {"Name": "Configure"}
+
+    def test_write_round_trips(self, tmp_path):
+        from gameyfin_frontend.utils import write_desktop_file
+        desktop_file = {"Desktop Entry": {"Name": "Game", "Exec": "run %U"}, "Desktop Action Cfg": {"Name": "Cfg"}}
+        path = tmp_path / "out.desktop"
+        write_desktop_file(str(path), desktop_file)
+        assert parse_desktop_file(str(path)) == desktop_file
+
+    def test_write_replaces_existing_file_and_mode(self, tmp_path):
+        from gameyfin_frontend.utils import write_desktop_file
+        path = tmp_path / "out.desktop"
+        path.write_text("[Desktop Entry]\nName=A much longer previous name\n")
+        path.chmod(0o600)
+        write_desktop_file(str(path), {"Desktop Entry": {"Name": "Gäme"}}, 0o755)
+        assert path.read_text(encoding="utf-8") == "[Desktop Entry]\nName=Gäme\n"
+        assert path.stat().st_mode & 0o777 == 0o755
+
+    def test_write_publishes_by_rename(self, tmp_path):
+        from unittest.mock import patch
+        from gameyfin_frontend import utils
+        path = tmp_path / "out.desktop"
+        with patch.object(utils.os, "replace", wraps=os.replace) as replace:
+            utils.write_desktop_file(str(path), {"Desktop Entry": {"Name": "Game"}})
+        replace.assert_called_once_with(str(tmp_path / ".out.desktop.tmp"), str(path))
+        assert os.listdir(tmp_path) == ["out.desktop"]
+
 
 class TestBuildUmuCommand:
     def test_basic_command(self):
@@ -87,6 +133,22 @@ class TestBuildUmuEnvPrefix:
         assert result.count('WINEPREFIX="') == 1
         assert 'EXTRA="val" ' in result
 
+    def test_escapes_shell_characters_in_values(self):
+        config = {"DXVK_HUD": 'fps "$HOME" `id` \\'}
+        result = build_umu_env_prefix("GE-Proton", "/home/user/pfx", config)
+        assert result.endswith('DXVK_HUD="fps \\"\\$HOME\\" \\`id\\` \\\\" ')
+
+
+class TestBuildUmuProcessEnv:
+    def test_sets_variables_verbatim(self):
+        from gameyfin_frontend.utils import build_umu_process_env
+        config = {"PROTONPATH": "Bad", "DXVK_HUD": 'fps "quoted" `x`', "MANGOHUD": 1}
+        env = build_umu_process_env("GE-Proton", "/home/user/pfx", config)
+        assert env.value("PROTONPATH") == "GE-Proton"
+        assert env.value("WINEPREFIX") == "/home/user/pfx"
+        assert env.value("DXVK_HUD") == 'fps "quoted" `x`'
+        assert env.value("MANGOHUD") == "1"
+
 
 class TestBuildFlatpakExecCommand:
     def test_basic_command(self):
@@ -157,6 +219,18 @@ class TestGetXdgUserDir:
             else:
                 os.environ.pop("XDG_CONFIG_HOME", None)
 
+    def test_config_file_read_once(self, user_dirs_file, monkeypatch):
+        import builtins
+        monkeypatch.setenv("XDG_CONFIG_HOME", user_dirs_file)
+        opened = []
+        original_open = builtins.open
+        monkeypatch.setattr(builtins, "open", lambda path, *a, **kw: opened.append(path) or original_open(path, *a, **kw))
+        desktop = get_xdg_user_dir("DESKTOP")
+        download = get_xdg_user_dir("DOWNLOAD")
+        assert get_xdg_user_dir("DESKTOP") == desktop
+        assert str(download).endswith("Downloads")
+        assert len(opened) == 1
+
     def test_missing_config_file_returns_fallback(self, tmp_path):
         old_xdg = os.environ.get("XDG_CONFIG_HOME")
         os.environ["XDG_CONFIG_HOME"] = str(tmp_path)
@@ -168,3 +242,100 @@ class TestGetXdgUserDir:
                 os.environ["XDG_CONFIG_HOME"] = old_xdg
             else:
                 os.environ.pop("XDG_CONFIG_HOME", None)
+
+    def test_configured_dir_does_not_look_up_home(self, user_dirs_file, monkeypatch):
+        from pathlib import Path
+        from unittest.mock import patch
+        monkeypatch.setenv("XDG_CONFIG_HOME", user_dirs_file)
+        expected = get_xdg_user_dir("DESKTOP")
+        with patch.object(Path, "home") as home:
+            assert get_xdg_user_dir("DESKTOP") == expected
+        home.assert_not_called()
+
+
+class TestCreateShortcuts:
+    def test_writes_to_absolute_xdg_desktop_dir(self, valid_desktop_file, tmp_path, monkeypatch):
+        from gameyfin_frontend.utils import create_shortcuts
+        home = tmp_path / "home"
+        config_home = tmp_path / "config"
+        config_home.mkdir()
+        (config_home / "user-dirs.dirs").write_text(f'XDG_DESKTOP_DIR="{home}/Schreibtisch"\n')
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(config_home))
+
+        create_shortcuts([valid_desktop_file], str(tmp_path / "scripts"), str(tmp_path / "pfx"), {},
+                         selected_desktop=[valid_desktop_file], selected_apps=[])
+
+        assert (home / "Schreibtisch" / "testgame.desktop").is_file()
+        # Nothing was selected for the applications menu, so its directory is left alone
+        assert not (home / ".local" / "share" / "applications").exists()
+
+    def test_parses_each_file_once_for_scripts_and_both_locations(self, valid_desktop_file, tmp_path, monkeypatch):
+        from unittest.mock import patch
+        from gameyfin_frontend import utils
+        home = tmp_path / "home"
+        config_home = tmp_path / "config"
+        config_home.mkdir()
+        (config_home / "user-dirs.dirs").write_text(f'XDG_DESKTOP_DIR="{home}/Desktop"\n')
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(config_home))
+
+        with patch.object(utils, "parse_desktop_file", wraps=utils.parse_desktop_file) as parse:
+            utils.create_shortcuts([valid_desktop_file], str(tmp_path / "scripts"), str(tmp_path / "pfx"),
+                                   {"USE_HOST_UMU": "1"}, selected_desktop=[valid_desktop_file],
+                                   selected_apps=[valid_desktop_file])
+        parse.assert_called_once_with(valid_desktop_file)
+
+        desktop_copy = utils.parse_desktop_file(str(home / "Desktop" / "testgame.desktop"))
+        apps_copy = utils.parse_desktop_file(str(home / ".local" / "share" / "applications" / "testgame.desktop"))
+        assert desktop_copy == apps_copy
+        assert desktop_copy["Desktop Entry"]["Exec"] == f'"{tmp_path / "scripts" / "testgame.sh"}"'
+
+    def test_helper_script_is_executable(self, tmp_path):
+        from gameyfin_frontend.utils import create_shortcuts
+        desktop_file = tmp_path / "game.desktop"
+        desktop_file.write_text(f"[Desktop Entry]\nName=Game\nPath={tmp_path}\nStartupWMClass=game.exe\n")
+        scripts_dir = tmp_path / "scripts"
+        scripts_dir.mkdir()
+        (scripts_dir / "game.sh").write_text("old")
+
+        create_shortcuts([str(desktop_file)], str(scripts_dir), str(tmp_path / "pfx"), {})
+
+        script = scripts_dir / "game.sh"
+        assert script.read_text().startswith(f"#!/bin/sh\n\ncd '{tmp_path}'\n")
+        assert script.stat().st_mode & 0o777 == 0o755
+
+
+class TestListFiles:
+    def test_matches_glob(self, tmp_path):
+        import glob
+        from gameyfin_frontend.utils import list_files
+        for name in ("product_1.json", "product_.json", "product.json", ".product_2.json", "other.json"):
+            (tmp_path / name).touch()
+        (tmp_path / "product_dir.json").mkdir()
+        expected = [p for p in glob.glob(os.path.join(str(tmp_path), "product_*.json")) if os.path.isfile(p)]
+        assert sorted(list_files(str(tmp_path), "product_", ".json")) == sorted(expected)
+
+    def test_missing_directory_returns_empty(self, tmp_path):
+        from gameyfin_frontend.utils import list_files
+        assert list_files(str(tmp_path / "missing"), suffix=".desktop") == []
+
+
+class TestFindExistingDirs:
+    def test_lists_each_parent_once(self, tmp_path):
+        from unittest.mock import patch
+        from gameyfin_frontend.utils import find_existing_dirs
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        (tmp_path / "file").touch()
+        paths = [str(tmp_path / name) for name in ("a", "b", "file", "missing")]
+        with patch("gameyfin_frontend.utils.os.scandir", wraps=os.scandir) as scandir:
+            assert find_existing_dirs(paths) == {str(tmp_path / "a"), str(tmp_path / "b")}
+        scandir.assert_called_once_with(str(tmp_path))
+
+    def test_unreadable_parent_falls_back_to_isdir(self, tmp_path):
+        from unittest.mock import patch
+        from gameyfin_frontend.utils import find_existing_dirs
+        (tmp_path / "a").mkdir()
+        with patch("gameyfin_frontend.utils.os.scandir", side_effect=PermissionError):
+            assert find_existing_dirs([str(tmp_path / "a"), str(tmp_path / "x"), ""]) == {str(tmp_path / "a")}
@@ -87,6 +87,23 @@ class TestCopyIconFromSource:
         result = copy_icon_from_source(str(tmp_path), "fallback_icon")
         assert result == str(apps_dir / "fallback_icon.png")
 
+    def test_shared_cache_lists_each_icons_dir_once(self, tmp_path, monkeypatch):
+        """Icon directories should be listed once when a cache is shared between lookups."""
+        icon_dir = tmp_path / "icons" / "64x64" / "apps"
+        icon_dir.mkdir(parents=True)
+        (icon_dir / "a.png").write_bytes(b"a")
+        (icon_dir / "b.png").write_bytes(b"b")
+
+        scanned = []
+        original_scandir = os.scandir
+        monkeypatch.setattr(os, "scandir", lambda path: scanned.append(path) or original_scandir(path))
+        monkeypatch.setattr(os.path, "exists", lambda path: pytest.fail(f"stat'ed {path}"))
+        cache = {}
+        assert copy_icon_from_source(str(tmp_path), "a", cache) == str(icon_dir / "a.png")
+        assert copy_icon_from_source(str(tmp_path), "b", cache) == str(icon_dir / "b.png")
+        # The four search locations plus the one apps/ directory, each once
+        assert len(scanned) == len(set(scanned)) == 5
+
 
 class TestInstallIconForShortcut:
     def test_installs_icon_to_system_directory(self, tmp_path):
@@ -194,3 +211,33 @@ class TestInstallIconForShortcut:
                 os.environ["HOME"] = old_home
             else:
                 os.environ.pop("HOME", None)
+
+
+class TestCreateShortcutsIcons:
+    def test_shared_icon_is_installed_once(self, tmp_path, monkeypatch):
+        """Shortcuts that name the same icon resolve and copy it a single time."""
+        from unittest.mock import patch
+        from gameyfin_frontend import utils
+        home = tmp_path / "home"
+        monkeypatch.setenv("HOME", str(home))
+        monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+
+        shortcuts_dir = tmp_path / "proton_shortcuts"
+        icon_dir = shortcuts_dir / "icons" / "256x256" / "apps"
+        icon_dir.mkdir(parents=True)
+        (icon_dir / "game_icon.png").write_bytes(b"icon data")
+        desktop_files = []
+        for name in ("Game", "Game Settings"):
+            path = shortcuts_dir / f"{name}.desktop"
+            path.write_text(f"[Desktop Entry]\nName={name}\nIcon=game_icon\n")
+            desktop_files.append(str(path))
+
+        with patch.object(utils.shutil, "copy2", wraps=utils.shutil.copy2) as copy2:
+            utils.create_shortcuts(desktop_files, str(tmp_path / "scripts"), str(tmp_path / "pfx"), {},
+                                   selected_desktop=desktop_files, selected_apps=desktop_files)
+        copy2.assert_called_once()
+
+        installed = str(home / ".local" / "share" / "icons" / "gameyfin" / "256x256" / "apps" / "game_icon.png")
+        for path in desktop_files:
+            shortcut = home / ".local" / "share" / "applications" / os.path.basename(path)
+            assert utils.parse_desktop_file(str(shortcut))["Desktop Entry"]["Icon"] == installed
@@ -1,3 +1,4 @@
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,6 +12,44 @@ def mock_umu_database():
     return db
 
 
+def _show_in_row(qtbot, controller):
+    """Place a download item's widgets in a shown row, as the download manager does."""
+    from PyQt6.QtWidgets import QHBoxLayout, QWidget
+    row = QWidget()
+    layout = QHBoxLayout(row)
+    for widget in controller.get_widgets_for_grid():
+        layout.addWidget(widget)
+    qtbot.addWidget(row)
+    row.show()
+    return row
+
+
+@pytest.fixture()
+def clock():
+    """Patch the download item's clock; tests move time forward via clock.monotonic.return_value."""
+    from gameyfin_frontend.widgets import download_item
+    clock = MagicMock()
+    clock.monotonic.return_value = 0.0
+    with patch.object(download_item, "time", clock):
+        yield clock
+
+
+@pytest.fixture()
+def shown_item(qtbot, mock_umu_database, clock):
+    """A download item in a shown row with its progress bar visible, as during a download.
+
+    Returns (item, row); the row must stay referenced or its child widgets are deleted.
+    """
+    from gameyfin_frontend.widgets.download_item import DownloadItemWidget
+    record = {"filename": "game.zip", "path": "/tmp/downloads/game", "status": "Failed"}
+    item = DownloadItemWidget(umu_database=mock_umu_database, record=record)
+    qtbot.addWidget(item)
+    row = _show_in_row(qtbot, item)
+    item.progress_bar.show()
+    assert row.isVisible()
+    return item, row
+
+
 class TestDownloadItemWidget:
     def test_widget_initializes_with_record(self, qtbot, mock_umu_database):
         from gameyfin_frontend.widgets.download_item import DownloadItemWidget
@@ -58,6 +97,228 @@ class TestDownloadItemWidget:
         assert len(widgets) == 5
         assert isinstance(widgets[0], type(widget.icon_label))
 
+    def test_font_metrics_measured_once_per_font(self, qtbot, mock_umu_database):
+        from PyQt6.QtGui import QFont
+        from gameyfin_frontend.widgets.download_item import DownloadItemWidget
+        record = {"filename": "game.zip", "path": "/tmp/downloads/game", "status": "Failed"}
+        first = DownloadItemWidget(umu_database=mock_umu_database, record=record)
+        qtbot.addWidget(first)
+        with patch.object(DownloadItemWidget, "fontMetrics") as font_metrics, \
+                patch("gameyfin_frontend.widgets.download_item.QPushButton.sizeHint") as size_hint:
+            second = DownloadItemWidget(umu_database=mock_umu_database, record=record)
+            qtbot.addWidget(second)
+            font_metrics.assert_not_called()
+            size_hint.assert_not_called()
+        assert second.status_label.minimumWidth() == first.status_label.minimumWidth()
+        assert second.button_container.width() == first.button_container.width()
+
+        bigger = QFont(first.font())
+        bigger.setPointSize(first.font().pointSize() + 10)
+        third = DownloadItemWidget(umu_database=mock_umu_database, record=record)
+        qtbot.addWidget(third)
+        third.setFont(bigger)
+        assert third._metrics_for_font()[0] > first.icon_label.width()
+
+    def test_missing_directory_warning_pixmap_is_shared(self, qtbot, mock_umu_database, tmp_path):
+        from PyQt6.QtWidgets import QStyleFactory
+        from gameyfin_frontend.widgets.download_item import DownloadItemWidget
+        record = {"filename": "game.zip", "path": str(tmp_path / "missing"), "status": "Completed"}
+        first = DownloadItemWidget(umu_database=mock_umu_database, record=record)
+        qtbot.addWidget(first)
+        with patch.object(DownloadItemWidget, "style") as style:
+            second = DownloadItemWidget(umu_database=mock_umu_database, record=record)
+            qtbot.addWidget(second)
+            style.return_value.standardIcon.assert_not_called()
+        assert second.icon_label.pixmap().cacheKey() == first.icon_label.pixmap().cacheKey()
+
+        second.setStyle(QStyleFactory.create("Fusion"))
+        assert DownloadItemWidget._warning_pixmap is None
+
+    @pytest.mark.parametrize("exit_code, expected", [(0, "Completed (0 B)"), (5, "Crashed (code 5)")])
+    def test_run_finished_reports_exit_code(self, qtbot, mock_umu_database, exit_code, expected):
+        from PyQt6.QtCore import QProcess
+        from gameyfin_frontend.widgets.download_item import DownloadItemWidget
+        record = {"filename": "game.zip", "path": "/tmp/downloads/game", "status": "Completed"}
+        widget = DownloadItemWidget(umu_database=mock_umu_database, record=record)
+        qtbot.addWidget(widget)
+        widget.on_run_finished(exit_code, QProcess.ExitStatus.NormalExit)
+        assert widget.status_label.text() == expected
+
+    def test_deferred_directory_check(self, qtbot, mock_umu_database, tmp_path):
+        from gameyfin_frontend.widgets.download_item import DownloadItemWidget
+        record = {"filename": "game.zip", "path": str(tmp_path / "gone"), "status": "Completed"}
+        with patch("gameyfin_frontend.widgets.download_item.os.path.isdir") as isdir:
+            widget = DownloadItemWidget(umu_database=mock_umu_database, record=record, check_dir=False)
+            qtbot.addWidget(widget)
+        isdir.assert_not_called()
+        assert widget.install_button.isEnabled()
+
+        widget.mark_missing()
+        assert widget.status_label.text() == "Directory not found"
+        assert not widget.install_button.isEnabled()
+
+    @pytest.mark.parametrize("signal, args, expected", [("error", ("boom",), "Failed: boom"),
+                                                         ("finished", (), "Completed (0 B)")])
+    def test_worker_is_released_when_the_download_ends(self, qtbot, mock_umu_database, signal, args, expected):
+        from gameyfin_frontend.widgets import download_item
+        from gameyfin_frontend.workers import StreamDownloadWorker
+        worker = StreamDownloadWorker("http://example.com/game.zip", "/tmp/downloads/game")
+        record = {"url": "http://example.com/game.zip", "filename": "game.zip", "path": "/tmp/downloads/game"}
+        with patch.object(download_item, "download_thread_pool"):
+            widget = download_item.DownloadItemWidget(umu_database=mock_umu_database, worker=worker, record=record)
+        qtbot.addWidget(widget)
+        finished = []
+        widget.finished.connect(finished.append)
+
+        with patch.object(worker, "deleteLater") as delete_later:
+            getattr(worker, signal).emit(*args)
+            getattr(worker, signal).emit(*args)
+            worker.bytes_received.emit(1024, 2048)
+        assert len(finished) == 1
+        assert widget.status_label.text() == expected
+        assert widget._pending_bytes is None
+        delete_later.assert_called_once()
+
+    def test_bytes_received_repaints_are_coalesced(self, shown_item):
+        widget, _row = shown_item
+        widget._on_bytes_received(1024, 4096)
+        assert widget.progress_bar.value() == 25
+        widget._on_bytes_received(2048, 4096)
+        widget._on_bytes_received(3072, 4096)
+        # Inside the interval: nothing repainted yet, latest counts kept for the flush
+        assert widget.progress_bar.value() == 25
+        assert widget._flush_timer.isActive()
+
+        widget._flush_timer.timeout.emit()
+        assert widget.progress_bar.value() == 75
+        assert widget.status_label.text().startswith("3.00 KB / 4.00 KB")
+
+        widget._on_bytes_received(4000, 4096)
+        widget.on_download_finished()
+        assert not widget._flush_timer.isActive()
+        assert widget.status_label.text() == "Completed (4.00 KB)"
+
+    def test_bytes_received_repaint_once_interval_passed(self, shown_item, clock):
+        widget, _row = shown_item
+        widget._on_bytes_received(1024, 4096)
+        clock.monotonic.return_value = 0.1
+        widget._on_bytes_received(2048, 4096)
+        assert widget.progress_bar.value() == 25
+
+        clock.monotonic.return_value = 0.3
+        widget._on_bytes_received(3072, 4096)
+        assert widget.progress_bar.value() == 75
+
+    def test_bytes_received_wait_while_hidden(self, shown_item):
+        widget, row = shown_item
+        row.hide()
+
+        widget._on_bytes_received(1024, 4096)
+        widget._on_bytes_received(2048, 4096)
+        assert widget.progress_bar.value() != 50
+        assert not widget._flush_timer.isActive()
+        assert widget.record["total_bytes"] == 4096
+
+        row.show()
+        widget.show_pending_progress()
+        assert widget.progress_bar.value() == 50
+        assert widget.status_label.text().startswith("2.00 KB / 4.00 KB")
+
+    def test_total_size_formatted_once(self, shown_item, clock):
+        from gameyfin_frontend.widgets import download_item
+        widget, _row = shown_item
+        with patch.object(download_item, "format_size", wraps=download_item.format_size) as fmt:
+            for received in (1024, 2048, 3072):
+                clock.monotonic.return_value += 1.0
+                widget._on_bytes_received(received, 4096)
+        assert [c.args[0] for c in fmt.call_args_list].count(4096) == 1
+        assert widget.status_label.text().startswith("3.00 KB / 4.00 KB")
+
+    def test_unchanged_progress_is_not_reapplied(self, shown_item, clock):
+        widget, _row = shown_item
+        widget.progress_bar.setValue = MagicMock(wraps=widget.progress_bar.setValue)
+        widget.status_label.setText = MagicMock(wraps=widget.status_label.setText)
+        for _ in range(3):
+            clock.monotonic.return_value += 0.3
+            widget._on_bytes_received(2048, 4096)
+        widget.progress_bar.setValue.assert_called_once_with(50)
+        widget.status_label.setText.assert_called_once()
+        assert widget.status_label.text().startswith("2.00 KB / 4.00 KB")
+
+    def test_repeated_counts_are_dropped(self, shown_item, clock):
+        widget, _row = shown_item
+        widget._on_bytes_received(2048, 4096)
+        clock.monotonic.return_value += 1.0
+        with patch.object(widget, "_show_bytes_received") as show:
+            widget._on_bytes_received(2048, 4096)
+            show.assert_not_called()
+            widget._on_bytes_received(3072, 4096)
+            show.assert_called_once()
+
+    def test_speed_over_sliding_window(self, shown_item, clock):
+        widget, _row = shown_item
+        speeds = []
+        # (seconds, KB received): a burst at 2 s, then a steady 1000 KB/s
+        for now, kb in ((1.0, 1000), (2.0, 3000), (7.0, 8000)):
+            clock.monotonic.return_value = now
+            widget._on_bytes_received(kb * 1024, 0)
+            speeds.append(widget.status_label.text().rpartition("(")[2])
+        # Since the start, since the start, then over the last 5 s only
+        assert speeds == ["1000.00 KB/s)", "1.46 MB/s)", "1000.00 KB/s)"]
+
+    def test_worker_runs_on_download_pool(self, qtbot, mock_umu_database, tmp_path):
+        from gameyfin_frontend.widgets.download_item import DownloadItemWidget
+        from gameyfin_frontend.workers import StreamDownloadWorker, download_thread_pool
+        worker = StreamDownloadWorker("http://localhost/game.zip", str(tmp_path))
+        pool = MagicMock()
+        with patch("gameyfin_frontend.widgets.download_item.download_thread_pool", return_value=pool):
+            widget = DownloadItemWidget(umu_database=mock_umu_database, worker=worker, record={"filename": "game.zip"})
+        qtbot.addWidget(widget)
+        pool.start.assert_called_once_with(worker.run)
+        assert download_thread_pool() is download_thread_pool()
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Linux-only test")
+    def test_install_scans_in_pool_then_prompts(self, qtbot, mock_umu_database, tmp_path):
+        from PyQt6.QtCore import QThreadPool
+        from PyQt6.QtWidgets import QApplication
+        from gameyfin_frontend.widgets.download_item import DownloadItemWidget
+        (tmp_path / "setup.exe").touch()
+        record = {"filename": "game.zip", "path": str(tmp_path), "status": "Completed"}
+        widget = DownloadItemWidget(umu_database=mock_umu_database, record=record)
+        qtbot.addWidget(widget)
+        widget._game_installer.find_umu_candidates = MagicMock(return_value=[{"umu_id": "umu-1", "store": "gog"}])
+        widget._game_installer.prompt_install_config = MagicMock(return_value=None)
+
+        widget.on_install_clicked()
+        assert not widget.install_button.isEnabled()
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+
+        widget._game_installer.find_umu_candidates.assert_called_once_with(str(tmp_path))
+        assert widget._game_installer.prompt_install_config.call_args.kwargs["umu_id"] == "umu-1"
+        assert widget.install_button.isEnabled()
+        assert widget.status_label.text() == "Install cancelled by user."
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Linux-only test")
+    def test_install_scan_error_reenables_install(self, qtbot, mock_umu_database, tmp_path):
+        from PyQt6.QtCore import QThreadPool
+        from PyQt6.QtWidgets import QApplication
+        from gameyfin_frontend.widgets.download_item import DownloadItemWidget
+        record = {"filename": "game.zip", "path": str(tmp_path), "status": "Completed"}
+        widget = DownloadItemWidget(umu_database=mock_umu_database, record=record)
+        qtbot.addWidget(widget)
+        widget._game_installer.find_umu_candidates = MagicMock(side_effect=OSError("network down"))
+        widget._game_installer.prompt_install_config = MagicMock()
+
+        widget.on_install_clicked()
+        QThreadPool.globalInstance().waitForDone()
+        QApplication.processEvents()
+
+        widget._game_installer.prompt_install_config.assert_not_called()
+        assert widget._install_scan_signals is None
+        assert widget.install_button.isEnabled()
+        assert widget.status_label.text() == "Scan failed: network down"
+
 
 class TestDownloadManagerWidget:
     def test_widget_initializes(self, qtbot, mock_umu_database):
@@ -83,6 +344,19 @@ class TestDownloadManagerWidget:
         result = widget.find_controller_by_url("http://example.com/file.zip")
         assert result is None
 
+    def test_find_controller_by_url_tracks_rows(self, qtbot, mock_umu_database):
+        from gameyfin_frontend.widgets.download_manager import DownloadManagerWidget
+        from gameyfin_frontend.widgets.download_item import DownloadItemWidget
+        widget = DownloadManagerWidget(umu_database=mock_umu_database)
+        qtbot.addWidget(widget)
+        record = {"url": "http://example.com/file.zip", "filename": "file.zip", "path": "/tmp/file", "status": "Failed"}
+        controller = DownloadItemWidget(mock_umu_database, record=record)
+        widget.insert_row_at(0, controller)
+        assert widget.find_controller_by_url("http://example.com/file.zip") is controller
+
+        widget.remove_download_item(controller)
+        assert widget.find_controller_by_url("http://example.com/file.zip") is None
+
 
 class TestPrefixManagerWidget:
     def test_widget_initializes(self, qtbot, mock_umu_database):
@@ -126,6 +126,102 @@ class TestStreamDownloadWorker:
             # No sleep calls should have been made for throttling
             assert mock_sleep.call_count == 0, f"Expected no sleep calls, got {mock_sleep.call_count}"
 
+    def test_extraction_creates_each_directory_once(self, tmp_path):
+        from gameyfin_frontend.workers import StreamDownloadWorker
+
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("game/", "")
+            for name in ("a.txt", "b.txt", "c.txt"):
+                zf.writestr(f"game/data/{name}", name)
+        zip_data = zip_buffer.getvalue()
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = iter([zip_data])
+        mock_response.headers = {"content-length": str(len(zip_data))}
+
+        worker = StreamDownloadWorker("http://example.com/file.zip", str(tmp_path))
+        finished = []
+        worker.finished.connect(lambda: finished.append(True))
+        with patch.object(worker._session, 'get', return_value=mock_response), \
+             patch("gameyfin_frontend.workers.os.makedirs", wraps=os.makedirs) as makedirs:
+            worker.run()
+
+        assert finished == [True]
+        assert (tmp_path / "game" / "data" / "c.txt").read_text() == "c.txt"
+        created = [call.args[0] for call in makedirs.call_args_list]
+        # The target dir itself, then game/ and game/data/ once each
+        assert created == [str(tmp_path), str(tmp_path / "game"), str(tmp_path / "game" / "data")]
+
+    def test_extraction_stays_inside_the_target_dir(self, tmp_path):
+        from gameyfin_frontend.workers import StreamDownloadWorker
+
+        target = tmp_path / "game"
+        target.mkdir()
+        outside = tmp_path / "outside.txt"
+        outside.write_text("keep")
+        (target / "link.txt").symlink_to(outside)
+
+        zip_buffer = io.BytesIO()
+        with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("../escaped.txt", "no")
+            zf.writestr("data/../../escaped.txt", "no")
+            zf.writestr("link.txt", "no")
+            zf.writestr("data/a.txt", "a")
+            zf.writestr("data/b.txt", "b")
+        zip_data = zip_buffer.getvalue()
+        mock_response = MagicMock()
+        mock_response.iter_content.return_value = iter([zip_data])
+        mock_response.headers = {"content-length": str(len(zip_data))}
+
+        worker = StreamDownloadWorker("http://example.com/file.zip", str(target))
+        with patch.object(worker._session, 'get', return_value=mock_response), \
+                patch("gameyfin_frontend.workers.os.path.realpath", wraps=os.path.realpath) as realpath:
+            worker.run()
+
+        assert not (tmp_path / "escaped.txt").exists()
+        assert outside.read_text() == "keep"
+        assert (target / "data" / "b.txt").read_text() == "b"
+        resolved = [call.args[0] for call in realpath.call_args_list]
+        assert resolved.count(str(target / "data")) == 1
+
+
+class TestReadAhead:
+    def test_yields_chunks_in_order(self):
+        from gameyfin_frontend.workers import _read_ahead
+        chunks = [bytes([i]) * 10 for i in range(50)]
+        assert list(_read_ahead(iter(chunks), 4)) == chunks
+
+    def test_reraises_source_error_after_earlier_chunks(self):
+        from gameyfin_frontend.workers import _read_ahead
+
+        def chunks():
+            yield b"a"
+            yield b"b"
+            raise OSError("connection reset")
+
+        received = []
+        with pytest.raises(OSError, match="connection reset"):
+            for chunk in _read_ahead(chunks(), 1):
+                received.append(chunk)
+        assert received == [b"a", b"b"]
+
+    def test_reader_stops_when_consumer_stops(self):
+        import threading
+        from gameyfin_frontend.workers import _read_ahead
+        done = threading.Event()
+
+        def chunks():
+            try:
+                while True:
+                    yield b"x"
+            finally:
+                done.set()
+
+        reader = _read_ahead(chunks(), 2)
+        assert next(reader) == b"x"
+        reader.close()
+        assert done.wait(5)
+
 
 class TestProcessMonitorWorker:
     def test_worker_initializes(self):
@@ -162,3 +258,82 @@ class TestProcessMonitorWorker:
             worker = ProcessMonitorWorker(pid=0)
             worker.run()
         assert "Invalid PID" in caplog.text
+
+
+class TestUmuSearchWorker:
+    def test_emits_entries_with_umu_id(self):
+        from gameyfin_frontend.workers import UmuSearchWorker
+        db = MagicMock()
+        db.search_by_partial_title.return_value = [
+            {"umu_id": "UMU-1", "title": "Game A", "store": "steam"},
+            {"title": "No Id"},
+        ]
+        results = []
+        worker = UmuSearchWorker(db, "game")
+        worker.signals.finished.connect(results.append)
+        worker.run()
+        db.search_by_partial_title.assert_called_once_with("game")
+        assert results == [[{"umu_id": "UMU-1", "title": "Game A", "store": "steam"}]]
+
+    def test_wraps_single_dict_result(self):
+        from gameyfin_frontend.workers import UmuSearchWorker
+        db = MagicMock()
+        db.search_by_partial_title.return_value = {"umu_id": "UMU-1", "title": "Game A"}
+        results = []
+        worker = UmuSearchWorker(db, "game")
+        worker.signals.finished.connect(results.append)
+        worker.run()
+        assert results == [[{"umu_id": "UMU-1", "title": "Game A"}]]
+
+    def test_error_is_emitted(self):
+        from gameyfin_frontend.workers import UmuSearchWorker
+        db = MagicMock()
+        db.search_by_partial_title.side_effect = ValueError("boom")
+        errors = []
+        worker = UmuSearchWorker(db, "game")
+        worker.signals.error.connect(errors.append)
+        worker.run()
+        assert errors == ["boom"]
+
+
+class TestInstallScanWorker:
+    def test_emits_umu_results_and_launchers(self):
+        from gameyfin_frontend.workers import InstallScanWorker
+        results = []
+        worker = InstallScanWorker("/games/x", lambda d: [d + "/game.exe"], lambda d: [{"umu_id": "umu-1"}])
+        worker.signals.finished.connect(results.append)
+        worker.run()
+        assert results == [{"umu_results": [{"umu_id": "umu-1"}], "launcher_paths": ["/games/x/game.exe"]}]
+
+    def test_skips_umu_lookup_without_callable(self):
+        from gameyfin_frontend.workers import InstallScanWorker
+        results = []
+        worker = InstallScanWorker("/games/x", lambda d: [])
+        worker.signals.finished.connect(results.append)
+        worker.run()
+        assert results == [{"umu_results": [], "launcher_paths": []}]
+
+    def test_emits_error_when_scan_raises(self):
+        from gameyfin_frontend.workers import InstallScanWorker
+
+        def fail(target_dir):
+            raise OSError("permission denied")
+
+        results, errors = [], []
+        worker = InstallScanWorker("/games/x", fail)
+        worker.signals.finished.connect(results.append)
+        worker.signals.error.connect(errors.append)
+        worker.run()
+        assert results == []
+        assert errors == ["permission denied"]
+
+
+class TestExistingDirsWorker:
+    def test_emits_existing_dirs(self, tmp_path):
+        from gameyfin_frontend.workers import ExistingDirsWorker
+        (tmp_path / "a").mkdir()
+        results = []
+        worker = ExistingDirsWorker([str(tmp_path / "a"), str(tmp_path / "b")])
+        worker.signals.finished.connect(results.append)
+        worker.run()
+        assert results == [{str(tmp_path / "a")}]